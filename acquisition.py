@@ -0,0 +1,129 @@
+# acquisition.py
+
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait
+from instrumentation import LatencyProfiler
+
+# Résultat d'une interrogation des deux instruments
+# t_supply, t_meter (float): instant milieu de chaque requête (horloge du lecteur)
+Sample = namedtuple('Sample', ('voltage', 'current', 'resistance', 't_supply', 't_meter'))
+
+class SequentialReader:
+    """
+    Interrogation séquentielle de l'alimentation puis du multimètre.
+    La durée d'un point est la somme des latences des deux instruments.
+
+    Chaque lecture est faite sous le verrou de l'instrument (attribut lock
+    des pilotes), partagé avec les écritures de consigne et la sécurisation.
+
+    Attributes:
+        power_supply: Pilote de l'alimentation (measure_all).
+        meter: Pilote du multimètre (mesurer).
+        clock (callable): Horloge utilisée pour l'horodatage des lectures.
+        profiler (LatencyProfiler): Mesure de la durée de chaque requête.
+    """
+
+    def __init__(self, power_supply, meter, clock=time.perf_counter, profiler=None):
+        """
+        Args:
+            power_supply: Pilote de l'alimentation.
+            meter: Pilote du multimètre.
+            clock (callable): Horloge d'horodatage (ex: time.perf_counter).
+            profiler (LatencyProfiler, optional): Profileur des latences (désactivé par défaut).
+        """
+        self.power_supply = power_supply
+        self.meter = meter
+        self.clock = clock
+        self.profiler = profiler if profiler is not None else LatencyProfiler(enabled=False)
+
+    def read_supply(self):
+        """
+        Mesure la tension et le courant de l'alimentation (un seul aller-retour).
+
+        Returns:
+            tuple: (tension, courant, instant de la lecture)
+        """
+        with self.power_supply.lock, self.profiler.measure('alimentation'):
+            start = self.clock()
+            voltage, current = self.power_supply.measure_all()
+            return voltage, current, (start + self.clock()) / 2
+
+    def read_meter(self):
+        """
+        Mesure la résistance.
+
+        Returns:
+            tuple: (résistance, instant de la lecture)
+        """
+        with self.meter.lock, self.profiler.measure('multimetre'):
+            start = self.clock()
+            resistance = self.meter.mesurer()
+            return resistance, (start + self.clock()) / 2
+
+    def read(self):
+        """
+        Interroge les deux instruments.
+
+        Returns:
+            Sample: Valeurs mesurées et instants de lecture.
+        """
+        voltage, current, t_supply = self.read_supply()
+        resistance, t_meter = self.read_meter()
+        return Sample(voltage, current, resistance, t_supply, t_meter)
+
+    def close(self):
+        """
+        Libère les ressources du lecteur.
+        """
+
+class ConcurrentReader(SequentialReader):
+    """
+    Interrogation simultanée de l'alimentation et du multimètre.
+
+    Les deux instruments sont sur des bus indépendants (TCPIP et GPIB) : les
+    requêtes sont lancées en parallèle sur un pool de threads persistant,
+    si bien que la durée d'un point est proche de celle de l'instrument le
+    plus lent.
+    """
+
+    def __init__(self, power_supply, meter, clock=time.perf_counter, profiler=None):
+        super().__init__(power_supply, meter, clock, profiler)
+        self._pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix='lecture')
+
+    def read(self):
+        """
+        Interroge les deux instruments en parallèle.
+
+        Returns:
+            Sample: Valeurs mesurées et instants de lecture.
+        """
+        supply = self._pool.submit(self.read_supply)
+        meter = self._pool.submit(self.read_meter)
+        wait((supply, meter))  # Les deux requêtes sont terminées avant de propager une erreur
+        voltage, current, t_supply = supply.result()
+        resistance, t_meter = meter.result()
+        return Sample(voltage, current, resistance, t_supply, t_meter)
+
+    def close(self):
+        """
+        Arrête le pool de threads.
+        """
+        self._pool.shutdown(wait=True)
+
+def make_reader(power_supply, meter, concurrent, clock=time.perf_counter, profiler=None):
+    """
+    Crée le lecteur correspondant au mode configuré.
+
+    Args:
+        power_supply: Pilote de l'alimentation.
+        meter: Pilote du multimètre.
+        concurrent (bool): True pour interroger les instruments en parallèle.
+        clock (callable): Horloge d'horodatage.
+        profiler (LatencyProfiler, optional): Profileur des latences.
+
+    Returns:
+        SequentialReader: Lecteur séquentiel ou ConcurrentReader.
+    """
+    reader_class = ConcurrentReader if concurrent else SequentialReader
+    return reader_class(power_supply, meter, clock, profiler)
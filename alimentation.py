@@ -1,8 +1,14 @@
 # alimentation.py
 
+import threading
+import time
+from contextlib import contextmanager
+import numpy as np
 import pyvisa
+from pyvisa.util import parse_ieee_block_header
 from pyvisa.errors import VisaIOError
-from tkinter import messagebox
+from decodage import parse_values
+import signalement
 
 class Itech6517D:
     """
@@ -13,9 +19,16 @@ class Itech6517D:
         volt_max (float): Tension maximale.
         curr_max (float): Courant maximal.
         curr_prot_lev (float): Niveau de protection en courant.
+        data_format (str): Format de transfert des mesures ('binaire' ou 'ascii').
+        lock (threading.RLock): Verrou sérialisant l'accès à la ressource entre threads.
+        profiler (LatencyProfiler): Profileur des latences (None si désactivé).
+        LIST_MAX_STEPS (int): Nombre maximal de pas d'une liste (mode LIST).
+        list_mode (bool): Une liste a été chargée (mode LIST) et n'a pas été arrêtée.
     """
 
-    def __init__(self, address, volt_max, curr_max, curr_prot_lev):
+    LIST_MAX_STEPS = 100
+
+    def __init__(self, address, volt_max, curr_max, curr_prot_lev, data_format='ascii'):
         """
         Initialise l'alimentation avec les paramètres spécifiés.
 
@@ -24,51 +37,338 @@ class Itech6517D:
             volt_max (float): Tension maximale.
             curr_max (float): Courant maximal.
             curr_prot_lev (float): Niveau de protection en courant.
+            data_format (str): 'binaire' (IEEE754 simple précision, FORM:DATA REAL,32)
+                ou 'ascii' (texte, mode de repli).
         """
         try:
-            self.power_supply = pyvisa.ResourceManager().open_resource(address)
+            self.power_supply = self.open_resource(address)
+            self.lock = threading.RLock()
+            self.profiler = None
+            self._pending = []  # Commandes en attente d'envoi groupé
+            self._batch_depth = 0  # Niveau d'imbrication des blocs batch()
+            self.list_mode = False
             self.volt_max = volt_max
             self.curr_max = curr_max
             self.curr_prot_lev = curr_prot_lev
+            self.data_format = data_format
             self.initialize()
         except VisaIOError as e:
-            messagebox.showerror("Erreur VISA", f"Erreur lors de l'ouverture de la ressource : {e}")
+            signalement.error("Erreur VISA", f"Erreur lors de l'ouverture de la ressource : {e}")
             raise
 
+    def open_resource(self, address):
+        """
+        Ouvre la ressource VISA de l'instrument.
+
+        Args:
+            address (str): Adresse VISA.
+
+        Returns:
+            pyvisa.Resource: Ressource ouverte.
+        """
+        return pyvisa.ResourceManager().open_resource(address)
+
     def initialize(self):
         """
         Initialise l'alimentation avec les paramètres de sécurité.
         """
         try:
-            self.power_supply.write('*RST')  # Reset de l'instrument
-            self.power_supply.write('*CLS')  # Clear status
-            self.power_supply.write('SYST:REM')  # Mode remote
-            self.power_supply.write('VOLT:MIN 0')  # Tension minimale
-            self.power_supply.write(f'VOLT:MAX {self.volt_max}')  # Tension maximale
-            self.power_supply.write('CURR:MIN 0')  # Courant minimal
-            self.power_supply.write(f'CURR:MAX {self.curr_max}')  # Courant maximal
-            self.power_supply.write('VOLT:PROT:STAT 0')  # Désactivation de la protection en tension
-            self.power_supply.write('CURR:PROT:STAT 1')  # Activation de la protection en courant
-            self.power_supply.write(f'CURR:PROT:LEV {self.curr_prot_lev}')  # Niveau de protection en courant
+            self.power_supply.write('*RST')  # Reset de l'instrument (envoyé seul)
+            self.list_mode = False  # *RST : retour à la consigne fixe
+            with self.batch():  # Configuration envoyée en un seul message
+                self.send('*CLS')  # Clear status
+                self.send('SYST:REM')  # Mode remote
+                self.send('VOLT:MIN 0')  # Tension minimale
+                self.send(f'VOLT:MAX {self.volt_max}')  # Tension maximale
+                self.send('CURR:MIN 0')  # Courant minimal
+                self.send(f'CURR:MAX {self.curr_max}')  # Courant maximal
+                self.send('VOLT:PROT:STAT 0')  # Désactivation de la protection en tension
+                self.send('CURR:PROT:STAT 1')  # Activation de la protection en courant
+                self.send(f'CURR:PROT:LEV {self.curr_prot_lev}')  # Niveau de protection en courant
+                if self.data_format == 'binaire':
+                    self.send('FORM:DATA REAL,32')  # IEEE754 simple précision (poids fort en premier)
+                # En ascii, aucune commande FORM : format texte d'origine, séquence de commandes inchangée
 
             error_query = self.power_supply.query('SYST:ERR?')
             if "No error" not in error_query:
                 raise Exception(f"Erreur lors de l'initialisation de l'alimentation: {error_query}")
         except VisaIOError as e:
-            messagebox.showerror("Erreur VISA", f"Erreur lors de l'initialisation de l'alimentation : {e}")
+            signalement.error("Erreur VISA", f"Erreur lors de l'initialisation de l'alimentation : {e}")
+            raise
+
+    @staticmethod
+    def join_commands(commands):
+        """
+        Regroupe des commandes SCPI en un seul message.
+
+        Les commandes sont séparées par ';'. Un ':' est ajouté avant chaque
+        commande non commune pour repartir de la racine de l'arborescence SCPI
+        (sinon 'VOLT:MIN 0;VOLT:MAX 5' serait interprété comme VOLT:VOLT:MAX).
+
+        Args:
+            commands (list): Commandes SCPI.
+
+        Returns:
+            str: Message unique (ex: '*CLS;:VOLT 5;:OUTP ON').
+        """
+        message = commands[0]
+        for command in commands[1:]:
+            if command.startswith('*') or command.startswith(':'):
+                message += ';' + command
+            else:
+                message += ';:' + command
+        return message
+
+    def send(self, command):
+        """
+        Envoie une commande, ou la met en attente si un bloc batch() est ouvert.
+
+        Args:
+            command (str): Commande SCPI.
+        """
+        with self.lock:
+            if self._batch_depth:
+                self._pending.append(command)
+                return
+            try:
+                self.power_supply.write(command)
+            except VisaIOError as e:
+                signalement.error("Erreur VISA", f"Erreur lors de l'envoi de la commande {command} : {e}")
+                raise
+
+    @contextmanager
+    def batch(self):
+        """
+        Regroupe les commandes envoyées par send() dans le bloc en un seul message,
+        transmis à la sortie du bloc. Le verrou de l'instrument est conservé
+        pendant tout le bloc. Si le bloc lève une exception, les commandes en
+        attente sont abandonnées : une configuration incomplète n'est jamais
+        envoyée à l'instrument.
+
+        Exemple:
+            with power_supply.batch():
+                power_supply.appliquer_tension(0)
+                power_supply.activer_sortie()
+        """
+        with self.lock:
+            self._batch_depth += 1
+            try:
+                yield self
+            except BaseException:
+                self._pending = []  # Bloc interrompu : rien n'est envoyé
+                raise
+            finally:
+                self._batch_depth -= 1
+            if self._batch_depth == 0 and self._pending:
+                commands, self._pending = self._pending, []
+                self.send(self.join_commands(commands))
+
+    def appliquer_tension(self, voltage):
+        """
+        Applique une tension de consigne.
+
+        Args:
+            voltage (float): Tension de consigne (en Volts).
+        """
+        self.send(f'VOLT {voltage}')
+
+    def activer_sortie(self, active=True):
+        """
+        Active ou désactive la sortie.
+
+        Args:
+            active (bool): True pour activer la sortie, False pour la désactiver.
+        """
+        self.send('OUTP ON' if active else 'OUTP OFF')
+
+    def query_values(self, command):
+        """
+        Envoie une requête de mesure et renvoie les valeurs lues.
+
+        En mode binaire, les valeurs sont décodées directement en tableau NumPy
+        (bloc IEEE 488.2) ; en mode ASCII, la réponse est décodée en une passe par
+        parse_values (unités et marqueurs d'état éventuels retirés).
+
+        Args:
+            command (str): Requête SCPI (ex: 'MEAS:VOLT?').
+
+        Returns:
+            numpy.ndarray: Valeurs lues (float64).
+        """
+        try:
+            with self.lock:
+                if self.data_format == 'binaire':
+                    values = self.power_supply.query_binary_values(command, datatype='f', is_big_endian=True,
+                                                                   container=np.array)
+                    return values.astype(np.float64)
+                response = self.power_supply.query(command)
+        except VisaIOError as e:
+            signalement.error("Erreur VISA", f"Erreur lors de la mesure : {e}")
+            raise
+        start = time.perf_counter()
+        values = parse_values(response)
+        if self.profiler is not None:
+            self.profiler.add('conversion', time.perf_counter() - start)
+        return values
+
+    def charger_liste(self, voltages, dwells, repetitions=1):
+        """
+        Charge une séquence de consignes dans la mémoire de liste de l'alimentation
+        (mode LIST), en un seul message. La séquence est ensuite déroulée par le
+        cadencement interne de l'instrument après declencher_liste() : les durées
+        des paliers ne dépendent plus de l'ordinateur ni du réseau.
+
+        Le courant de chaque pas est limité à curr_max. L'alimentation passe en
+        mode LIST, déclenchement par le bus (*TRG) ; la sortie conserve sa
+        consigne courante jusqu'au déclenchement.
+
+        Args:
+            voltages (list): Tensions des pas (en Volts, positives).
+            dwells (list): Durées des pas (secondes).
+            repetitions (int): Nombre de parcours de la liste.
+
+        Raises:
+            ValueError: Liste vide, trop longue ou incohérente.
+        """
+        if len(voltages) != len(dwells):
+            raise ValueError("Les listes de tensions et de durées n'ont pas la même longueur")
+        if not 0 < len(voltages) <= self.LIST_MAX_STEPS:
+            raise ValueError(f"La liste doit compter de 1 à {self.LIST_MAX_STEPS} pas ({len(voltages)} demandés)")
+        if repetitions < 1:
+            raise ValueError("Le nombre de répétitions de la liste doit être au moins 1")
+        if min(dwells) <= 0:
+            raise ValueError("Les durées des pas de la liste doivent être positives")
+        try:
+            self.list_mode = True  # Mode LIST possible dès l'envoi, même si la vérification échoue
+            with self.batch():  # Liste complète envoyée en un seul message
+                self.send(f'LIST:STEP {len(voltages)}')
+                for step, (voltage, dwell) in enumerate(zip(voltages, dwells), start=1):
+                    self.send(f'LIST:VOLT {step},{voltage}')
+                    self.send(f'LIST:CURR {step},{self.curr_max}')
+                    self.send(f'LIST:WIDT {step},{dwell:.6f}')
+                self.send(f'LIST:COUN {repetitions}')
+                self.send('TRIG:SOUR BUS')
+                self.send('FUNC:MODE LIST')
+
+            error_query = self.power_supply.query('SYST:ERR?')
+            if "No error" not in error_query:
+                raise Exception(f"Erreur lors du chargement de la liste: {error_query}")
+        except VisaIOError as e:
+            signalement.error("Erreur VISA", f"Erreur lors du chargement de la liste : {e}")
+            raise
+
+    def declencher_liste(self):
+        """
+        Déclenche le déroulement de la liste chargée par charger_liste().
+        """
+        self.send('*TRG')
+
+    def arreter_liste(self):
+        """
+        Interrompt la liste en cours et revient au mode de consigne fixe.
+        """
+        self.send('FUNC:MODE FIX')
+        self.list_mode = False
+
+    def mesurer_tension(self):
+        """
+        Mesure la tension de sortie.
+
+        Returns:
+            float: Tension mesurée (en Volts).
+        """
+        return float(self.query_values('MEAS:VOLT?')[0])
+
+    def mesurer_courant(self):
+        """
+        Mesure le courant de sortie.
+
+        Returns:
+            float: Courant mesuré (en Ampères).
+        """
+        return float(self.query_values('MEAS:CURR?')[0])
+
+    @staticmethod
+    def decode_blocks(raw):
+        """
+        Décode une réponse composée de plusieurs blocs binaires IEEE 488.2
+        séparés par ';' (réponse à une requête composée en mode binaire).
+
+        Args:
+            raw (bytes): Réponse brute de l'instrument.
+
+        Returns:
+            numpy.ndarray: Valeurs de tous les blocs, dans l'ordre (float64).
+        """
+        values = []
+        position = 0
+        while True:
+            offset, length = parse_ieee_block_header(raw[position:])
+            if length < 0:
+                raise ValueError("Bloc binaire de longueur indéfinie dans une réponse composée")
+            start = position + offset
+            values.append(np.frombuffer(raw[start:start + length], dtype='>f4'))
+            position = start + length
+            if raw[position:position + 1] != b';':
+                return np.concatenate(values).astype(np.float64)
+            position += 1
+
+    def measure_all(self):
+        """
+        Mesure la tension et le courant en un seul aller-retour
+        (requête composée MEAS:VOLT?;:MEAS:CURR?).
+
+        Returns:
+            tuple: (tension en Volts, courant en Ampères)
+        """
+        command = self.join_commands(['MEAS:VOLT?', 'MEAS:CURR?'])
+        try:
+            with self.lock:
+                if self.data_format == 'binaire':
+                    self.power_supply.write(command)
+                    values = self.decode_blocks(self.power_supply.read_raw())
+                    return float(values[0]), float(values[1])
+                response = self.power_supply.query(command)
+        except VisaIOError as e:
+            signalement.error("Erreur VISA", f"Erreur lors de la mesure : {e}")
+            raise
+        start = time.perf_counter()
+        values = parse_values(response)
+        if self.profiler is not None:
+            self.profiler.add('conversion', time.perf_counter() - start)
+        return float(values[0]), float(values[1])
+
+    def identification(self):
+        """
+        Returns:
+            str: Réponse à *IDN? (fabricant, modèle, numéro de série, micrologiciel).
+        """
+        try:
+            with self.lock:
+                return self.power_supply.query('*IDN?').strip()
+        except VisaIOError as e:
+            signalement.error("Erreur VISA", f"Erreur lors de l'identification de l'alimentation : {e}")
             raise
 
     def securiser(self):
         """
         Remet l'alimentation en état sécurisé.
+
+        Le message de sécurité ne contient que des commandes de base ; l'arrêt
+        d'une liste (FUNC:MODE FIX) est envoyé à part, après la coupure de la
+        sortie, et seulement si une liste a été chargée : une commande refusée
+        ne peut pas faire perdre la mise à zéro.
         """
         try:
-            self.power_supply.write('OUTP OFF')  # Désactiver la sortie
-            self.power_supply.write('VOLT 0')    # Tension à 0V
-            self.power_supply.write('*CLS')      # Effacer les erreurs
-            self.power_supply.write('SYST:LOC')  # Mode local
+            with self.batch():
+                self.send('OUTP OFF')  # Désactiver la sortie
+                self.send('VOLT 0')    # Tension à 0V
+                self.send('*CLS')      # Effacer les erreurs
+                self.send('SYST:LOC')  # Mode local
+            if self.list_mode:
+                self.arreter_liste()  # Arrêt de la liste en cours (message séparé)
         except VisaIOError as e:
-            messagebox.showerror("Erreur VISA", f"Erreur lors de la sécurisation de l'alimentation : {e}")
+            signalement.error("Erreur VISA", f"Erreur lors de la sécurisation de l'alimentation : {e}")
             raise
 
     def close(self):
@@ -78,5 +378,19 @@ class Itech6517D:
         try:
             self.power_supply.close()
         except VisaIOError as e:
-            messagebox.showerror("Erreur VISA", f"Erreur lors de la fermeture de la ressource : {e}")
+            signalement.error("Erreur VISA", f"Erreur lors de la fermeture de la ressource : {e}")
             raise
+
+class Itech6517DSimule(Itech6517D):
+    """
+    Alimentation ITECH 6517D simulée (classe = Itech6517DSimule dans config.ini).
+
+    Même pilote que Itech6517D, mais les commandes SCPI sont traitées par une
+    ressource simulée (module simulation) qui alimente le DUT du banc simulé,
+    avec la latence, le bruit et les erreurs de la section [Simulation].
+    L'adresse n'est pas utilisée.
+    """
+
+    def open_resource(self, address):
+        from simulation import SimulatedSupply  # Banc simulé chargé seulement pour les instruments simulés
+        return SimulatedSupply(address)
@@ -1,8 +1,12 @@
 # appareil_mesure.py
 
+import time
+import threading
+import numpy as np
 import pyvisa
 from pyvisa.errors import VisaIOError
-from tkinter import messagebox
+from decodage import parse_values
+import signalement
 
 class Keithley2000:
     """
@@ -10,22 +14,190 @@ class Keithley2000:
 
     Attributes:
         meter (pyvisa.Resource): Ressource VISA pour le multimètre.
+        data_format (str): Format de transfert des mesures ('binaire' ou 'ascii').
+        BUFFER_SIZE (int): Capacité du buffer interne de mesures (TRAC).
+        PROFILES (dict): Profils de vitesse (réglages nplc, gamme, autozero, filtre, affichage).
+        profile (str): Nom du profil de vitesse appliqué.
+        settings (dict): Réglages appliqués (profil et surcharges de config.ini).
+        lock (threading.RLock): Verrou sérialisant l'accès à la ressource entre threads.
+        profiler (LatencyProfiler): Profileur des latences (None si désactivé).
     """
 
-    def __init__(self, gpib_address):
+    BUFFER_SIZE = 1024
+    BUFFER_FULL = 512  # Bit BFL (buffer plein) du registre STAT:MEAS:EVEN
+    LINE_FREQUENCY = 50  # Fréquence du secteur (Hz) : durée d'un cycle NPLC
+    AUTORANGE_TIME = 0.003  # Surcoût du changement automatique de gamme par lecture (s)
+    DISPLAY_TIME = 0.001  # Surcoût de la mise à jour de l'afficheur par lecture (s)
+
+    # nplc : durée d'intégration en cycles secteur (0.01 à 10)
+    # gamme : 'auto' (changement de gamme à chaque mesure), 'fixe' (gamme choisie
+    #         une fois à l'initialisation puis conservée) ou valeur en Ω
+    # autozero : mesure de référence du zéro à chaque lecture (double la durée)
+    # filtre : nombre de lectures moyennées par mesure (0 = filtre désactivé)
+    # affichage : mise à jour de l'afficheur de la face avant
+    PROFILES = {
+        'rapide': {'nplc': 0.1, 'gamme': 'fixe', 'autozero': False, 'filtre': 0, 'affichage': False},
+        'normal': {'nplc': 1.0, 'gamme': 'auto', 'autozero': True, 'filtre': 0, 'affichage': True},
+        'precis': {'nplc': 10.0, 'gamme': 'auto', 'autozero': True, 'filtre': 3, 'affichage': True},
+    }
+
+    def __init__(self, gpib_address, data_format='ascii', profile='normal', settings=None):
         """
         Initialise le multimètre avec l'adresse GPIB spécifiée.
 
         Args:
             gpib_address (str): Adresse GPIB du multimètre.
+            data_format (str): 'binaire' (IEEE754 simple précision, FORM:DATA SRE)
+                ou 'ascii' (texte, mode de repli).
+            profile (str): Profil de vitesse ('rapide', 'normal' ou 'precis').
+            settings (dict, optional): Réglages remplaçant ceux du profil
+                (clés de PROFILES, valeurs texte de config.ini acceptées).
         """
         try:
-            self.meter = pyvisa.ResourceManager().open_resource(gpib_address)
+            self.meter = self.open_resource(gpib_address)
+            self.lock = threading.RLock()
+            self.profiler = None
+            self.data_format = data_format
+            self.profile = profile
+            self.settings = self.resolve_settings(profile, settings)
             self.initialize()
         except VisaIOError as e:
-            messagebox.showerror("Erreur VISA", f"Erreur lors de l'ouverture de la ressource : {e}")
+            signalement.error("Erreur VISA", f"Erreur lors de l'ouverture de la ressource : {e}")
             raise
 
+    def open_resource(self, address):
+        """
+        Ouvre la ressource VISA de l'instrument.
+
+        Args:
+            address (str): Adresse VISA.
+
+        Returns:
+            pyvisa.Resource: Ressource ouverte.
+        """
+        return pyvisa.ResourceManager().open_resource(address)
+
+    @classmethod
+    def resolve_settings(cls, profile, settings=None):
+        """
+        Construit les réglages d'un profil, avec les surcharges éventuelles.
+
+        Args:
+            profile (str): Nom du profil (clé de PROFILES).
+            settings (dict, optional): Réglages remplaçant ceux du profil.
+
+        Returns:
+            dict: Réglages complets (nplc, gamme, autozero, filtre, affichage).
+
+        Raises:
+            ValueError: Profil inconnu ou réglage invalide.
+        """
+        if profile not in cls.PROFILES:
+            raise ValueError(f"Profil de multimètre inconnu : {profile} (profils : {', '.join(cls.PROFILES)})")
+        resolved = dict(cls.PROFILES[profile])
+        for name, value in (settings or {}).items():
+            if name not in resolved:
+                raise ValueError(f"Réglage de multimètre inconnu : {name}")
+            if isinstance(value, str):
+                value = value.strip().lower()
+                if name == 'nplc':
+                    value = float(value)
+                elif name == 'gamme':
+                    value = value if value in ('auto', 'fixe') else float(value)
+                elif name == 'filtre':
+                    value = int(value)
+                else:
+                    value = value in ('1', 'true', 'yes', 'on', 'oui')
+            resolved[name] = value
+        if not 0.01 <= resolved['nplc'] <= 10:
+            raise ValueError(f"NPLC hors limites (0.01 à 10) : {resolved['nplc']}")
+        if not 0 <= resolved['filtre'] <= 100:
+            raise ValueError(f"Nombre de lectures du filtre hors limites (0 à 100) : {resolved['filtre']}")
+        return resolved
+
+    def configurer_profil(self):
+        """
+        Applique les réglages de vitesse (settings) : intégration, gamme,
+        autozéro, filtre numérique et afficheur.
+        """
+        settings = self.settings
+        self.meter.write(f"RES:NPLC {settings['nplc']}")  # Durée d'intégration
+        if settings['gamme'] == 'auto':
+            self.meter.write('RES:RANG:AUTO ON')  # Auto-range pour la résistance
+        elif settings['gamme'] == 'fixe':
+            self.meter.write('RES:RANG:AUTO ONCE')  # Gamme choisie une fois puis conservée
+        else:
+            self.meter.write('RES:RANG:AUTO OFF')
+            self.meter.write(f"RES:RANG {settings['gamme']}")  # Gamme imposée
+        self.meter.write(f"SYST:AZER:STAT {'ON' if settings['autozero'] else 'OFF'}")  # Autozéro
+        if settings['filtre']:
+            self.meter.write('RES:AVER:TCON REP')  # Moyenne de lectures successives (pas glissante)
+            self.meter.write(f"RES:AVER:COUN {settings['filtre']}")
+            self.meter.write('RES:AVER:STAT ON')
+        else:
+            self.meter.write('RES:AVER:STAT OFF')  # Filtre numérique désactivé
+        self.meter.write(f"DISP:ENAB {'ON' if settings['affichage'] else 'OFF'}")  # Afficheur
+
+    def periode_minimale(self):
+        """
+        Estime l'intervalle minimal entre deux lectures cadencées par le timer
+        (intégration, autozéro, filtre, changement automatique de gamme et
+        afficheur) : avec un intervalle plus court, l'instrument prend du
+        retard sur le timer et les lectures ne tombent plus aux instants prévus.
+
+        Returns:
+            float: Intervalle minimal (secondes).
+        """
+        settings = self.settings
+        duration = settings['nplc'] / self.LINE_FREQUENCY * (2 if settings['autozero'] else 1)
+        duration *= max(settings['filtre'], 1)
+        if settings['gamme'] == 'auto':
+            duration += self.AUTORANGE_TIME
+        if settings['affichage']:
+            duration += self.DISPLAY_TIME
+        return duration
+
+    def duree_lecture(self, count=10):
+        """
+        Mesure la durée moyenne d'une lecture (READ?) avec les réglages courants.
+
+        Args:
+            count (int): Nombre de lectures chronométrées.
+
+        Returns:
+            float: Durée moyenne d'une lecture (secondes, transfert compris).
+        """
+        with self.lock:
+            self.mesurer()  # Première lecture (changement de gamme éventuel) non comptée
+            start = time.perf_counter()
+            for _ in range(count):
+                self.mesurer()
+            return (time.perf_counter() - start) / count
+
+    def cout_profils(self, count=10):
+        """
+        Chronomètre une lecture avec chacun des profils de vitesse, puis
+        rétablit les réglages courants.
+
+        Args:
+            count (int): Nombre de lectures chronométrées par profil.
+
+        Returns:
+            dict: Durée moyenne d'une lecture (secondes) par nom de profil.
+        """
+        current = self.settings
+        costs = {}
+        try:
+            with self.lock:
+                for name, settings in self.PROFILES.items():
+                    self.settings = dict(settings)
+                    self.configurer_profil()
+                    costs[name] = self.duree_lecture(count)
+        finally:
+            self.settings = current
+            self.configurer_profil()
+        return costs
+
     def initialize(self):
         """
         Initialise le multimètre avec les paramètres de mesure.
@@ -33,24 +205,162 @@ class Keithley2000:
         try:
             self.meter.write('*RST')  # Reset de l'instrument
             self.meter.write('CONF:RES')  # Configuration pour mesurer la résistance
-            self.meter.write('RES:RANG:AUTO ON')  # Auto-range pour la résistance
+            self.configurer_profil()  # Profil de vitesse
             self.meter.write('TRIG:SOUR IMM')  # Source de déclenchement immédiate
             self.meter.write('TRIG:COUNT 1')  # Un seul déclenchement par mesure
+            self.meter.write('FORM:ELEM READ')  # Valeurs seules (sans horodatage ni statut)
+            if self.data_format == 'binaire':
+                self.meter.write('FORM:DATA SRE')  # IEEE754 simple précision
+                self.meter.write('FORM:BORD SWAP')  # Octets de poids faible en premier
+            else:
+                self.meter.write('FORM:DATA ASC')  # Texte
         except VisaIOError as e:
-            messagebox.showerror("Erreur VISA", f"Erreur lors de l'initialisation du multimètre : {e}")
+            signalement.error("Erreur VISA", f"Erreur lors de l'initialisation du multimètre : {e}")
             raise
 
+    def query_values(self, command):
+        """
+        Envoie une requête de mesure et renvoie les valeurs lues.
+
+        En mode binaire, les valeurs sont décodées directement en tableau NumPy
+        (bloc IEEE 488.2) ; en mode ASCII, la réponse est décodée en une passe par
+        parse_values (unités et marqueurs d'état éventuels retirés).
+
+        Args:
+            command (str): Requête SCPI (ex: 'READ?', 'TRAC:DATA?').
+
+        Returns:
+            numpy.ndarray: Valeurs lues (float64).
+        """
+        try:
+            if self.data_format == 'binaire':
+                values = self.meter.query_binary_values(command, datatype='f', is_big_endian=False,
+                                                        container=np.array)
+                return values.astype(np.float64)
+            response = self.meter.query(command)
+        except VisaIOError as e:
+            signalement.error("Erreur VISA", f"Erreur lors de la mesure : {e}")
+            raise
+        start = time.perf_counter()
+        values = parse_values(response)
+        if self.profiler is not None:
+            self.profiler.add('conversion', time.perf_counter() - start)
+        return values
+
     def mesurer(self):
         """
         Effectue une mesure de résistance.
 
         Returns:
-            str: Valeur de résistance mesurée.
+            float: Valeur de résistance mesurée.
         """
+        return float(self.query_values('READ?')[0])
+
+    def configurer_rafale(self, count, interval):
+        """
+        Prépare une acquisition en rafale cadencée par le timer interne.
+
+        Les mesures sont stockées dans le buffer interne (TRAC) à la cadence
+        de l'instrument, sans aller-retour GPIB par point.
+
+        Args:
+            count (int): Nombre de mesures (2 à BUFFER_SIZE).
+            interval (float): Intervalle entre deux mesures (en secondes, >= 0.001).
+        """
+        count = int(count)
+        if not 2 <= count <= self.BUFFER_SIZE:
+            raise ValueError(f"Nombre de mesures en rafale hors limites (2 à {self.BUFFER_SIZE}) : {count}")
         try:
-            return self.meter.query('READ?')
+            self.meter.write('ABOR')  # Arrêt d'un éventuel déclenchement en cours
+            self.meter.write('INIT:CONT OFF')  # Pas de réarmement automatique
+            self.meter.write('FORM:ELEM READ')  # Valeurs seules (sans horodatage ni statut)
+            self.meter.write('TRAC:FEED:CONT NEV')  # Buffer désactivé pendant la configuration
+            self.meter.write(f'TRAC:POIN {count}')  # Taille du buffer
+            self.meter.write('TRAC:FEED SENS')  # Stockage des mesures brutes
+            self.meter.write('TRIG:SOUR TIM')  # Déclenchement par le timer interne
+            self.meter.write(f'TRIG:TIM {max(interval, 0.001)}')  # Intervalle entre mesures
+            self.meter.write(f'TRIG:COUN {count}')  # Une mesure par déclenchement
+            self.meter.write('SAMP:COUN 1')
         except VisaIOError as e:
-            messagebox.showerror("Erreur VISA", f"Erreur lors de la mesure : {e}")
+            signalement.error("Erreur VISA", f"Erreur lors de la configuration de la rafale : {e}")
+            raise
+
+    def armer_rafale(self):
+        """
+        Vide le buffer et lance la rafale configurée par configurer_rafale().
+        L'appel est immédiat : les mesures sont effectuées par l'instrument.
+        """
+        try:
+            self.meter.write('*CLS')  # Effacement des registres d'événements
+            self.meter.write('TRAC:CLE')  # Vidage du buffer
+            self.meter.write('TRAC:FEED:CONT NEXT')  # Remplissage jusqu'à saturation
+            self.meter.write('INIT')  # Armement du déclenchement
+        except VisaIOError as e:
+            signalement.error("Erreur VISA", f"Erreur lors de l'armement de la rafale : {e}")
+            raise
+
+    def rafale_terminee(self):
+        """
+        Indique si le buffer est plein (rafale terminée).
+        La lecture du registre d'événements l'efface.
+
+        Returns:
+            bool: True si toutes les mesures de la rafale sont disponibles.
+        """
+        try:
+            event = int(float(self.meter.query('STAT:MEAS:EVEN?')))
+        except VisaIOError as e:
+            signalement.error("Erreur VISA", f"Erreur lors de la lecture de l'état de la rafale : {e}")
+            raise
+        return bool(event & self.BUFFER_FULL)
+
+    def lire_rafale(self, timeout=None, interrupt_event=None, poll=0.01):
+        """
+        Attend la fin de la rafale puis lit tout le buffer en un seul transfert.
+
+        Args:
+            timeout (float, optional): Attente maximale (en secondes).
+            interrupt_event (threading.Event, optional): Abandonne l'attente s'il est levé.
+            poll (float): Intervalle d'interrogation de l'état (en secondes).
+
+        Returns:
+            numpy.ndarray: Mesures de résistance, ou None en cas d'interruption.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not self.rafale_terminee():
+            if interrupt_event is not None and interrupt_event.is_set():
+                self.meter.write('ABOR')
+                return None
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError("Rafale du multimètre non terminée dans le délai imparti")
+            time.sleep(poll)
+        return self.query_values('TRAC:DATA?')
+
+    def arreter_rafale(self):
+        """
+        Quitte le mode rafale et revient à une mesure unique par READ?.
+        """
+        try:
+            self.meter.write('ABOR')
+            self.meter.write('TRAC:FEED:CONT NEV')  # Buffer désactivé
+            self.meter.write('TRAC:CLE')
+            self.meter.write('TRIG:SOUR IMM')  # Source de déclenchement immédiate
+            self.meter.write('TRIG:COUN 1')  # Un seul déclenchement par mesure
+            self.meter.write('SAMP:COUN 1')
+        except VisaIOError as e:
+            signalement.error("Erreur VISA", f"Erreur lors de l'arrêt de la rafale : {e}")
+            raise
+
+    def identification(self):
+        """
+        Returns:
+            str: Réponse à *IDN? (fabricant, modèle, numéro de série, micrologiciel).
+        """
+        try:
+            with self.lock:
+                return self.meter.query('*IDN?').strip()
+        except VisaIOError as e:
+            signalement.error("Erreur VISA", f"Erreur lors de l'identification du multimètre : {e}")
             raise
 
     def securiser(self):
@@ -61,9 +371,9 @@ class Keithley2000:
             self.meter.write('SYST:LOC')  # Mode local
             error_check = self.meter.query('SYST:ERR?')
             if "No error" not in error_check:
-                messagebox.showwarning("Avertissement", f"Erreur après sécurisation du Keithley: {error_check}")
+                signalement.warning("Avertissement", f"Erreur après sécurisation du Keithley: {error_check}")
         except VisaIOError as e:
-            messagebox.showerror("Erreur VISA", f"Erreur lors de la sécurisation du multimètre : {e}")
+            signalement.error("Erreur VISA", f"Erreur lors de la sécurisation du multimètre : {e}")
             raise
 
     def close(self):
@@ -73,5 +383,19 @@ class Keithley2000:
         try:
             self.meter.close()
         except VisaIOError as e:
-            messagebox.showerror("Erreur VISA", f"Erreur lors de la fermeture de la ressource : {e}")
+            signalement.error("Erreur VISA", f"Erreur lors de la fermeture de la ressource : {e}")
             raise
+
+class Keithley2000Simule(Keithley2000):
+    """
+    Multimètre Keithley 2000 simulé (classe = Keithley2000Simule dans config.ini).
+
+    Même pilote que Keithley2000, mais les commandes SCPI sont traitées par une
+    ressource simulée (module simulation) qui mesure le DUT du banc simulé,
+    avec la latence, le bruit et les erreurs de la section [Simulation].
+    L'adresse n'est pas utilisée.
+    """
+
+    def open_resource(self, address):
+        from simulation import SimulatedMeter  # Banc simulé chargé seulement pour les instruments simulés
+        return SimulatedMeter(address)
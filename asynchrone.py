@@ -0,0 +1,149 @@
+# asynchrone.py
+
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class AsyncInstrument:
+    """
+    Variante asynchrone d'un pilote bloquant (Itech6517D, Keithley2000).
+
+    Les appels pyvisa bloquants sont exécutés dans un exécuteur propre à la
+    ressource (un seul thread : les requêtes d'un même instrument restent
+    ordonnées), sous le verrou du pilote partagé avec la sécurisation. Les
+    coroutines de deux instruments différents se recouvrent donc naturellement.
+
+    Une coroutine annulée (ou dont le délai expire) rend la main immédiatement ;
+    la requête VISA déjà partie se termine dans le thread de la ressource, qui
+    n'accepte la requête suivante qu'ensuite.
+
+    Attributes:
+        driver: Pilote bloquant.
+        lock (asyncio.Lock): Verrou de la ressource, pour enchaîner plusieurs
+            appels sans qu'une autre coroutine ne s'intercale.
+        timeout (float): Délai maximal d'un appel (secondes, None = sans limite).
+        clock (callable): Horloge d'horodatage des lectures.
+    """
+
+    def __init__(self, driver, timeout=None, clock=time.perf_counter):
+        """
+        Doit être créée dans la boucle asyncio qui l'utilise.
+
+        Args:
+            driver: Pilote bloquant (attribut lock).
+            timeout (float, optional): Délai maximal par défaut d'un appel (secondes).
+            clock (callable): Horloge d'horodatage.
+        """
+        self.driver = driver
+        self.timeout = timeout
+        self.clock = clock
+        self.lock = asyncio.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=type(driver).__name__)
+
+    async def call_timed(self, method, *args, timeout=None, **kwargs):
+        """
+        Appelle une méthode du pilote dans l'exécuteur de la ressource.
+
+        Args:
+            method (str): Nom de la méthode du pilote.
+            *args, **kwargs: Arguments de la méthode.
+            timeout (float, optional): Délai maximal (défaut: self.timeout).
+
+        Returns:
+            tuple: (résultat, instant milieu de l'appel selon clock)
+
+        Raises:
+            asyncio.TimeoutError: Délai dépassé.
+        """
+        function = getattr(self.driver, method)
+        clock = self.clock
+
+        def timed():
+            with self.driver.lock:
+                start = clock()
+                result = function(*args, **kwargs)
+                return result, (start + clock()) / 2
+
+        loop = asyncio.get_running_loop()
+        async with self.lock:
+            return await asyncio.wait_for(loop.run_in_executor(self._executor, timed),
+                                          self.timeout if timeout is None else timeout)
+
+    async def call(self, method, *args, timeout=None, **kwargs):
+        """
+        Comme call_timed(), sans l'horodatage.
+
+        Returns:
+            Résultat de la méthode du pilote.
+        """
+        result, _ = await self.call_timed(method, *args, timeout=timeout, **kwargs)
+        return result
+
+    def close(self):
+        """
+        Attend la fin de la requête en cours et arrête l'exécuteur
+        (le pilote bloquant n'est pas fermé).
+        """
+        self._executor.shutdown(wait=True)
+
+class AsyncItech6517D(AsyncInstrument):
+    """
+    Alimentation ITECH 6517D en asyncio (voir AsyncInstrument).
+    """
+
+    async def appliquer_tension(self, voltage):
+        await self.call('appliquer_tension', voltage)
+
+    async def activer_sortie(self, active=True):
+        await self.call('activer_sortie', active)
+
+    async def measure_all(self):
+        """
+        Returns:
+            tuple: (tension en Volts, courant en Ampères, instant de la lecture)
+        """
+        (voltage, current), t = await self.call_timed('measure_all')
+        return voltage, current, t
+
+    async def declencher_liste(self):
+        await self.call('declencher_liste')
+
+    async def securiser(self):
+        await self.call('securiser')
+
+class AsyncKeithley2000(AsyncInstrument):
+    """
+    Multimètre Keithley 2000 en asyncio (voir AsyncInstrument).
+    """
+
+    async def mesurer(self):
+        """
+        Returns:
+            tuple: (résistance, instant de la lecture)
+        """
+        return await self.call_timed('mesurer')
+
+    async def configurer_rafale(self, count, interval):
+        await self.call('configurer_rafale', count, interval)
+
+    async def armer_rafale(self):
+        await self.call('armer_rafale')
+
+    async def lire_rafale(self, poll=0.01):
+        """
+        Attend la fin de la rafale sans bloquer la boucle, puis lit le buffer
+        en un seul transfert. En cas d'annulation, la rafale est abandonnée.
+
+        Args:
+            poll (float): Intervalle d'interrogation de l'état (secondes).
+
+        Returns:
+            numpy.ndarray: Mesures de résistance.
+        """
+        try:
+            while not await self.call('rafale_terminee'):
+                await asyncio.sleep(poll)
+            return await self.call('query_values', 'TRAC:DATA?')
+        except asyncio.CancelledError:
+            self._executor.submit(self.driver.arreter_rafale)  # Après la requête en cours
+            raise
@@ -0,0 +1,289 @@
+# benchmark.py
+
+import argparse
+import configparser
+import json
+import platform
+import sys
+import threading
+import time
+import numpy as np
+from moteur import SquareWaveEngine, RampEngine, open_instruments
+
+try:
+    import resource  # Unix uniquement
+except ImportError:
+    resource = None
+
+# Configurations mesurées : (nom, protocole, clés de config.ini modifiées)
+CONFIGURATIONS = [
+    ('carre-point-sequentiel-ascii', 'carre', {'General': {'lecture_parallele': 'False'}, 'Alimentation': {'format': 'ascii'},
+                                               'Meter': {'format': 'ascii'}, 'Mesure_carre': {'acquisition': 'point'}}),
+    ('carre-point-sequentiel-binaire', 'carre', {'General': {'lecture_parallele': 'False'}, 'Alimentation': {'format': 'binaire'},
+                                                 'Meter': {'format': 'binaire'}, 'Mesure_carre': {'acquisition': 'point'}}),
+    ('carre-point-parallele-ascii', 'carre', {'General': {'lecture_parallele': 'True'}, 'Alimentation': {'format': 'ascii'},
+                                              'Meter': {'format': 'ascii'}, 'Mesure_carre': {'acquisition': 'point'}}),
+    ('carre-point-parallele-binaire', 'carre', {'General': {'lecture_parallele': 'True'}, 'Alimentation': {'format': 'binaire'},
+                                                'Meter': {'format': 'binaire'}, 'Mesure_carre': {'acquisition': 'point'}}),
+    ('carre-point-parallele-binaire-rapide', 'carre', {'General': {'lecture_parallele': 'True'},
+                                                       'Alimentation': {'format': 'binaire'},
+                                                       'Meter': {'format': 'binaire', 'profil': 'rapide'},
+                                                       'Mesure_carre': {'acquisition': 'point'}}),
+    ('carre-asynchrone-binaire', 'carre', {'General': {'lecture_parallele': 'True'}, 'Alimentation': {'format': 'binaire'},
+                                           'Meter': {'format': 'binaire'}, 'Mesure_carre': {'acquisition': 'asynchrone'}}),
+    ('carre-rafale-binaire', 'carre', {'General': {'lecture_parallele': 'True'}, 'Alimentation': {'format': 'binaire'},
+                                       'Meter': {'format': 'binaire'}, 'Mesure_carre': {'acquisition': 'rafale'}}),
+    ('carre-point-liste-binaire', 'carre', {'General': {'lecture_parallele': 'True'}, 'Alimentation': {'format': 'binaire'},
+                                            'Meter': {'format': 'binaire'},
+                                            'Mesure_carre': {'acquisition': 'point', 'cadencement': 'liste'}}),
+    ('rampe-sequentiel', 'rampe', {'General': {'lecture_parallele': 'False'}}),
+    ('rampe-parallele', 'rampe', {'General': {'lecture_parallele': 'True'}}),
+    ('rampe-liste', 'rampe', {'General': {'lecture_parallele': 'True'}, 'Mesure': {'cadencement': 'liste'}}),
+]
+
+class BenchChannel:
+    """
+    Canal de messages du banc d'essai : compte les mesures transmises,
+    conserve les erreurs et accepte d'office les demandes à l'utilisateur.
+    """
+
+    def __init__(self):
+        self.samples = 0
+        self.errors = []
+        self.max_depth = 0
+        self.dropped = 0
+
+    def reset_stats(self):
+        pass
+
+    def post_sample(self, *values):
+        self.samples += 1
+
+    def post(self, kind, *payload):
+        if kind in ('erreur', 'avertissement'):
+            self.errors.append(" ".join(str(value) for value in payload))
+
+    def request(self, kind, *payload, interrupt_event=None):
+        return True
+
+def max_rss_kb():
+    """
+    Returns:
+        int: Mémoire résidente maximale du processus (ko), ou None si indisponible.
+    """
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss // 1024 if sys.platform == 'darwin' else rss
+
+def percentiles_ms(values):
+    """
+    Returns:
+        dict: Médiane, p99 et maximum en millisecondes (None si aucune valeur).
+    """
+    if len(values) == 0:
+        return None
+    p50, p99 = np.percentile(values, [50, 99]) * 1000
+    return {'p50': round(p50, 4), 'p99': round(p99, 4), 'max': round(float(np.max(values)) * 1000, 4)}
+
+class GuiLoad:
+    """
+    Reproduit le rafraîchissement de l'interface pendant une mesure :
+    toutes les period secondes, le graphique (LivePlot sur un canevas Agg
+    hors écran) est mis à jour avec les données courantes et la durée de
+    chaque mise à jour est enregistrée.
+    """
+
+    def __init__(self, engine, period=0.05):
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from graphique import LivePlot
+        figure = Figure(figsize=(15, 8), dpi=100)
+        axis = figure.add_subplot()
+        canvas = FigureCanvasAgg(figure)
+        if isinstance(engine, SquareWaveEngine):
+            self.live_plot = LivePlot(canvas, [(axis, {}), (axis.twinx(), {})])
+            self.columns = ('temps', 'resistance', 'tension')
+        else:
+            self.live_plot = LivePlot(canvas, [(axis, {})])
+            self.columns = ('tension', 'resistance')
+        canvas.draw()
+        self.engine = engine
+        self.period = period
+        self.durations = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='interface', daemon=True)
+
+    def _run(self):
+        data = self.engine.data
+        while not self._stop.wait(self.period):
+            start = time.perf_counter()
+            self.live_plot.update(*(data[column] for column in self.columns), force=True)
+            self.durations.append(time.perf_counter() - start)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+
+def run_configuration(base_config, name, protocol, overrides, duration, measure_delay, gui):
+    """
+    Exécute une mesure simulée et en mesure les performances.
+
+    Args:
+        base_config (configparser.ConfigParser): Configuration de départ.
+        name (str): Nom de la configuration.
+        protocol (str): 'carre' ou 'rampe'.
+        overrides (dict): Clés modifiées par section.
+        duration (float): Durée visée de la mesure (secondes).
+        measure_delay (float): Délai demandé entre deux mesures (signal carré).
+        gui (bool): Simule en parallèle le rafraîchissement du graphique.
+
+    Returns:
+        dict: Résultats de la configuration.
+    """
+    config = configparser.ConfigParser()
+    config.read_dict(base_config)
+    config.read_dict(overrides)
+    config.read_dict({'Alimentation': {'classe': 'Itech6517DSimule'}, 'Meter': {'classe': 'Keithley2000Simule'},
+                      'General': {'dossier_flux': '', 'profilage': 'False'}})
+
+    channel = BenchChannel()
+    engine_class = SquareWaveEngine if protocol == 'carre' else RampEngine
+    engine = engine_class.from_config(config, channel)
+    if protocol == 'carre':
+        plateau = 1.0
+        parameters = (0.0, 10.0, plateau, plateau, max(1, round(duration / (2 * plateau))), measure_delay)
+        options = dict(acquisition=config.get('Mesure_carre', 'acquisition', fallback='point'),
+                       cadencement=config.get('Mesure_carre', 'cadencement', fallback='hote'))
+    else:
+        steps = max(2, int(duration / 0.02))
+        parameters = (0.0, 10.0, round(10.0 / steps, 6), 0.0, 0.0, False)
+        options = dict(cadencement=config.get('Mesure', 'cadencement', fallback='hote'))
+
+    load = GuiLoad(engine) if gui else None
+    rss_before = max_rss_kb()
+    try:
+        if load is not None:
+            load.start()
+        engine.initialize()
+        start = time.perf_counter()
+        completed = engine.run(*parameters, **options)
+        wall_time = time.perf_counter() - start
+    finally:
+        if load is not None:
+            load.stop()
+        engine.close()
+    rss_after = max_rss_kb()
+
+    data = engine.data
+    result = {
+        'configuration': name,
+        'protocole': protocol,
+        'parametres': overrides,
+        'terminee': completed,
+        'erreurs': channel.errors,
+        'echantillons': len(data),
+        'duree_s': round(wall_time, 4),
+        'memoire_donnees_octets': int(data.table().nbytes),
+        'rss_max_croissance_ko': None if rss_before is None else rss_after - rss_before,
+        'interface_ms': percentiles_ms(load.durations) if load is not None else None,
+    }
+    if protocol == 'carre':
+        times = np.asarray(data['temps'])
+        span = times[-1] - times[0] if len(times) > 1 else 0.0
+        intervals = np.diff(times)
+        scheduler = engine.scheduler
+        result.update({
+            'cadence_demandee': round(1.0 / measure_delay, 3),
+            'echantillons_par_s': round((len(times) - 1) / span, 3) if span > 0 else None,
+            'gigue_ms': percentiles_ms(np.abs(intervals - np.median(intervals))) if len(intervals) else None,
+            'echeances_en_retard': scheduler.late if scheduler is not None else None,
+            'mesures_manquees': scheduler.missed if scheduler is not None else None,
+            'retard_max_ms': round(scheduler.max_lateness * 1000, 4) if scheduler is not None else None,
+        })
+    else:
+        result.update({
+            'echantillons_par_s': round(len(data) / wall_time, 3) if wall_time > 0 else None,
+        })
+    return result
+
+def profile_costs(base_config, count=5):
+    """
+    Chronomètre une lecture du multimètre simulé pour chaque profil de vitesse.
+
+    Args:
+        base_config (configparser.ConfigParser): Configuration de départ.
+        count (int): Nombre de lectures chronométrées par profil.
+
+    Returns:
+        dict: Par profil, durée d'une lecture (ms), lectures/s et réglages.
+    """
+    config = configparser.ConfigParser()
+    config.read_dict(base_config)
+    config.read_dict({'Alimentation': {'classe': 'Itech6517DSimule'}, 'Meter': {'classe': 'Keithley2000Simule'}})
+    power_supply, meter = open_instruments(config)
+    try:
+        costs = meter.cout_profils(count)
+    finally:
+        meter.close()
+        power_supply.close()
+    return {name: {'lecture_ms': round(duration * 1000, 4), 'lectures_par_s': round(1 / duration, 3),
+                   'reglages': meter.PROFILES[name]}
+            for name, duration in costs.items()}
+
+def main(argv=None):
+    """
+    Mesure les performances de l'acquisition avec les instruments simulés
+    (latences de la section [Simulation] de config.ini) et écrit les
+    résultats dans un fichier JSON.
+
+    Returns:
+        int: 0 si toutes les configurations se sont terminées sans erreur, 1 sinon.
+    """
+    parser = argparse.ArgumentParser(description="Banc d'essai de l'acquisition (instruments simulés).")
+    parser.add_argument('--config', default='config.ini', help="Configuration de départ (défaut: config.ini)")
+    parser.add_argument('-o', '--sortie', default='benchmark.json', help="Fichier de résultats JSON")
+    parser.add_argument('--duree', type=float, default=5.0, help="Durée de chaque mesure (s)")
+    parser.add_argument('--measure-delay', type=float, default=0.01, help="Délai demandé entre deux mesures (s)")
+    parser.add_argument('--sans-interface', action='store_true', help="Ne simule pas le rafraîchissement du graphique")
+    parser.add_argument('configurations', nargs='*', help="Configurations à mesurer (toutes par défaut)")
+    args = parser.parse_args(argv)
+
+    base_config = configparser.ConfigParser()
+    base_config.read(args.config)
+    selected = [c for c in CONFIGURATIONS if not args.configurations or c[0] in args.configurations]
+
+    results = []
+    for name, protocol, overrides in selected:
+        print(f"{name}...", flush=True)
+        result = run_configuration(base_config, name, protocol, overrides, args.duree,
+                                   args.measure_delay, not args.sans_interface)
+        results.append(result)
+        gui = result['interface_ms']
+        print(f"  {result['echantillons']} points, {result['echantillons_par_s']} points/s"
+              + (f", {result['mesures_manquees']} manquées" if 'mesures_manquees' in result else "")
+              + (f", interface p99 {gui['p99']} ms" if gui else ""))
+
+    report = {
+        'date': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'plateforme': platform.platform(),
+        'simulation': dict(base_config['Simulation']) if base_config.has_section('Simulation') else {},
+        'duree_s': args.duree,
+        'measure_delay': args.measure_delay,
+        'resultats': results,
+    }
+    report['profils_multimetre'] = profile_costs(base_config)
+    for name, cost in report['profils_multimetre'].items():
+        print(f"Profil {name}: {cost['lecture_ms']} ms par lecture, {cost['lectures_par_s']} lectures/s")
+
+    with open(args.sortie, 'w', encoding='utf-8') as file:
+        json.dump(report, file, indent=2, ensure_ascii=False)
+    print(f"Résultats enregistrés dans {args.sortie}")
+    return 0 if all(result['terminee'] and not result['erreurs'] for result in results) else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,247 @@
+# canal.py
+
+import queue
+import sys
+import threading
+import time
+from collections import namedtuple
+
+# Message échangé entre le thread d'acquisition et la boucle Tk
+# kind (str): type du message ('mesure', 'erreur', 'fin', ...)
+# payload (tuple): arguments associés
+# reply (list ou None): [threading.Event, valeur] si une réponse est attendue
+Message = namedtuple('Message', ('kind', 'payload', 'reply'))
+
+def format_plateau(cycle, plateau, setpoint, start, count, mean, std, minimum, maximum, settling, settled_mean):
+    """
+    Résume les statistiques d'un palier du signal carré (message 'palier').
+
+    Args: colonnes du tableau des cycles (voir SquareWaveEngine.cycle_columns).
+
+    Returns:
+        str: Résumé sur une ligne.
+    """
+    return (f"Cycle {cycle:.0f} palier {plateau:.0f} ({setpoint:g} V) : {count:.0f} points, "
+            f"R = {mean:.6g} ± {std:.2g} Ω [{minimum:.6g} ; {maximum:.6g}], "
+            f"stabilisé après {settling:.3g} s (moyenne stabilisée {settled_mean:.6g} Ω)")
+
+class GuiChannel:
+    """
+    File entre le thread d'acquisition (producteur) et la boucle principale
+    Tk (consommateur).
+
+    Le thread d'acquisition ne touche jamais aux widgets : il dépose des
+    messages que la boucle Tk vide par lots via root.after. Les mesures
+    destinées aux labels sont bornées à maxsize en attente et ignorées
+    au-delà (seule la dernière valeur est affichée et les données restent
+    dans le SampleStore). Les messages de contrôle ne sont pas bornés : ils ne
+    sont jamais perdus et ne bloquent jamais le thread d'acquisition, même si
+    la boucle Tk ne vide plus la file (boîte de dialogue modale, fenêtre
+    détruite), qui atteint donc toujours la sécurisation de l'alimentation.
+
+    Attributes:
+        max_depth (int): Profondeur maximale atteinte par la file.
+        dropped (int): Nombre de mesures ignorées car la file était pleine.
+    """
+
+    def __init__(self, maxsize=1024):
+        """
+        Args:
+            maxsize (int): Nombre maximal de mesures en attente.
+        """
+        self._queue = queue.Queue()  # Non bornée : les mesures sont limitées par _samples
+        self.maxsize = maxsize
+        self._samples = 0  # Mesures en attente
+        self._lock = threading.Lock()
+        self.max_depth = 0
+        self.dropped = 0
+
+    def _track(self):
+        depth = self._queue.qsize()
+        if depth > self.max_depth:
+            self.max_depth = depth
+
+    def depth(self):
+        """
+        Returns:
+            int: Nombre de messages actuellement en attente.
+        """
+        return self._queue.qsize()
+
+    def reset_stats(self):
+        """
+        Remet à zéro les statistiques de profondeur et de pertes.
+        """
+        self.max_depth = 0
+        self.dropped = 0
+
+    def post_sample(self, *values):
+        """
+        Dépose une mesure destinée à l'affichage, sans jamais bloquer
+        (ignorée si maxsize mesures sont déjà en attente).
+
+        Args:
+            *values: Valeurs transmises au gestionnaire 'mesure'.
+        """
+        with self._lock:
+            if self._samples >= self.maxsize:
+                self.dropped += 1
+                return
+            self._samples += 1
+        self._queue.put(Message('mesure', values, None))
+        self._track()
+
+    def post(self, kind, *payload):
+        """
+        Dépose un message de contrôle (jamais perdu, ne bloque pas).
+
+        Args:
+            kind (str): Type du message.
+            *payload: Arguments associés.
+        """
+        self._queue.put(Message(kind, payload, None))
+        self._track()
+
+    def request(self, kind, *payload, interrupt_event=None):
+        """
+        Dépose un message et attend la réponse de la boucle Tk
+        (ex: boîte de dialogue nécessitant une action de l'utilisateur).
+
+        Args:
+            kind (str): Type du message.
+            *payload: Arguments associés.
+            interrupt_event (threading.Event, optional): Abandonne l'attente s'il est levé.
+
+        Returns:
+            La valeur transmise par answer(), ou None en cas d'interruption.
+        """
+        reply = [threading.Event(), None]
+        self._queue.put(Message(kind, payload, reply))
+        self._track()
+        while not reply[0].wait(0.1):
+            if interrupt_event is not None and interrupt_event.is_set():
+                return None
+        return reply[1]
+
+    @staticmethod
+    def answer(message, value=True):
+        """
+        Répond à un message déposé par request().
+
+        Args:
+            message (Message): Message reçu par drain().
+            value: Valeur renvoyée au thread demandeur.
+        """
+        if message.reply is not None:
+            message.reply[1] = value
+            message.reply[0].set()
+
+    def drain(self):
+        """
+        Retire tous les messages en attente (appelé depuis la boucle Tk).
+
+        Returns:
+            list: Messages dans leur ordre d'arrivée.
+        """
+        messages = []
+        while True:
+            try:
+                messages.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        samples = sum(message.kind == 'mesure' for message in messages)
+        if samples:
+            with self._lock:
+                self._samples -= samples
+        return messages
+
+class ConsoleChannel:
+    """
+    Équivalent de GuiChannel pour le mode sans interface (même interface côté
+    producteur) : les messages sont affichés sur la console au lieu d'être
+    transmis à la boucle Tk.
+
+    Attributes:
+        confirm (bool): Attend la touche Entrée pour les demandes à l'utilisateur
+            (ex: inversion des connexions) ; sinon elles sont acceptées d'office.
+        period (float): Intervalle minimal entre deux affichages de mesure (secondes).
+        prefix (str): Préfixe des lignes affichées (ex: nom du poste de mesure).
+        max_depth (int): Toujours 0 (pas de file).
+        dropped (int): Nombre de mesures non affichées (limitation de fréquence).
+    """
+
+    def __init__(self, confirm=True, period=1.0, prefix=''):
+        """
+        Args:
+            confirm (bool): Attend une confirmation pour les demandes à l'utilisateur.
+            period (float): Intervalle minimal entre deux affichages de mesure.
+            prefix (str): Préfixe des lignes affichées.
+        """
+        self.confirm = confirm
+        self.period = period
+        self.prefix = f"[{prefix}] " if prefix else ''
+        self.max_depth = 0
+        self.dropped = 0
+        self._last_print = 0.0
+
+    def reset_stats(self):
+        """
+        Remet à zéro le compteur de mesures non affichées.
+        """
+        self.dropped = 0
+
+    def post_sample(self, *values):
+        """
+        Affiche une mesure, au plus une fois par période.
+
+        Args:
+            *values: Valeurs mesurées.
+        """
+        now = time.monotonic()
+        if now - self._last_print < self.period:
+            self.dropped += 1
+            return
+        self._last_print = now
+        print(self.prefix + " ".join(f"{value:.6g}" for value in values))
+
+    def post(self, kind, *payload):
+        """
+        Affiche un message de contrôle (erreurs et avertissements sur la sortie d'erreur).
+
+        Args:
+            kind (str): Type du message.
+            *payload: Arguments associés.
+        """
+        if kind in ('erreur', 'avertissement'):
+            title, message = payload
+            print(f"{self.prefix}[{kind}] {title}: {message}", file=sys.stderr)
+        elif kind == 'fin':
+            finished, completed = payload
+            state = "terminée" if completed else "interrompue" if not finished else "arrêtée sur erreur"
+            print(f"{self.prefix}Mesure {state}")
+        elif kind == 'palier':
+            print(self.prefix + format_plateau(*payload))
+        else:
+            print(f"{self.prefix}[{kind}]", *payload)
+
+    def request(self, kind, *payload, interrupt_event=None):
+        """
+        Affiche une demande et attend la touche Entrée (si confirm).
+
+        Args:
+            kind (str): Type du message.
+            *payload: Arguments associés (titre, message).
+            interrupt_event (threading.Event, optional): Abandonne si levé pendant l'attente.
+
+        Returns:
+            True, ou None en cas d'interruption (ou si aucune console ne peut répondre).
+        """
+        print(f"{self.prefix}[{kind}]", *payload)
+        if self.confirm:
+            try:
+                input(f"{self.prefix}Appuyez sur Entrée pour continuer...")
+            except EOFError:
+                return None  # Pas d'entrée standard (ex: poste exécuté dans un processus)
+        if interrupt_event is not None and interrupt_event.is_set():
+            return None
+        return True
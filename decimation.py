@@ -0,0 +1,102 @@
+# decimation.py
+
+import numpy as np
+
+class MinMaxDecimator:
+    """
+    Réduction incrémentale d'une série pour l'affichage (min/max par intervalle).
+
+    Les échantillons sont regroupés en intervalles consécutifs de step
+    échantillons ; de chaque intervalle complet ne sont conservés que les
+    indices du minimum et du maximum, si bien qu'aucun pic n'est perdu.
+    Lorsque le nombre d'intervalles dépasse bins, step double et les
+    intervalles sont fusionnés deux à deux : le coût d'une mise à jour ne
+    dépend que du nombre de nouveaux échantillons et de bins, pas de la
+    longueur de la mesure.
+
+    Le regroupement se fait sur l'indice des échantillons (les abscisses
+    peuvent donc être non monotones, ex: tension d'un cycle d'hystérésis).
+
+    Attributes:
+        bins (int): Nombre maximal d'intervalles conservés (de l'ordre de la largeur du graphique en pixels).
+        step (int): Nombre d'échantillons par intervalle.
+    """
+
+    def __init__(self, bins=2000):
+        """
+        Args:
+            bins (int): Nombre maximal d'intervalles conservés.
+        """
+        self.bins = max(2, int(bins))
+        self.reset()
+
+    def reset(self):
+        """
+        Oublie les échantillons déjà réduits.
+        """
+        self.step = 1
+        self._lo = np.empty(0, dtype=np.int64)  # Indice du minimum de chaque intervalle
+        self._hi = np.empty(0, dtype=np.int64)  # Indice du maximum de chaque intervalle
+        self._done = 0  # Nombre d'échantillons couverts par des intervalles complets
+
+    def _merge(self, y):
+        """
+        Double la taille des intervalles en fusionnant ceux-ci deux à deux.
+        Un intervalle impair restant est rendu à la fin non réduite.
+        """
+        pairs = len(self._lo) // 2
+        if len(self._lo) % 2:
+            self._done -= self.step
+        lo_a, lo_b = self._lo[0:2 * pairs:2], self._lo[1:2 * pairs:2]
+        hi_a, hi_b = self._hi[0:2 * pairs:2], self._hi[1:2 * pairs:2]
+        self._lo = np.where(y[lo_b] < y[lo_a], lo_b, lo_a)
+        self._hi = np.where(y[hi_b] > y[hi_a], hi_b, hi_a)
+        self.step *= 2
+
+    def update(self, y):
+        """
+        Réduit les échantillons arrivés depuis le dernier appel.
+
+        Args:
+            y (numpy.ndarray): Série complète (les échantillons déjà réduits ne sont pas relus).
+
+        Returns:
+            numpy.ndarray: Indices à tracer, dans l'ordre croissant.
+        """
+        n = len(y)
+        if n < self._done:  # Données réinitialisées entre-temps
+            self.reset()
+        if len(self._lo) == 0:
+            while n // self.step > self.bins:  # Série déjà longue : taille d'intervalle choisie d'emblée
+                self.step *= 2
+        count = (n - self._done) // self.step
+        if count:
+            block = np.asarray(y[self._done:self._done + count * self.step]).reshape(count, self.step)
+            starts = self._done + self.step * np.arange(count)
+            self._lo = np.concatenate((self._lo, starts + block.argmin(axis=1)))
+            self._hi = np.concatenate((self._hi, starts + block.argmax(axis=1)))
+            self._done += count * self.step
+        while len(self._lo) > self.bins:
+            self._merge(y)
+        return self.indices(y)
+
+    def indices(self, y):
+        """
+        Args:
+            y (numpy.ndarray): Série complète.
+
+        Returns:
+            numpy.ndarray: Minimum et maximum de chaque intervalle complet
+            (dans l'ordre chronologique), suivis du minimum, du maximum et du
+            dernier point de l'intervalle en cours.
+        """
+        n = len(y)
+        if self.step == 1:
+            return np.arange(n)
+        pairs = np.column_stack((np.minimum(self._lo, self._hi), np.maximum(self._lo, self._hi)))
+        tail = np.asarray(y[self._done:n])
+        if len(tail) > 3:
+            tail = np.unique(self._done + np.array((tail.argmin(), tail.argmax(), len(tail) - 1)))
+        else:
+            tail = np.arange(self._done, n)
+        return np.concatenate((pairs.ravel(), tail))
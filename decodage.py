@@ -0,0 +1,78 @@
+# decodage.py
+
+import re
+import numpy as np
+
+# Unité ou marqueur d'état collé à la fin d'un élément (ex: '+1.0E+03OHM',
+# '+12.345SECS', '+00012RDNG#') : lettres suivant un chiffre et terminées par
+# un séparateur. L'exposant d'un nombre ('E+03') n'est jamais suivi d'un séparateur.
+SUFFIX = re.compile(r'(?<=[\d.])[A-Za-z#%]+(?=[,;]|$)')
+
+def first_line(response):
+    """
+    Args:
+        response (str): Réponse brute de l'instrument.
+
+    Returns:
+        str: Première ligne de la réponse, sans espaces ni terminaison.
+    """
+    end = response.find('\n')
+    return (response if end < 0 else response[:end]).strip()
+
+def parse_value(response):
+    """
+    Décode une réponse à une seule valeur (chemin rapide de parse_values).
+
+    Args:
+        response (str): Réponse brute (ex: '+1.00012E+03', '+1.00012E+03OHM').
+
+    Returns:
+        float: Valeur lue.
+
+    Raises:
+        ValueError: Réponse illisible.
+    """
+    line = first_line(response)
+    try:
+        return float(line)
+    except ValueError:
+        return float(SUFFIX.sub('', line))
+
+def parse_values(response, elements=1):
+    """
+    Décode en une passe une réponse ASCII à plusieurs valeurs (lecture
+    composée, contenu d'un buffer).
+
+    Les éléments sont séparés par des virgules (ou des points-virgules pour
+    les requêtes composées) ; les unités et marqueurs d'état collés aux
+    valeurs sont retirés par une seule substitution sur toute la réponse,
+    puis la conversion en float64 est faite par NumPy. Le séparateur décimal
+    des instruments est toujours le point (decimal_separator ne concerne que
+    les fichiers de données).
+
+    Args:
+        response (str): Réponse brute (seule la première ligne est lue).
+        elements (int): Nombre d'éléments par lecture (ex: 3 pour
+            FORM:ELEM READ,TIME,RNUM) ; 1 pour une simple suite de valeurs.
+
+    Returns:
+        numpy.ndarray: Valeurs (float64), de forme (n,) si elements vaut 1,
+        (n, elements) sinon (une ligne par lecture).
+
+    Raises:
+        ValueError: Réponse illisible ou nombre de valeurs incompatible avec elements.
+    """
+    line = first_line(response)
+    if ',' not in line and ';' not in line:
+        values = np.array([parse_value(line)])
+    else:
+        line = line.replace(';', ',')
+        try:
+            values = np.array(line.split(','), dtype=np.float64)
+        except ValueError:
+            values = np.array(SUFFIX.sub('', line).split(','), dtype=np.float64)
+    if elements == 1:
+        return values
+    if values.size % elements:
+        raise ValueError(f"{values.size} valeurs reçues, multiple de {elements} attendu")
+    return values.reshape(-1, elements)
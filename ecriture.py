@@ -0,0 +1,369 @@
+# ecriture.py
+
+import json
+import os
+import threading
+import time
+import zipfile
+from contextlib import contextmanager
+import numpy as np
+
+try:
+    import h5py  # Facultatif : exportation HDF5
+except ImportError:
+    h5py = None
+
+# Extensions des fichiers de données enregistrés en binaire (colonnes float64)
+BINARY_FORMATS = ('.npz', '.h5', '.hdf5')
+
+# Types proposés par les boîtes de dialogue d'enregistrement
+FILE_TYPES = [('Text files', '*.txt'), ('CSV files', '*.csv'), ('NumPy files', '*.npz'), ('HDF5 files', '*.h5')]
+
+CHUNK_ROWS = 20000  # Lignes formatées par bloc lors d'une exportation
+CHUNK_BYTES = 1 << 22  # Octets copiés par bloc lors d'une exportation
+
+def format_rows(block, column_separator=';', decimales=4, decimal_separator='.', integers=()):
+    """
+    Formate un bloc de mesures en texte, une ligne par échantillon.
+
+    Le format d'une ligne est construit une fois, puis appliqué au bloc entier
+    en une seule opération % (même résultat que np.savetxt, qui formate ligne
+    par ligne, environ deux fois plus vite).
+
+    Args:
+        block (numpy.ndarray): Tableau 2D (n, colonnes).
+        column_separator (str): Séparateur de colonnes.
+        decimales (int): Nombre de chiffres après la virgule.
+        decimal_separator (str): Séparateur décimal ('.' ou ',').
+        integers (tuple): Indices des colonnes entières (écrites sans décimales).
+
+    Returns:
+        str: Lignes formatées (terminées par un saut de ligne).
+    """
+    if len(block) == 0:
+        return ''
+    formats = ['%d' if index in integers else f'%.{decimales}f' for index in range(block.shape[1])]
+    row = column_separator.replace('%', '%%').join(formats) + '\n'
+    text = (row * len(block)) % tuple(block.ravel().tolist())
+    if decimal_separator != '.':
+        text = text.replace('.', decimal_separator)
+    return text
+
+class ExportCancelled(Exception):
+    """
+    Exportation annulée par ExportJob.cancel().
+    """
+
+class ExportJob:
+    """
+    Exportation (ou relecture d'une mesure enregistrée) exécutée dans un
+    thread d'arrière-plan, avec avancement et annulation (l'interface reste
+    disponible pendant l'écriture).
+
+    La fonction d'exportation reçoit le travail et appelle advance() après
+    chaque bloc : l'avancement est mis à jour, l'annulation est prise en
+    compte (ExportCancelled) et une pause éventuelle cède le processeur au
+    thread d'acquisition. Les fichiers sont écrits sous un nom temporaire et
+    renommés à la fin : une exportation annulée ne laisse aucun fichier partiel.
+
+    Attributes:
+        total (float): Quantité de travail (nombre d'échantillons).
+        done (float): Quantité déjà traitée.
+        chunk_rows (int): Lignes formatées par bloc.
+        pause (float): Pause après chaque bloc (secondes, 0 = aucune).
+        cancelled (bool): L'exportation a été annulée.
+        error (Exception): Erreur de l'exportation (None si aucune).
+    """
+
+    def __init__(self, function, total, chunk_rows=CHUNK_ROWS, pause=0.0):
+        """
+        Args:
+            function (callable): Exportation, appelée avec le travail en argument.
+            total (float): Quantité de travail.
+            chunk_rows (int): Lignes formatées par bloc.
+            pause (float): Pause après chaque bloc (secondes).
+        """
+        self.function = function
+        self.total = total
+        self.done = 0
+        self.chunk_rows = chunk_rows
+        self.pause = pause
+        self.cancelled = False
+        self.error = None
+        self._cancel = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """
+        Lance l'exportation.
+
+        Returns:
+            ExportJob: Le travail lui-même.
+        """
+        self._thread = threading.Thread(target=self._run, name='exportation')
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.function(self)
+        except ExportCancelled:
+            self.cancelled = True
+        except Exception as e:
+            self.error = e
+
+    def advance(self, amount):
+        """
+        Signale un bloc traité (appelée par la fonction d'exportation).
+
+        Args:
+            amount (float): Quantité de travail du bloc.
+
+        Raises:
+            ExportCancelled: L'annulation a été demandée.
+        """
+        self.done += amount
+        if self._cancel.is_set():
+            raise ExportCancelled()
+        if self.pause:
+            time.sleep(self.pause)
+
+    def cancel(self):
+        """
+        Demande l'annulation (prise en compte à la fin du bloc en cours).
+        """
+        self._cancel.set()
+
+    @property
+    def fraction(self):
+        """
+        float: Avancement entre 0 et 1.
+        """
+        return min(1.0, self.done / self.total) if self.total else 0.0
+
+    def is_alive(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+@contextmanager
+def _partial(path):
+    """
+    Écriture sous un nom temporaire (path.part), renommé en path si le bloc
+    se termine sans erreur et supprimé sinon (annulation comprise).
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    partial = path + '.part'
+    try:
+        yield partial
+    except BaseException:
+        if os.path.exists(partial):
+            os.remove(partial)
+        raise
+    os.replace(partial, path)
+
+def write_table(path, block, header, column_separator=';', decimales=4, decimal_separator='.', job=None,
+                integers=()):
+    """
+    Écrit un tableau de mesures en texte, par blocs de lignes.
+
+    Args:
+        path (str): Fichier de destination.
+        block (numpy.ndarray): Tableau 2D (n, colonnes).
+        header (str): Ligne d'en-tête.
+        column_separator (str): Séparateur de colonnes.
+        decimales (int): Nombre de chiffres après la virgule.
+        decimal_separator (str): Séparateur décimal.
+        job (ExportJob, optional): Travail d'arrière-plan (avancement en lignes, annulation).
+        integers (tuple): Indices des colonnes entières.
+    """
+    chunk_rows = job.chunk_rows if job is not None else CHUNK_ROWS
+    with _partial(path) as partial, open(partial, 'w', encoding='utf-8') as file:
+        file.write(header + '\n')
+        for start in range(0, len(block), chunk_rows):
+            chunk = block[start:start + chunk_rows]
+            file.write(format_rows(chunk, column_separator, decimales, decimal_separator, integers))
+            if job is not None:
+                job.advance(len(chunk))
+
+def copy_file(source, path, rows=0, job=None):
+    """
+    Copie un fichier par blocs d'octets.
+
+    Args:
+        source (str): Fichier copié.
+        path (str): Fichier de destination.
+        rows (int): Nombre d'échantillons du fichier (avancement de job).
+        job (ExportJob, optional): Travail d'arrière-plan.
+    """
+    size = os.path.getsize(source)
+    with _partial(path) as partial, open(source, 'rb') as origin, open(partial, 'wb') as file:
+        while True:
+            chunk = origin.read(CHUNK_BYTES)
+            if not chunk:
+                break
+            file.write(chunk)
+            if job is not None:
+                job.advance(rows * len(chunk) / size)
+
+def is_binary(path):
+    """
+    Args:
+        path (str): Fichier de données (ou extension seule, ex: '.npz').
+
+    Returns:
+        bool: True si l'extension désigne une exportation binaire (BINARY_FORMATS).
+    """
+    return os.path.splitext(path)[1].lower() in BINARY_FORMATS or path.lower() in BINARY_FORMATS
+
+def save_binary(path, tables, metadata, job=None):
+    """
+    Enregistre des tableaux d'échantillons en binaire, colonne par colonne,
+    en pleine précision (float64), avec les métadonnées de la mesure.
+
+    Format selon l'extension :
+    - .npz : archive NumPy compressée ; colonne 'table/champ', métadonnées
+      (JSON) dans 'metadonnees' ;
+    - .h5/.hdf5 : un groupe par tableau, un jeu de données par colonne
+      (découpé en blocs et compressé gzip), métadonnées en attributs (JSON
+      pour les valeurs composées). Nécessite h5py.
+
+    Args:
+        path (str): Fichier de destination (dossiers créés si nécessaire).
+        tables (dict): Par nom de tableau (ex: 'donnees', 'brut') :
+            (tableau structuré des échantillons, en-têtes des colonnes).
+        metadata (dict): Métadonnées sérialisables en JSON.
+        job (ExportJob, optional): Travail d'arrière-plan (avancement par
+            colonne, en échantillons).
+
+    Raises:
+        ValueError: Extension non binaire.
+        ImportError: h5py absent pour une exportation HDF5.
+    """
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in BINARY_FORMATS:
+        raise ValueError(f"Format binaire inconnu : {extension} ({', '.join(BINARY_FORMATS)})")
+    if extension != '.npz' and h5py is None:
+        raise ImportError("Le module h5py est nécessaire pour l'exportation HDF5 (pip install h5py)")
+    metadata = dict(metadata, colonnes={name: dict(zip(records.dtype.names, columns))
+                                        for name, (records, columns) in tables.items()})
+
+    def advance(records):
+        if job is not None:
+            job.advance(len(records) / len(records.dtype.names))
+
+    with _partial(path) as partial:
+        if extension == '.npz':
+            # Archive compressée écrite colonne par colonne (même structure que np.savez_compressed)
+            with zipfile.ZipFile(partial, 'w', zipfile.ZIP_DEFLATED) as archive:
+                with archive.open('metadonnees.npy', 'w') as member:
+                    np.lib.format.write_array(member, np.array(json.dumps(metadata, ensure_ascii=False)))
+                for name, (records, _) in tables.items():
+                    for field in records.dtype.names:
+                        with archive.open(f'{name}/{field}.npy', 'w', force_zip64=True) as member:
+                            np.lib.format.write_array(member, np.ascontiguousarray(records[field]))
+                        advance(records)
+            return
+
+        with h5py.File(partial, 'w') as file:
+            for key, value in metadata.items():
+                file.attrs[key] = value if isinstance(value, (str, int, float)) else json.dumps(value, ensure_ascii=False)
+            for name, (records, columns) in tables.items():
+                group = file.create_group(name)
+                for field, column in zip(records.dtype.names, columns):
+                    dataset = group.create_dataset(field, data=records[field], chunks=True, maxshape=(None,),
+                                                   compression='gzip', shuffle=True)
+                    dataset.attrs['colonne'] = column
+                    advance(records)
+
+class StreamWriter:
+    """
+    Écriture continue des mesures sur disque pendant l'acquisition.
+
+    Un thread d'arrière-plan ajoute périodiquement au fichier les échantillons
+    nouvellement arrivés dans le SampleStore, puis force l'écriture sur disque
+    (flush + fsync). En cas d'arrêt brutal, seules les dernières secondes sont
+    perdues.
+
+    Attributes:
+        store (SampleStore): Source des échantillons.
+        path (str): Chemin du fichier de flux.
+        written (int): Nombre d'échantillons déjà écrits.
+        interval (float): Période d'écriture (secondes).
+    """
+
+    def __init__(self, store, path, header, column_separator=';', decimales=4, decimal_separator='.', interval=1.0,
+                 integers=()):
+        """
+        Args:
+            store (SampleStore): Source des échantillons.
+            path (str): Chemin du fichier de flux (dossiers créés si nécessaire).
+            header (str): Ligne d'en-tête.
+            column_separator (str): Séparateur de colonnes.
+            decimales (int): Nombre de chiffres après la virgule.
+            decimal_separator (str): Séparateur décimal.
+            interval (float): Période d'écriture (secondes).
+            integers (tuple): Indices des colonnes entières.
+        """
+        self.store = store
+        self.path = path
+        self.header = header
+        self.column_separator = column_separator
+        self.decimales = decimales
+        self.decimal_separator = decimal_separator
+        self.interval = interval
+        self.integers = integers
+        self.written = 0
+        self._file = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """
+        Crée le fichier, écrit l'en-tête et lance le thread d'écriture.
+        """
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._file.write(self.header + '\n')
+        self._thread = threading.Thread(target=self._run, name='ecriture', daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.flush()
+
+    def flush(self):
+        """
+        Écrit les échantillons en attente et force l'écriture sur disque.
+        Peut être appelée depuis n'importe quel thread.
+        """
+        with self._lock:
+            if self._file is None:
+                return
+            size = len(self.store)
+            if size > self.written:
+                block = self.store.table()[self.written:size]
+                self._file.write(format_rows(block, self.column_separator, self.decimales, self.decimal_separator,
+                                             self.integers))
+                self.written = size
+            self._file.flush()
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        """
+        Arrête le thread, écrit les derniers échantillons et ferme le fichier.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
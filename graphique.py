@@ -0,0 +1,215 @@
+# graphique.py
+
+import time
+import numpy as np
+from decimation import MinMaxDecimator
+
+class LivePlot:
+    """
+    Tracé en temps réel à coût de rafraîchissement constant.
+
+    Les objets Line2D sont créés une seule fois puis mis à jour avec
+    set_data. Les axes ne sont recalculés que lorsque les données sortent
+    des limites courantes, le rafraîchissement utilise le blitting quand le
+    canevas le permet et la fréquence d'affichage est plafonnée.
+
+    Chaque courbe passe par un MinMaxDecimator : au-delà de quelques milliers
+    de points, seuls le minimum et le maximum de chaque intervalle sont
+    tracés (aucun pic n'est perdu), pour l'affichage comme pour savefig.
+
+    Attributes:
+        canvas (FigureCanvasBase): Canevas Matplotlib (ex: FigureCanvasTkAgg).
+        figure (matplotlib.figure.Figure): Figure associée au canevas.
+        lines (list): Objets Line2D, un par série.
+        max_fps (float): Nombre maximal de rafraîchissements par seconde.
+        margin (float): Marge relative ajoutée lors d'un agrandissement des axes.
+        decimators (list): Réduction min/max de chaque courbe.
+    """
+
+    def __init__(self, canvas, series, max_fps=20.0, margin=0.1, bins=None):
+        """
+        Crée les courbes persistantes.
+
+        Args:
+            canvas (FigureCanvasBase): Canevas contenant les axes.
+            series (list): Liste de couples (axe, options de tracé), une par courbe.
+                Les options sont transmises à Axes.plot (color, label, ...).
+            max_fps (float): Fréquence maximale de rafraîchissement.
+            margin (float): Marge relative lors d'un agrandissement des axes.
+            bins (int, optional): Nombre d'intervalles min/max par courbe
+                (par défaut, la largeur de la figure en pixels).
+        """
+        self.canvas = canvas
+        self.figure = canvas.figure
+        self.max_fps = max_fps
+        self.margin = margin
+        self.lines = []
+        self.axes = []
+        for axis, options in series:
+            line, = axis.plot([], [], animated=True, **options)
+            self.lines.append(line)
+            if axis not in self.axes:
+                self.axes.append(axis)
+        if bins is None:
+            bins = int(self.figure.bbox.width)
+        self.decimators = [MinMaxDecimator(bins) for _ in self.lines]
+        self._background = None
+        self._last_draw = 0.0
+        self._x = None
+        self._ys = ()
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        self._reset_extents()
+
+    def _reset_extents(self):
+        """
+        Oublie les bornes des données déjà tracées.
+        """
+        self._seen = 0  # Nombre d'échantillons déjà pris en compte
+        self._x_extent = None
+        self._y_extents = {axis: None for axis in self.axes}
+        self._limits_set = False
+
+    @staticmethod
+    def _merge(extent, values):
+        """
+        Étend des bornes (min, max) avec de nouvelles valeurs (NaN ignorés).
+        """
+        values = values[np.isfinite(values)]
+        if len(values) == 0:
+            return extent
+        lo, hi = values.min(), values.max()
+        if extent is None:
+            return (lo, hi)
+        return (min(extent[0], lo), max(extent[1], hi))
+
+    def _padded(self, extent):
+        """
+        Calcule des limites d'axe avec marge autour des bornes données.
+        """
+        lo, hi = extent
+        span = hi - lo
+        if span == 0:
+            span = abs(hi) if hi != 0 else 1.0
+        return (lo - self.margin * span, hi + self.margin * span)
+
+    def _update_limits(self):
+        """
+        Agrandit les axes si les données sortent des limites courantes.
+
+        Returns:
+            bool: True si au moins une limite a changé (redessin complet nécessaire).
+        """
+        changed = False
+        if self._x_extent is not None:
+            lo, hi = self.axes[0].get_xlim()
+            if not self._limits_set or self._x_extent[0] < lo or self._x_extent[1] > hi:
+                for axis in self.axes:
+                    axis.set_xlim(*self._padded(self._x_extent))
+                changed = True
+        for axis, extent in self._y_extents.items():
+            if extent is None:
+                continue
+            lo, hi = axis.get_ylim()
+            if not self._limits_set or extent[0] < lo or extent[1] > hi:
+                axis.set_ylim(*self._padded(extent))
+                changed = True
+        if self._x_extent is not None:
+            self._limits_set = True
+        return changed
+
+    def _on_draw(self, event):
+        """
+        Mémorise le fond (axes, graduations, légende) après un dessin complet
+        et y superpose les courbes animées.
+        """
+        if self.canvas.supports_blit:
+            self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_lines()
+
+    def _draw_lines(self):
+        for line in self.lines:
+            line.axes.draw_artist(line)
+
+    def update(self, x, *ys, force=False):
+        """
+        Met à jour les courbes avec les données courantes.
+
+        Les tableaux sont conservés par référence (vues du SampleStore) ; seuls
+        les nouveaux échantillons sont parcourus pour mettre à jour les bornes.
+
+        Args:
+            x (numpy.ndarray): Abscisses communes à toutes les courbes.
+            *ys (numpy.ndarray): Ordonnées, une par courbe, dans l'ordre de création.
+            force (bool): Ignore le plafond de fréquence (ex: dernier point d'une mesure).
+
+        Returns:
+            bool: True si le canevas a été rafraîchi.
+        """
+        self._x, self._ys = x, ys
+        now = time.perf_counter()
+        if not force and now - self._last_draw < 1.0 / self.max_fps:
+            return False
+        self._last_draw = now
+        self._render()
+        return True
+
+    def _set_lines(self):
+        """
+        Met à jour les courbes avec les données réduites et les bornes avec
+        les nouveaux échantillons.
+        """
+        x, ys = self._x, self._ys
+        n = min([len(x)] + [len(y) for y in ys])  # Échantillon ajouté entre deux lectures de colonnes
+        x, ys = np.asarray(x[:n]), [np.asarray(y[:n]) for y in ys]
+        if n < self._seen:  # Données réinitialisées entre-temps
+            self._reset_extents()
+        new = slice(self._seen, n)
+        self._x_extent = self._merge(self._x_extent, x[new])
+        for line, decimator, y in zip(self.lines, self.decimators, ys):
+            axis = line.axes
+            self._y_extents[axis] = self._merge(self._y_extents[axis], y[new])
+            index = decimator.update(y)
+            line.set_data(x[index], y[index])
+        self._seen = n
+
+    def _render(self):
+        self._set_lines()
+
+        if self._update_limits() or self._background is None:
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self._background)
+            self._draw_lines()
+            self.canvas.blit(self.figure.bbox)
+
+    def reset(self):
+        """
+        Efface les courbes et redessine le graphique vide.
+        """
+        self._x, self._ys = None, ()
+        for line, decimator in zip(self.lines, self.decimators):
+            line.set_data([], [])
+            decimator.reset()
+        self._reset_extents()
+        self.canvas.draw()
+
+    def savefig(self, *args, **kwargs):
+        """
+        Enregistre la figure en incluant les courbes animées
+        (qui sont sinon exclues d'un dessin complet). Les courbes réduites
+        sont d'abord mises à jour avec les dernières données.
+
+        Args:
+            *args, **kwargs: Transmis à Figure.savefig.
+        """
+        if self._x is not None:
+            self._set_lines()
+            self._update_limits()
+        for line in self.lines:
+            line.set_animated(False)
+        try:
+            self.figure.savefig(*args, **kwargs)
+        finally:
+            for line in self.lines:
+                line.set_animated(True)
+            self.canvas.draw()
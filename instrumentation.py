@@ -0,0 +1,129 @@
+# instrumentation.py
+
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+import numpy as np
+from stockage import SampleStore
+
+class LatencyProfiler:
+    """
+    Décomposition de la latence de chaque point de mesure.
+
+    Pour chaque point, la durée de chaque étape est accumulée dans une ligne
+    puis enregistrée dans un SampleStore (une colonne float64 par étape). En
+    fin de mesure, summary() donne les percentiles par étape et save() écrit
+    le détail dans un fichier annexe.
+
+    Désactivé, le profileur ne mesure rien (contextes vides).
+
+    Étapes par défaut:
+        consigne: écriture de la consigne sur l'alimentation
+        alimentation: requête tension/courant (conversion comprise)
+        multimetre: requête de résistance (conversion comprise)
+        conversion: décodage des réponses ASCII dans les pilotes (inclus ci-dessus)
+        stockage: ajout au SampleStore
+        interface: dépôt dans la file vers l'interface
+
+    Attributes:
+        enabled (bool): Active la mesure des durées.
+        stages (tuple): Noms des étapes.
+        samples (SampleStore): Durées enregistrées (secondes), une ligne par point.
+    """
+
+    STAGES = ('consigne', 'alimentation', 'multimetre', 'conversion', 'stockage', 'interface')
+
+    def __init__(self, enabled=True, stages=STAGES):
+        """
+        Args:
+            enabled (bool): Active la mesure des durées.
+            stages (tuple): Noms des étapes.
+        """
+        self.enabled = enabled
+        self.stages = tuple(stages)
+        self._index = {stage: i for i, stage in enumerate(self.stages)}
+        self.samples = SampleStore(self.stages)
+        self._row = [0.0] * len(self.stages)
+        self._lock = threading.Lock()  # Ajouts concurrents (pool de lecture)
+
+    def clear(self):
+        """
+        Efface les durées enregistrées (début d'une nouvelle mesure).
+        """
+        self.samples.clear()
+        self._row = [0.0] * len(self.stages)
+
+    def add(self, stage, duration):
+        """
+        Ajoute une durée à l'étape donnée du point en cours.
+
+        Args:
+            stage (str): Nom de l'étape.
+            duration (float): Durée en secondes.
+        """
+        if self.enabled:
+            with self._lock:
+                self._row[self._index[stage]] += duration
+
+    def measure(self, stage):
+        """
+        Contexte mesurant la durée de son bloc pour l'étape donnée.
+
+        Args:
+            stage (str): Nom de l'étape.
+
+        Returns:
+            Gestionnaire de contexte (vide si le profileur est désactivé).
+        """
+        if not self.enabled:
+            return nullcontext()
+        return self._measure(stage)
+
+    @contextmanager
+    def _measure(self, stage):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - start)
+
+    def commit(self):
+        """
+        Enregistre le point en cours et en commence un nouveau.
+        """
+        if self.enabled:
+            self.samples.append(*self._row)
+            self._row = [0.0] * len(self.stages)
+
+    def summary(self):
+        """
+        Résume les durées par étape (médiane, p90, p99, maximum).
+
+        Returns:
+            str: Tableau texte en millisecondes, ou une chaîne vide si rien n'a été mesuré.
+        """
+        if not self.enabled or len(self.samples) == 0:
+            return ""
+        table = self.samples.table() * 1000
+        total = table.sum(axis=1)
+        if 'conversion' in self._index:
+            total -= table[:, self._index['conversion']]  # Déjà comptée dans les requêtes
+        lines = [f"Latences sur {len(self.samples)} points (ms)",
+                 f"{'étape':<13}{'p50':>9}{'p90':>9}{'p99':>9}{'max':>9}"]
+        for name, column in list(zip(self.stages, table.T)) + [('total', total)]:
+            p50, p90, p99 = np.percentile(column, [50, 90, 99])
+            lines.append(f"{name:<13}{p50:9.3f}{p90:9.3f}{p99:9.3f}{column.max():9.3f}")
+        return "\n".join(lines)
+
+    def save(self, path, column_separator=';'):
+        """
+        Écrit les durées de chaque point dans un fichier annexe (en secondes).
+
+        Args:
+            path (str): Chemin du fichier.
+            column_separator (str): Séparateur de colonnes.
+        """
+        if not self.enabled or len(self.samples) == 0:
+            return
+        header = column_separator.join(f"{stage} (s)" for stage in self.stages)
+        np.savetxt(path, self.samples.table(), delimiter=column_separator, header=header, comments='', fmt='%.7f')
@@ -0,0 +1,178 @@
+# lecture.py
+
+import json
+import os
+import numpy as np
+from stockage import RUN_INDEX, SampleStore, open_run
+from ecriture import is_binary, h5py
+from moteur import SquareWaveEngine, RampEngine
+
+CHUNK_BYTES = 1 << 21  # Octets de texte décodés par bloc (court : l'interface reste disponible)
+
+# Champs des colonnes connues des fichiers texte (en-têtes écrits par les moteurs)
+KNOWN_COLUMNS = {column: field
+                 for engine in (SquareWaveEngine, RampEngine)
+                 for column, field in zip(engine.columns, engine.fields)}
+KNOWN_COLUMNS.update({'Écart-type (Ω)': 'ecart_type', 'Point': 'point', 'Rang': 'rang'})
+
+def parse_block(text, width, column_separator=';', decimal_separator='.'):
+    """
+    Décode un bloc de lignes de texte en un seul appel NumPy.
+
+    Les séparateurs de colonnes et les fins de ligne sont ramenés à des
+    espaces (le séparateur décimal au point), puis tout le bloc est converti
+    par np.fromstring.
+
+    Args:
+        text (str): Lignes complètes (sans en-tête).
+        width (int): Nombre de colonnes.
+        column_separator (str): Séparateur de colonnes.
+        decimal_separator (str): Séparateur décimal.
+
+    Returns:
+        numpy.ndarray: Tableau float64 de forme (lignes, width).
+
+    Raises:
+        ValueError: Ligne illisible ou nombre de colonnes incorrect.
+    """
+    text = text.strip()
+    if not text:
+        return np.empty((0, width))
+    if decimal_separator != '.':
+        text = text.replace(decimal_separator, '.')
+    rows = text.count('\n') + 1
+    values = np.fromstring(text.replace(column_separator, ' '), sep=' ')
+    if values.size != rows * width:
+        raise ValueError(f"Bloc illisible : {values.size} valeurs lues pour {rows} lignes de {width} colonnes")
+    return values.reshape(rows, width)
+
+def read_text(path, store, column_separator=';', decimal_separator='.', job=None):
+    """
+    Lit un fichier de données texte par blocs et ajoute les lignes au
+    stockage au fur et à mesure (affichage progressif possible pendant la
+    lecture). L'en-tête (première ligne) est ignoré.
+
+    Args:
+        path (str): Fichier de données.
+        store (SampleStore): Destination (une colonne par colonne du fichier).
+        column_separator (str): Séparateur de colonnes.
+        decimal_separator (str): Séparateur décimal.
+        job (ExportJob, optional): Travail d'arrière-plan (avancement en octets, annulation).
+    """
+    width = len(store.fields)
+    remainder = b''
+    with open(path, 'rb') as file:
+        if job is not None:
+            job.advance(len(file.readline()))
+        else:
+            file.readline()
+        while True:
+            chunk = file.read(CHUNK_BYTES)
+            data = remainder + chunk
+            cut = len(data) if not chunk else data.rfind(b'\n') + 1  # Lignes complètes seulement
+            store.extend(parse_block(data[:cut].decode('utf-8'), width, column_separator, decimal_separator))
+            remainder = data[cut:]
+            if not chunk:
+                return
+            if job is not None:
+                job.advance(len(chunk))
+
+class SavedRun:
+    """
+    Mesure enregistrée, relue pour l'affichage : fichier texte (.txt, .csv...),
+    exportation binaire (.npz, .h5) ou dossier de mesure projeté en mémoire
+    (dossier_tampons, ou son index mesure.json).
+
+    Les fichiers binaires sont ouverts immédiatement (colonnes .npz lues à la
+    demande, dossier de mesure projeté sans copie) ; un fichier texte est lu
+    par load(), par blocs, dans un SampleStore qui peut être tracé pendant la
+    lecture.
+
+    Attributes:
+        path (str): Fichier ou dossier relu.
+        fields (tuple): Noms des colonnes.
+        columns (tuple): En-têtes des colonnes.
+        metadata (dict): Métadonnées de la mesure (vide pour un fichier texte).
+        size (int): Quantité de travail de load() (octets du fichier texte, 0 sinon).
+    """
+
+    def __init__(self, path, column_separator=';', decimal_separator='.'):
+        """
+        Args:
+            path (str): Fichier ou dossier de la mesure.
+            column_separator (str): Séparateur de colonnes d'un fichier texte.
+            decimal_separator (str): Séparateur décimal d'un fichier texte.
+
+        Raises:
+            ImportError: h5py absent pour un fichier HDF5.
+        """
+        self.path = path
+        self.column_separator = column_separator
+        self.decimal_separator = decimal_separator
+        self.metadata = {}
+        self.size = 0
+        if os.path.basename(path) == RUN_INDEX:
+            path = os.path.dirname(path)
+        extension = os.path.splitext(path)[1].lower()
+
+        if os.path.isdir(path):
+            tables, self.metadata = open_run(path)
+            with open(os.path.join(path, RUN_INDEX), encoding='utf-8') as file:
+                self.columns = tuple(json.load(file)['tables']['donnees']['colonnes'])
+            self._data = tables['donnees']
+            self.fields = self._data.dtype.names
+        elif extension == '.npz':
+            archive = np.load(path)
+            self.metadata = json.loads(str(archive['metadonnees']))
+            headers = self.metadata['colonnes']['donnees']
+            self.fields, self.columns = tuple(headers), tuple(headers.values())
+            self._data = {field: archive[f'donnees/{field}'] for field in self.fields}
+        elif is_binary(path):
+            if h5py is None:
+                raise ImportError("Le module h5py est nécessaire pour relire un fichier HDF5 (pip install h5py)")
+            with h5py.File(path, 'r') as file:
+                self.metadata = {key: self._attribute(value) for key, value in file.attrs.items()}
+                group = file['donnees']
+                headers = self.metadata['colonnes']['donnees']
+                self.fields, self.columns = tuple(headers), tuple(headers.values())
+                self._data = {field: group[field][()] for field in self.fields}
+        else:
+            with open(path, encoding='utf-8') as file:
+                self.columns = tuple(file.readline().rstrip('\r\n').split(column_separator))
+            self.fields = tuple(KNOWN_COLUMNS.get(column, f'colonne{index}')
+                                for index, column in enumerate(self.columns))
+            self._data = SampleStore(self.fields)
+            self.size = os.path.getsize(path)
+
+    @staticmethod
+    def _attribute(value):
+        """
+        Décode un attribut HDF5 (valeurs composées enregistrées en JSON).
+        """
+        if isinstance(value, str) and value[:1] in '{[':
+            return json.loads(value)
+        return value
+
+    def load(self, job=None):
+        """
+        Lit les données d'un fichier texte (sans effet pour les autres formats).
+
+        Args:
+            job (ExportJob, optional): Travail d'arrière-plan (avancement, annulation).
+        """
+        if isinstance(self._data, SampleStore):
+            self._data.clear()
+            read_text(self.path, self._data, self.column_separator, self.decimal_separator, job)
+
+    def __len__(self):
+        return len(self._data[self.fields[0]]) if self.fields else 0
+
+    def __getitem__(self, field):
+        """
+        Args:
+            field (str): Nom de la colonne.
+
+        Returns:
+            numpy.ndarray: Colonne (vue, sans copie, pour un fichier texte ou un dossier de mesure).
+        """
+        return self._data[field]
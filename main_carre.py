@@ -1,8 +1,6 @@
 # main_carre.py
 
-import pyvisa
 import time
-import numpy as np
 import threading
 import tkinter as tk
 from tkinter import ttk
@@ -11,53 +9,28 @@ from tkinter import filedialog
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import configparser
-import traceback
-import importlib
+import signalement
+from graphique import LivePlot
+from canal import GuiChannel
+from moteur import SquareWaveEngine
+from ecriture import FILE_TYPES
+from lecture import SavedRun
+from visualisation import RunViewer
 
 # Variables globales
-delais = 0.1  # Délai par défaut entre les mesures (secondes)
 titre_graph = "Résistance et Tension en fonction du temps"
 abcisse = "Temps (s)"
 ordonnee_resistance = "Résistance (Ω)"
 ordonnee_tension = "Tension (V)"
-interrupt_event = threading.Event()  # Événement pour interrompre les mesures
-data_res = np.array([])  # Données de résistance
-data_tension = np.array([])  # Données de tension mesurée
-data_consigne = np.array([])  # Données de tension de consigne
-data_temps = np.array([])  # Données de temps
-data_complete = None  # Stockage complet des données pour l'exportation
-first_measurement_point = True  # Premier point de mesure du cycle complet
+gui_channel = GuiChannel()  # File des messages du thread de mesure vers l'interface
+gui_period = 50  # Période de traitement des messages par l'interface (ms)
+engine = None  # Moteur de mesure (instruments, données, écriture continue), créé au lancement
+export_job = None  # Enregistrement des données en cours (thread d'arrière-plan)
 
 # Chargement de la configuration depuis config.ini
 config = configparser.ConfigParser()
 config.read('config.ini')
 
-# Paramètres de l'alimentation électrique
-alim_class_name = config['Alimentation']['classe']
-alim_address = config['Alimentation']['address']
-volt_max = float(config['Alimentation']['volt_max'])
-curr_max = float(config['Alimentation']['curr_max'])
-curr_prot_lev = float(config['Alimentation']['curr_prot_lev'])
-
-# Paramètres du multimètre
-meter_class_name = config['Meter']['classe']
-meter_gpib = config['Meter']['gpib_address']
-
-# Paramètres de formatage des données
-decimal_separator = config['General']['decimal_separator']
-column_separator = config['General']['column_separator']
-decimales = int(config['General']['decimales'])
-
-# Importation dynamique des classes
-alim_module = importlib.import_module('alimentation')
-meter_module = importlib.import_module('appareil_mesure')
-alim_class = getattr(alim_module, alim_class_name)
-meter_class = getattr(meter_module, meter_class_name)
-
-# Initialisation des instruments
-power_supply = alim_class(alim_address, volt_max, curr_max, curr_prot_lev)
-meter = meter_class(meter_gpib)
-
 def load_config():
     """
     Charge les valeurs des champs de saisie depuis le fichier config.ini.
@@ -79,15 +52,16 @@ def save_config():
     """
     Sauvegarde les valeurs des champs de saisie dans le fichier config.ini.
     Stocke les paramètres actuels pour une utilisation future.
+    Les clés de la section absentes de l'interface (ex: acquisition) sont conservées.
     """
-    config['Mesure_carre'] = {
+    config.read_dict({'Mesure_carre': {
         'v1': entry_v1.get(),  # Tension initiale
         'v2': entry_v2.get(),  # Tension finale
         'delay_V1': entry_delay_v1.get(),  # Délai V1
         'delay_V2': entry_delay_v2.get(),  # Délai V2
         'N': entry_n.get(),  # Nombre d'occurrences
         'measure_delay': entry_measure_delay.get()  # Délai de mesure
-    }
+    }})
     with open('config.ini', 'w') as configfile:
         config.write(configfile)
 
@@ -97,9 +71,9 @@ def start():
 
     Comportements:
     - Si le bouton indique "Démarrer les mesures" ou "Lancer une nouvelle mesure":
-      * Initialise l'alimentation
+      * Lit les paramètres saisis et initialise l'alimentation
       * Réinitialise le graphique et les données si nécessaire
-      * Démarre les mesures dans un thread séparé
+      * Démarre les mesures dans un thread séparé (moteur de mesure)
       * Change le texte du bouton en "Arrêter les mesures"
 
     - Si le bouton indique "Arrêter les mesures":
@@ -107,26 +81,30 @@ def start():
       * Sécurise l'alimentation
       * Change le texte du bouton en "Lancer une nouvelle mesure"
     """
-    global data_res, data_tension, data_consigne, data_temps, interrupt_event, first_measurement_point
-
     current_text = btn_start.cget("text")
 
     if current_text == "   Démarrer les mesures   " or current_text == "   Lancer une nouvelle mesure   ":
         try:
+            # Paramètres saisis, modes d'acquisition et de cadencement configurés
+            parameters = read_parameters()
+            acquisition = config.get('Mesure_carre', 'acquisition', fallback='point')
+            cadencement = config.get('Mesure_carre', 'cadencement', fallback='hote')
+
             # Réinitialisation de l'alimentation
-            power_supply.initialize()
+            engine.initialize()
 
             # Réinitialisation pour nouvelle mesure
             if current_text == "   Lancer une nouvelle mesure   ":
                 reset_graph()  # Réinitialiser le graphique et les données
 
             # Préparation pour la mesure
-            interrupt_event.clear()  # Réinitialiser l'événement d'interruption
-            first_measurement_point = True  # Premier point de mesure
+            engine.interrupt_event.clear()  # Réinitialiser l'événement d'interruption
             save_config()  # Sauvegarder la configuration
+            gui_channel.reset_stats()  # Statistiques de la file pour cette mesure
 
             # Lancement des mesures dans un thread séparé
-            measurement_thread = threading.Thread(target=measure_resistance)
+            measurement_thread = threading.Thread(target=engine.run, args=parameters,
+                                                  kwargs=dict(acquisition=acquisition, cadencement=cadencement))
             measurement_thread.start()
 
             # Mise à jour du bouton
@@ -137,8 +115,8 @@ def start():
 
     elif current_text == "   Arrêter les mesures   ":
         # Arrêt des mesures
-        interrupt_event.set()  # Signaler l'interruption
-        secure_power_supply()  # Sécuriser l'alimentation
+        engine.stop()  # Signaler l'interruption
+        engine.secure()  # Sécuriser l'alimentation
         btn_start.config(text="   Lancer une nouvelle mesure   ")  # Mise à jour du bouton
 
 def reset_graph():
@@ -147,183 +125,25 @@ def reset_graph():
 
     Opérations:
     - Vide tous les tableaux de données
-    - Efface le graphique
-    - Redéfinit les titres et labels
+    - Efface les courbes (axes, titres et légende sont conservés)
     - Redessine le canevas vide
     """
-    global data_res, data_tension, data_consigne, data_temps
-
-    # Réinitialisation des tableaux de données
-    data_res = np.array([])
-    data_tension = np.array([])
-    data_consigne = np.array([])
-    data_temps = np.array([])
+    # Réinitialisation des données
+    engine.data.clear()
 
     # Réinitialisation du graphique
-    ax.clear()
-    ax.set_title(titre_graph)
-    ax.set_xlabel(abcisse)
-    ax.set_ylabel(ordonnee_resistance)
-    ax2.set_ylabel(ordonnee_tension)
-    canvas.draw()  # Redessiner le canevas
+    live_plot.reset()
 
-def secure_power_supply():
+def read_parameters():
     """
-    Remet l'alimentation électrique en état sécurisé et ferme les ressources VISA.
-
-    Opérations:
-    - Désactivation de la sortie
-    - Remise à zéro de la tension
-    - Effacement des erreurs
-    - Retour au mode local
-    - Fermeture des ressources VISA
-
-    Gère les erreurs éventuelles et affiche un message si nécessaire.
-    """
-    try:
-        power_supply.securiser()
-    except Exception as e:
-        messagebox.showerror("Erreur", f"Erreur lors de la sécurisation de l'alimentation: {e}")
-
-def clean_response(response):
-    """
-    Nettoie une réponse d'instrument pour obtenir une valeur exploitable.
-
-    Opérations:
-    - Suppression des espaces en début et fin
-    - Remplacement des séparateurs décimaux selon la configuration
-    - Extraction de la première ligne si plusieurs lignes
-
-    Args:
-        response (str): La réponse brute de l'instrument
+    Lit les paramètres du signal carré dans les champs de saisie.
 
     Returns:
-        str: La réponse nettoyée
-    """
-    response = response.strip()  # Suppression des espaces et caractères de fin de ligne
-    response = response.replace(',', decimal_separator)  # Adaptation du séparateur décimal
-    response = response.split('\n')[0]  # Première ligne uniquement
-    return response
-
-def measure_resistance():
-    """
-    Fonction principale qui effectue les mesures de résistance et de tension en fonction du temps.
-
-    Processus:
-    1. Récupère les paramètres des champs de saisie
-    2. Applique un signal carré de tension
-    3. Mesure la tension, le courant et la résistance à intervalles réguliers (measure_delay secondes)
-    4. Met à jour l'interface et le graphique
-    5. Sécurise l'alimentation à la fin
-
-    Gère les cas spéciaux:
-    - Interruption des mesures
-    - Arrêt après N cycles
-
-    Les données sont stockées pour l'analyse et l'exportation.
+        tuple: (v1, v2, delay_V1, delay_V2, N, measure_delay)
     """
-    global delais, data_res, data_tension, data_consigne, data_temps, data_complete, first_measurement_point
-    try:
-        # Récupération des paramètres
-        v1 = float(entry_v1.get())
-        v2 = float(entry_v2.get())
-        delay_V1 = float(entry_delay_v1.get())
-        delay_V2 = float(entry_delay_v2.get())
-        N = int(entry_n.get())
-        measure_delay = float(entry_measure_delay.get())
-
-        # Réinitialisation des tableaux de données
-        data_res = np.array([])  # Résistance mesurée
-        data_tension = np.array([])  # Tension mesurée
-        data_consigne = np.array([])  # Tension de consigne
-        data_temps = np.array([])  # Temps écoulé
-        data_current = np.array([])  # Courant mesuré
-
-        # Initialisation: tension à 0V et activation de la sortie
-        power_supply.power_supply.write(f'VOLT {v1}')
-        power_supply.power_supply.write('OUTP ON')
-        time.sleep(2) 
-        start_time = time.time()
-
-        # Variables pour suivre le temps écoulé et le nombre de cycles
-        elapsed_time = 0
-        current_voltage = v1
-        next_voltage_change = delay_V1
-        cycle_count = 0
-        measure_event = threading.Event()
-
-        # Boucle pour appliquer le signal carré
-        while not interrupt_event.is_set() and (N == 0 or cycle_count < N):
-            # Vérification du temps écoulé
-            elapsed_time = time.time() - start_time
-
-            # Changement de tension en fonction du temps écoulé
-            if elapsed_time >= next_voltage_change:
-                if current_voltage == v1:
-                    current_voltage = v2
-                    next_voltage_change += delay_V2
-                else:
-                    current_voltage = v1
-                    next_voltage_change += delay_V1
-                    cycle_count += 1  # Incrémenter le compteur de cycles
-
-                # Application de la tension
-                power_supply.power_supply.write(f'VOLT {current_voltage}')
-
-            # Mesure de la tension, du courant et de la résistance
-            if elapsed_time >= measure_delay:
-                measured_voltage = clean_response(power_supply.power_supply.query('MEAS:VOLT?'))
-                measured_current = clean_response(power_supply.power_supply.query('MEAS:CURR?'))
-                resistance_value = clean_response(meter.mesurer())
-
-                # Conversion des valeurs mesurées
-                try:
-                    measured_voltage = float(measured_voltage)
-                    measured_current = float(measured_current)
-                    resistance_value = float(resistance_value)
-                except ValueError as e:
-                    messagebox.showerror("Erreur de mesure", f"Erreur lors de la conversion des valeurs mesurées: {e}")
-                    interrupt_event.set()
-                    return
-
-                # Mise à jour de l'interface
-                update_measurement_labels(current_voltage, measured_voltage, measured_current, resistance_value, elapsed_time)
-
-                # Stockage des données
-                data_res = np.append(data_res, resistance_value)
-                data_tension = np.append(data_tension, measured_voltage)
-                data_consigne = np.append(data_consigne, current_voltage)
-                data_temps = np.append(data_temps, elapsed_time)
-                data_current = np.append(data_current, measured_current)
-
-                # Mise à jour du graphique
-                update_graph(data_res, data_tension, data_temps)
-
-                # Réinitialisation du temps de mesure
-                measure_event.clear()
-                measure_event.wait(measure_delay)
-
-            # Vérification de l'interruption
-            if interrupt_event.is_set():
-                break
-
-        # Fin des mesures
-        secure_power_supply()
-
-    except Exception as e:
-        messagebox.showerror("Erreur", f"Erreur lors de la mesure: {e}\n{traceback.format_exc()}")
-    finally:
-        # Nettoyage final
-        if not interrupt_event.is_set():
-            btn_start.config(text="   Lancer une nouvelle mesure   ")
-        secure_power_supply()
-        first_measurement_point = True
-
-        # Préparation des données pour l'exportation
-        if len(data_temps) > 0 and len(data_res) > 0 and len(data_tension) > 0 and len(data_consigne) > 0 and len(data_current) > 0:
-            data_complete = np.column_stack((data_temps, data_tension, data_res, data_consigne, data_current))
-
-
+    return (float(entry_v1.get()), float(entry_v2.get()),
+            float(entry_delay_v1.get()), float(entry_delay_v2.get()),
+            int(entry_n.get()), float(entry_measure_delay.get()))
 
 def update_measurement_labels(setpoint, voltage, current, resistance, elapsed_time):
     """
@@ -342,43 +162,99 @@ def update_measurement_labels(setpoint, voltage, current, resistance, elapsed_ti
     lbl_resistance.config(text=f"Résistance: {resistance:.4f} Ω")
     lbl_time.config(text=f"Temps: {elapsed_time:.4f} s")
 
+def update_plateau_labels(plateau, last=None):
+    """
+    Met à jour les labels des statistiques du palier en cours.
 
-def update_graph(data_res, data_tension, data_temps): 
-    """ 
-    Met à jour le graphique avec les nouvelles données. 
- 
-    Args: 
-        data_res (numpy.ndarray): Données de résistance 
-        data_tension (numpy.ndarray): Données de tension 
-        data_temps (numpy.ndarray): Données de temps 
-    """ 
-    global ax, ax2, fig, canvas, titre_graph, abcisse, ordonnee_resistance, ordonnee_tension 
- 
-    # Effacement complet de la figure
-    fig.clear()
-    
-    # Recréation des axes comme au démarrage
-    ax = fig.add_subplot(111)
-    ax2 = ax.twinx()  # Ceci garantit que ax2 est bien positionné à droite
-    
-    # Configuration des axes
-    ax.set_title(titre_graph) 
-    ax.set_xlabel(abcisse) 
-    ax.set_ylabel(ordonnee_resistance, color='blue') 
-    ax.tick_params(axis='y', labelcolor='blue') 
-    ax.plot(data_temps, data_res, color='blue', label='Résistance (Ω)') 
- 
-    ax2.set_ylabel(ordonnee_tension, color='red') 
-    ax2.tick_params(axis='y', labelcolor='red') 
-    ax2.plot(data_temps, data_tension, color='red', label='Tension (V)') 
- 
-    # Légende si nécessaire
-    lines = ax.get_lines() + ax2.get_lines() 
-    labels = [line.get_label() for line in lines] 
-    ax.legend(lines, labels, loc='upper left') 
- 
-    # Mise à jour du canevas 
-    canvas.draw_idle()
+    Args:
+        plateau (PlateauStatistics): Palier en cours (None entre deux paliers).
+        last (tuple, optional): Ligne du tableau des cycles du dernier palier terminé.
+    """
+    if plateau is not None and plateau.resistance.count:
+        resistance = plateau.resistance
+        lbl_plateau.config(text=f"Cycle {plateau.cycle}, palier {plateau.plateau}: {resistance.count} points")
+        lbl_plateau_mean.config(text=f"Moyenne: {resistance.mean:.4f} ± {resistance.std:.2g} Ω")
+        lbl_plateau_range.config(text=f"Min/max: {resistance.minimum:.4f} / {resistance.maximum:.4f} Ω")
+        lbl_settling.config(text=f"Stabilisation: {plateau.settling_time:.3f} s")
+    if last is not None:
+        mean, std, settling = last[5], last[6], last[9]
+        lbl_last_plateau.config(text=f"Palier précédent: {mean:.4f} ± {std:.2g} Ω ({settling:.3f} s)")
+
+
+def update_graph(data_res, data_tension, data_temps, force=False):
+    """
+    Met à jour le graphique avec les nouvelles données.
+
+    Les courbes existantes sont mises à jour sans reconstruire la figure ;
+    le rafraîchissement est plafonné à live_plot.max_fps.
+
+    Args:
+        data_res (numpy.ndarray): Données de résistance
+        data_tension (numpy.ndarray): Données de tension
+        data_temps (numpy.ndarray): Données de temps
+        force (bool): Rafraîchit même si le plafond de fréquence est atteint
+    """
+    live_plot.update(data_temps, data_res, data_tension, force=force)
+
+def show_error(title, message, level='erreur'):
+    """
+    Affiche un message d'erreur depuis n'importe quel thread.
+
+    Depuis le thread principal, la boîte de dialogue est ouverte directement ;
+    depuis le thread de mesure, le message est transmis via gui_channel.
+    Les messages des pilotes (module signalement) passent aussi par ici.
+
+    Args:
+        title (str): Titre de la boîte de dialogue
+        message (str): Message d'erreur
+        level (str): 'erreur' ou 'avertissement'
+    """
+    if threading.current_thread() is threading.main_thread():
+        if level == 'avertissement':
+            messagebox.showwarning(title, message)
+        else:
+            messagebox.showerror(title, message)
+    else:
+        gui_channel.post(level, title, message)
+
+def process_gui_events():
+    """
+    Traite par lots les messages du thread de mesure (boucle Tk uniquement).
+
+    Opérations:
+    - Affiche seulement les dernières valeurs mesurées et les statistiques du palier en cours
+    - Rafraîchit le graphique une fois par lot
+    - Affiche les erreurs et gère la fin de mesure
+    - Se reprogramme toutes les gui_period millisecondes
+    """
+    latest = None
+    last_plateau = None
+    finished = False
+    for message in gui_channel.drain():
+        if message.kind == 'mesure':
+            latest = message.payload
+        elif message.kind == 'palier':
+            last_plateau = message.payload
+        elif message.kind == 'erreur':
+            messagebox.showerror(*message.payload)
+        elif message.kind == 'avertissement':
+            messagebox.showwarning(*message.payload)
+        elif message.kind == 'fin':
+            finished = True
+            update_button = message.payload[0]  # Fin sans interruption (mesure complète ou erreur)
+            if update_button:
+                btn_start.config(text="   Lancer une nouvelle mesure   ")
+            print(f"File interface: profondeur max {gui_channel.max_depth}, {gui_channel.dropped} mesures non affichées")
+
+    # Mise à jour de l'interface avec les dernières valeurs uniquement
+    if latest is not None:
+        update_measurement_labels(*latest)
+    if latest is not None or last_plateau is not None:
+        update_plateau_labels(engine.plateaus.current, last_plateau)
+    if latest is not None or finished:
+        update_graph(engine.data['resistance'], engine.data['tension'], engine.data['temps'], force=finished)
+
+    root.after(gui_period, process_gui_events)
 
 
 def stop():
@@ -390,47 +266,91 @@ def stop():
     - Signalement de l'interruption
     - Fermeture de la fenêtre principale
     """
-    secure_power_supply()
-    power_supply.close()
-    meter.close()
-    
-    interrupt_event.set()
+    engine.close()
+    engine.stop()
     time.sleep(1)  # Attendre que les opérations en cours se terminent
     root.destroy()
 
 def save():
     """
-    Sauvegarde les données de mesure dans un fichier texte ou CSV.
+    Sauvegarde les données de mesure dans un fichier texte ou CSV, ou en
+    binaire (.npz, .h5) avec les métadonnées de la mesure.
 
     Opérations:
     - Vérification de la disponibilité des données
     - Ouverture d'une boîte de dialogue pour le choix du fichier
-    - Écriture des données formatées avec les séparateurs configurés
-    - Notification à l'utilisateur
+    - Copie du fichier écrit pendant la mesure (dossier_flux), ou écriture
+      des données formatées avec les séparateurs configurés, dans un thread
+      d'arrière-plan (barre d'avancement, l'interface reste disponible)
+    - Notification à l'utilisateur (voir follow_export)
+
+    Pendant un enregistrement, le bouton annule l'enregistrement en cours.
     """
-    global data_complete
+    global export_job
+
+    # Annulation d'un enregistrement en cours
+    if export_job is not None and export_job.is_alive():
+        export_job.cancel()
+        return
 
     # Vérification de la disponibilité des données
-    if data_complete is None or len(data_complete) == 0:
+    if len(engine.data) == 0:
         messagebox.showinfo("Information", "Aucune donnée à enregistrer.")
         return
 
     # Détermination du type de fichier par défaut
     default_extension = config['General']['file_format']
-    if default_extension == ".txt":
-        file_types = [('Text files', '*.txt'), ('CSV files', '*.csv')]
-    else:
-        file_types = [('CSV files', '*.csv'), ('Text files', '*.txt')]
+    file_types = sorted(FILE_TYPES, key=lambda file_type: file_type[1] != '*' + default_extension)
 
     # Boîte de dialogue pour l'enregistrement
     file_path = filedialog.asksaveasfilename(defaultextension=default_extension, filetypes=file_types)
     if file_path:
-        with open(file_path, 'w', encoding='utf-8') as file:
-            # En-tête avec séparateurs configurés
-            header = f'Temps (s){column_separator}Tension mesurée (V){column_separator}Résistance (Ω){column_separator}Tension de consigne (V){column_separator}Courant Mesuré (A)'
-            np.savetxt(file, data_complete, delimiter=column_separator, header=header, comments='', fmt=f'%.{decimales}f')
+        export_job = engine.save_async(file_path)
+        btn_save_data.config(text="   Annuler l'enregistrement   ")
+        export_progress.pack(side='left', after=btn_save_data, padx=5, pady=5)
+        root.after(gui_period, follow_export, file_path)
+
+def follow_export(file_path):
+    """
+    Suit l'enregistrement en cours (appelée périodiquement par la boucle Tk) :
+    mise à jour de la barre d'avancement, puis notification à la fin.
+
+    Args:
+        file_path (str): Fichier en cours d'enregistrement.
+    """
+    if export_job.is_alive():
+        export_progress['value'] = 100 * export_job.fraction
+        root.after(gui_period, follow_export, file_path)
+        return
+
+    export_progress.pack_forget()
+    btn_save_data.config(text="   Enregistrer les données   ")
+    if export_job.error is not None:
+        messagebox.showerror("Erreur", f"Erreur lors de l'enregistrement: {export_job.error}")
+    elif export_job.cancelled:
+        messagebox.showinfo("Sauvegarde", "Enregistrement annulé")
+    else:
         messagebox.showinfo("Sauvegarde", f"Données sauvegardées avec succès dans {file_path}")
 
+def open_saved_run():
+    """
+    Affiche une mesure enregistrée dans une nouvelle fenêtre (lecture en
+    arrière-plan, zoom et déplacement par la barre d'outils).
+
+    Opérations:
+    - Ouverture d'une boîte de dialogue pour le choix du fichier (.txt, .csv,
+      .npz, .h5, ou mesure.json d'un dossier de mesure)
+    - Lecture avec les séparateurs configurés et tracé réduit
+    """
+    file_path = filedialog.askopenfilename(filetypes=FILE_TYPES + [('Dossier de mesure', 'mesure.json')])
+    if file_path:
+        try:
+            run = SavedRun(file_path, config['General']['column_separator'], config['General']['decimal_separator'])
+        except Exception as e:
+            messagebox.showerror("Erreur", f"Erreur lors de l'ouverture de la mesure: {e}")
+            return
+        RunViewer(tk.Toplevel(root), run)
+
 def save_png():
     """
     Sauvegarde le graphique en tant qu'image PNG.
@@ -442,7 +362,7 @@ def save_png():
     """
     file = filedialog.asksaveasfile(mode='wb', defaultextension=".png")
     if file:
-        fig.savefig(file, dpi=300)  # Haute résolution
+        live_plot.savefig(file, dpi=300)  # Haute résolution
         file.close()
         messagebox.showinfo("Sauvegarde", "Image sauvegardée avec succès")
 
@@ -471,6 +391,10 @@ if __name__ == '__main__':
     chemin_logo = "icone.ico"
     root.iconbitmap(chemin_logo)  # Icône de l'application
 
+    # Messages des pilotes affichés par l'interface, puis ouverture des instruments
+    signalement.set_handler(lambda level, title, message: show_error(title, message, level))
+    engine = SquareWaveEngine.from_config(config, gui_channel)
+
     # Frame pour les champs de saisie
     input_frame = ttk.Frame(root)
     input_frame.pack(fill='x', padx=5, pady=5)
@@ -518,6 +442,15 @@ if __name__ == '__main__':
     lbl_resistance.pack(anchor='w', padx=5, pady=5)
     lbl_time.pack(anchor='w', padx=5, pady=5)
 
+    # Labels des statistiques du palier en cours (tableau complet dans l'annexe 'cycles')
+    lbl_plateau = ttk.Label(measurement_frame, text="Palier: -", font=('Courier', 12))
+    lbl_plateau_mean = ttk.Label(measurement_frame, text="Moyenne: - Ω", font=('Courier', 12))
+    lbl_plateau_range = ttk.Label(measurement_frame, text="Min/max: - Ω", font=('Courier', 12))
+    lbl_settling = ttk.Label(measurement_frame, text="Stabilisation: - s", font=('Courier', 12))
+    lbl_last_plateau = ttk.Label(measurement_frame, text="Palier précédent: -", font=('Courier', 12))
+    for label in (lbl_plateau, lbl_plateau_mean, lbl_plateau_range, lbl_settling, lbl_last_plateau):
+        label.pack(anchor='w', padx=5, pady=5)
+
     # Chargement des valeurs initiales depuis la configuration
     load_config()
 
@@ -527,8 +460,17 @@ if __name__ == '__main__':
     ax.set_title(titre_graph)
     ax.set_xlabel(abcisse)
     ax.set_ylabel(ordonnee_resistance, color='blue')
-    ax2.set_ylabel(ordonnee_tension,color='red')
+    ax.tick_params(axis='y', labelcolor='blue')
+    ax2.set_ylabel(ordonnee_tension, color='red')
+    ax2.tick_params(axis='y', labelcolor='red')
     canvas = FigureCanvasTkAgg(fig, master=root)  # Intégration du graphique dans Tkinter
+
+    # Courbes persistantes mises à jour à chaque mesure
+    live_plot = LivePlot(canvas, [
+        (ax, dict(color='blue', label='Résistance (Ω)')),
+        (ax2, dict(color='red', label='Tension (V)')),
+    ])
+    ax.legend(live_plot.lines, [line.get_label() for line in live_plot.lines], loc='upper left')
     canvas.draw()
     canvas.get_tk_widget().pack(side='top', fill='both', expand=True, padx=5, pady=5)
 
@@ -543,13 +485,17 @@ if __name__ == '__main__':
     # Boutons pour l'enregistrement
     btn_save_data = ttk.Button(button_frame, text="   Enregistrer les données   ", command=save, style='SaveData.TButton')
     btn_save_data.pack(side='left', expand=True, padx=25, pady=5)
+    export_progress = ttk.Progressbar(button_frame, maximum=100, length=200)  # Affichée pendant un enregistrement
     btn_save_img = ttk.Button(button_frame, text="   Enregistrer image   ", command=save_png, style='SaveImg.TButton')
     btn_save_img.pack(side='left', expand=True, padx=25, pady=5)
+    btn_open = ttk.Button(button_frame, text="   Ouvrir une mesure   ", command=open_saved_run, style='Open.TButton')
+    btn_open.pack(side='left', expand=True, padx=25, pady=5)
 
     # Configuration des styles personnalisés pour les boutons
     style = ttk.Style()
     style.configure('SaveData.TButton', background='#c8e6c9', foreground='#1b5e20', font=('Arial', 26))
     style.configure('SaveImg.TButton', background='#ffccbc', foreground='#bf360c', font=('Arial', 26))
+    style.configure('Open.TButton', background='#e1bee7', foreground='#4a148c', font=('Arial', 26))
     style.configure('Start.TButton', background='#bbdefb', foreground='#0d47a1', font=('Arial', 26))
 
     # Frame pour les informations de crédit
@@ -560,5 +506,8 @@ if __name__ == '__main__':
     lbl_credits = ttk.Label(credits_frame, text="Créé par Grégory Mignot, laboratoire OptiMag, https://github.com/Gregory-Mignot?tab=repositories", font=('Arial', 10), anchor='e')
     lbl_credits.pack(side='right', padx=5, pady=5)
 
+    # Traitement périodique des messages du thread de mesure
+    root.after(gui_period, process_gui_events)
+
     # Lancement de la boucle principale Tkinter
     root.mainloop()
@@ -0,0 +1,224 @@
+# mesure.py
+
+import argparse
+import configparser
+import sys
+import threading
+from canal import ConsoleChannel
+from moteur import SquareWaveEngine, RampEngine, open_instruments
+from stations import Station, run_stations, station_config, station_names
+
+def build_parser(config):
+    """
+    Construit l'analyseur des arguments ; les valeurs par défaut viennent
+    des sections [Mesure_carre] et [Mesure] de config.ini.
+
+    Args:
+        config (configparser.ConfigParser): Configuration chargée.
+
+    Returns:
+        argparse.ArgumentParser: Analyseur des arguments.
+    """
+    carre = config['Mesure_carre'] if config.has_section('Mesure_carre') else {}
+    rampe = config['Mesure'] if config.has_section('Mesure') else {}
+
+    parser = argparse.ArgumentParser(description="Mesure de résistance sans interface graphique.")
+    parser.add_argument('--config', default='config.ini', help="Fichier de configuration (défaut: config.ini)")
+    parser.add_argument('-o', '--sortie', help="Fichier de données écrit pendant la mesure "
+                                               "(défaut: fichier horodaté dans dossier_flux ou le dossier courant)")
+    parser.add_argument('--sans-confirmation', action='store_true',
+                        help="N'attend pas la touche Entrée aux changements de polarité (rampe)")
+    parser.add_argument('--postes', help="Postes [Station:n] à utiliser, séparés par des virgules "
+                                         "(défaut: tous les postes de config.ini)")
+    protocols = parser.add_subparsers(dest='protocole', required=True)
+
+    square = protocols.add_parser('carre', help="Signal carré de tension (paramètres de [Mesure_carre])")
+    square.add_argument('--v1', type=float, default=carre.get('v1'), help="Tension du premier palier (V)")
+    square.add_argument('--v2', type=float, default=carre.get('v2'), help="Tension du second palier (V)")
+    square.add_argument('--delay-v1', type=float, default=carre.get('delay_v1'), help="Durée du palier V1 (s)")
+    square.add_argument('--delay-v2', type=float, default=carre.get('delay_v2'), help="Durée du palier V2 (s)")
+    square.add_argument('-n', type=int, default=carre.get('n'), help="Nombre de cycles (0 = jusqu'à Ctrl+C)")
+    square.add_argument('--measure-delay', type=float, default=carre.get('measure_delay'), help="Délai entre deux mesures (s)")
+    square.add_argument('--acquisition', choices=('point', 'rafale', 'asynchrone'), default=carre.get('acquisition', 'point'),
+                        help="Mode d'acquisition")
+    square.add_argument('--cadencement', choices=('hote', 'liste'), default=carre.get('cadencement', 'hote'),
+                        help="Paliers envoyés par l'ordinateur ou déroulés par la liste de l'alimentation")
+
+    ramp = protocols.add_parser('rampe', help="Rampe de tension (paramètres de [Mesure])")
+    ramp.add_argument('--v1', type=float, default=rampe.get('v1'), help="Tension de départ (V)")
+    ramp.add_argument('--v2', type=float, default=rampe.get('v2'), help="Tension finale (V)")
+    ramp.add_argument('--step', type=float, default=rampe.get('step'), help="Pas de tension (V)")
+    ramp.add_argument('--delay', type=float, default=rampe.get('delay'), help="Délai de stabilisation (s)")
+    ramp.add_argument('--final-delay', type=float, default=rampe.get('final_delay'), help="Délai aux points extrêmes (s)")
+    ramp.add_argument('--hysteresis', dest='hysteresis', action='store_true', help="Cycle d'hystérésis complet")
+    ramp.add_argument('--sans-hysteresis', dest='hysteresis', action='store_false', help="Rampe simple de v1 à v2")
+    ramp.add_argument('--cadencement', choices=('hote', 'liste'), default=rampe.get('cadencement', 'hote'),
+                      help="Pas envoyés par l'ordinateur ou déroulés par la liste de l'alimentation")
+    ramp.add_argument('--echantillons', type=int, default=None,
+                      help="Lectures du multimètre par palier (rafale ; défaut: echantillons de [Mesure])")
+    ramp.add_argument('--intervalle-echantillons', type=float, default=None,
+                      help="Intervalle entre les lectures d'un palier (s, 0 = cadence maximale)")
+    ramp.set_defaults(hysteresis=config.getboolean('Mesure', 'hysteresis', fallback=False))
+
+    profiles = protocols.add_parser('profils', help="Durée d'une lecture du multimètre pour chaque profil de vitesse")
+    profiles.add_argument('-n', type=int, default=10, help="Nombre de lectures chronométrées par profil")
+
+    viewer = protocols.add_parser('voir', help="Affiche une mesure enregistrée (.txt, .csv, .npz, .h5 ou dossier de mesure)")
+    viewer.add_argument('fichier', help="Fichier de données ou dossier de mesure (dossier_tampons)")
+    return parser
+
+def report_profiles(config, count):
+    """
+    Affiche la durée d'une lecture du multimètre pour chaque profil de vitesse
+    (instruments de config.ini, sortie de l'alimentation désactivée).
+
+    Args:
+        config (configparser.ConfigParser): Configuration chargée.
+        count (int): Nombre de lectures chronométrées par profil.
+    """
+    power_supply, meter = open_instruments(config)
+    try:
+        costs = meter.cout_profils(count)
+    finally:
+        meter.close()
+        power_supply.close()
+    print(f"{'Profil':<10}{'Lecture (ms)':>14}{'Lectures/s':>12}  Réglages")
+    for name, duration in costs.items():
+        settings = ", ".join(f"{key}={value}" for key, value in meter.PROFILES[name].items())
+        marker = " (actuel)" if name == meter.profile else ""
+        print(f"{name:<10}{duration * 1000:>14.2f}{1 / duration:>12.1f}  {settings}{marker}")
+
+def protocol_arguments(args, config):
+    """
+    Traduit les arguments d'un protocole en paramètres du moteur.
+
+    Args:
+        args (argparse.Namespace): Arguments analysés.
+        config (configparser.ConfigParser): Configuration, complétée des
+            réglages lus par le moteur à sa création (lectures par palier).
+
+    Returns:
+        tuple: (classe du moteur, paramètres, options)
+    """
+    if args.protocole == 'carre':
+        engine_class = SquareWaveEngine
+        parameters = (args.v1, args.v2, args.delay_v1, args.delay_v2, args.n, args.measure_delay)
+        options = dict(acquisition=args.acquisition, cadencement=args.cadencement)
+    else:
+        engine_class = RampEngine
+        parameters = (args.v1, args.v2, args.step, args.delay, args.final_delay, args.hysteresis)
+        options = dict(cadencement=args.cadencement)
+        # Lectures par palier : réglage du moteur, lu dans la configuration à sa création
+        if args.echantillons is not None:
+            config.read_dict({'Mesure': {'echantillons': str(args.echantillons)}})
+        if args.intervalle_echantillons is not None:
+            config.read_dict({'Mesure': {'intervalle_echantillons': str(args.intervalle_echantillons)}})
+    return engine_class, parameters, options
+
+def run_multiple(config, names, argv, confirm):
+    """
+    Exécute le protocole demandé sur plusieurs postes [Station:n] en parallèle.
+
+    Chaque poste reçoit sa propre configuration (voir station_config), donc
+    ses propres valeurs par défaut ; les arguments de la ligne de commande
+    s'appliquent à tous les postes.
+
+    Args:
+        config (configparser.ConfigParser): Configuration chargée.
+        names (list): Noms des postes.
+        argv (list): Arguments de la ligne de commande.
+        confirm (bool): Attend la touche Entrée aux demandes à l'utilisateur.
+
+    Returns:
+        int: 0 si toutes les mesures sont allées à leur terme, 1 sinon (2 si des paramètres manquent).
+    """
+    stations = []
+    for name in names:
+        derived = station_config(config, name)
+        args = build_parser(derived).parse_args(argv)
+        _, parameters, options = protocol_arguments(args, derived)
+        if None in parameters:
+            print(f"Paramètres manquants pour le poste {name} (config.ini ou arguments)", file=sys.stderr)
+            return 2
+        execution = config.get(f'Station:{name}', 'execution', fallback='thread')
+        stations.append(Station(name, derived, args.protocole, parameters, options, execution, confirm))
+
+    outcomes = run_stations(stations)
+    for name, (completed, output) in outcomes.items():
+        state = "terminée" if completed else "interrompue"
+        print(f"Poste {name} : mesure {state}" + (f", données enregistrées dans {output}" if output else ""))
+    return 0 if all(completed for completed, _ in outcomes.values()) else 1
+
+def main(argv=None):
+    """
+    Exécute un protocole de mesure sans interface graphique.
+
+    Les résultats sont écrits au fil de l'acquisition dans le fichier de
+    sortie ; Ctrl+C interrompt la mesure et sécurise l'alimentation.
+
+    Args:
+        argv (list, optional): Arguments (sys.argv[1:] par défaut).
+
+    Returns:
+        int: 0 si la mesure est allée à son terme, 1 sinon (2 si des paramètres manquent).
+
+    Si config.ini décrit des postes [Station:n], le protocole est exécuté
+    sur chacun d'eux en parallèle (voir run_multiple).
+    """
+    # Le fichier de configuration fournit les valeurs par défaut des autres arguments
+    pre_parser = argparse.ArgumentParser(add_help=False)
+    pre_parser.add_argument('--config', default='config.ini')
+    config = configparser.ConfigParser()
+    config.read(pre_parser.parse_known_args(argv)[0].config)
+    args = build_parser(config).parse_args(argv)
+
+    if args.protocole == 'profils':
+        report_profiles(config, args.n)
+        return 0
+    if args.protocole == 'voir':
+        from visualisation import show  # Tkinter n'est nécessaire que pour ce mode
+        show(args.fichier, config['General']['column_separator'], config['General']['decimal_separator'])
+        return 0
+    names = station_names(config)
+    if args.postes:
+        names = [name.strip() for name in args.postes.split(',')]
+        unknown = [name for name in names if name not in station_names(config)]
+        if unknown:
+            print(f"Postes absents de la configuration : {', '.join(unknown)}", file=sys.stderr)
+            return 2
+    if names:
+        if args.sortie:
+            print("-o/--sortie n'est pas utilisable avec plusieurs postes (fichiers dans dossier_flux de chaque poste)",
+                  file=sys.stderr)
+            return 2
+        return run_multiple(config, names, argv, not args.sans_confirmation)
+
+    engine_class, parameters, options = protocol_arguments(args, config)
+    if None in parameters:
+        print("Paramètres manquants (config.ini ou arguments)", file=sys.stderr)
+        return 2
+
+    engine = engine_class.from_config(config, ConsoleChannel(confirm=not args.sans_confirmation))
+    output = args.sortie or engine.stream_path(engine.dossier_flux or '.')
+    result = []
+    try:
+        engine.initialize()
+        # Mesure dans un thread : le thread principal reste disponible pour Ctrl+C
+        worker = threading.Thread(target=lambda: result.append(engine.run(*parameters, output=output, **options)))
+        worker.start()
+        try:
+            while worker.is_alive():
+                worker.join(0.2)
+        except KeyboardInterrupt:
+            print("Interruption demandée", file=sys.stderr)
+            engine.stop()
+            worker.join()
+    finally:
+        engine.close()
+    print(f"Données enregistrées dans {output}")
+    if engine.export_path:
+        print(f"Exportation binaire : {engine.export_path}")
+    return 0 if result and result[0] else 1
+
+if __name__ == '__main__':
+    sys.exit(main())
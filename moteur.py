@@ -0,0 +1,1271 @@
+# moteur.py
+
+import asyncio
+import importlib
+import inspect
+import os
+import threading
+import time
+import traceback
+import numpy as np
+from stockage import MappedSampleStore, SampleStore, write_run_index
+from acquisition import make_reader
+from asynchrone import AsyncItech6517D, AsyncKeithley2000
+from planification import DeadlineScheduler
+from instrumentation import LatencyProfiler
+from statistiques import PlateauTracker
+from ecriture import ExportJob, StreamWriter, copy_file, is_binary, save_binary, write_table
+
+def open_instruments(config):
+    """
+    Ouvre l'alimentation et le multimètre décrits dans config.ini.
+
+    Les classes sont choisies par les clés 'classe' des sections [Alimentation]
+    et [Meter] (importation dynamique). La section [Simulation], si elle est
+    présente, configure le banc des instruments simulés (Itech6517DSimule,
+    Keithley2000Simule). Le profil de vitesse du multimètre est donné par la
+    clé 'profil' de [Meter], dont les réglages peuvent être remplacés un à un
+    (clés nplc, gamme, autozero, filtre, affichage).
+
+    Args:
+        config (configparser.ConfigParser): Configuration chargée.
+
+    Returns:
+        tuple: (alimentation, multimètre)
+    """
+    if config.has_section('Simulation'):
+        importlib.import_module('simulation').configure(config['Simulation'])
+    alim = config['Alimentation']
+    alim_class = getattr(importlib.import_module('alimentation'), alim['classe'])
+    meter_section = config['Meter']
+    meter_class = getattr(importlib.import_module('appareil_mesure'), meter_section['classe'])
+    meter_settings = {name: meter_section[name] for name in ('nplc', 'gamme', 'autozero', 'filtre', 'affichage')
+                      if meter_section.get(name, '').strip()}
+    power_supply = alim_class(alim['address'], float(alim['volt_max']), float(alim['curr_max']),
+                              float(alim['curr_prot_lev']), data_format=alim.get('format', 'ascii'))
+    try:
+        meter = meter_class(meter_section['gpib_address'], data_format=meter_section.get('format', 'ascii'),
+                            profile=meter_section.get('profil', 'normal'), settings=meter_settings)
+    except Exception:
+        power_supply.close()
+        raise
+    return power_supply, meter
+
+def setpoint_change_time(index, delay_V1, delay_V2):
+    """
+    Calcule l'échéance absolue d'un changement de consigne du signal carré.
+
+    Le calcul repart de l'indice du changement (et non d'une somme cumulée)
+    pour que le signal reste en phase sur des milliers de cycles.
+
+    Args:
+        index (int): Indice du changement (0: V1 → V2, 1: V2 → V1, 2: V1 → V2, ...)
+        delay_V1 (float): Durée du palier V1 (secondes)
+        delay_V2 (float): Durée du palier V2 (secondes)
+
+    Returns:
+        float: Échéance en secondes depuis l'origine des temps
+    """
+    cycle, phase = divmod(index, 2)
+    period = delay_V1 + delay_V2
+    return cycle * period + (delay_V1 if phase == 0 else period)
+
+def generate_sequence(v1, v2, step):
+    """
+    Génère une séquence de tensions entre v1 et v2 avec un pas donné.
+
+    Gère à la fois les rampes croissantes et décroissantes.
+    Respecte la précision décimale du pas spécifié.
+
+    Args:
+        v1 (float): Tension de départ
+        v2 (float): Tension finale
+        step (float): Pas de tension (valeur absolue utilisée)
+
+    Returns:
+        list: Séquence de tensions avec le pas spécifié
+    """
+    sequence = []
+    # Détermination du nombre de décimales pour les arrondis
+    decimal_places = len(str(step).split('.')[1]) if '.' in str(step) else 0
+
+    # Initialisation avec la tension de départ (arrondie)
+    current_voltage = round(v1, decimal_places)
+
+    # Génération de la séquence selon le sens (croissant ou décroissant)
+    if v1 <= v2:  # Séquence croissante
+        while current_voltage <= v2:
+            sequence.append(current_voltage)
+            current_voltage = round(current_voltage + abs(step), decimal_places)
+    else:  # Séquence décroissante
+        while current_voltage >= v2:
+            sequence.append(current_voltage)
+            current_voltage = round(current_voltage - abs(step), decimal_places)
+
+    # Ajout de la tension finale si elle n'est pas déjà dans la séquence
+    if sequence and sequence[-1] != v2:
+        sequence.append(round(v2, decimal_places))
+
+    return sequence
+
+def insert_zero_at_polarity_changes(sequence):
+    """
+    Insère des points à 0V lors des changements de polarité dans la séquence.
+
+    Cette fonction est cruciale pour permettre à l'utilisateur d'inverser les
+    connexions lors du passage de tensions positives à négatives ou vice-versa.
+
+    Args:
+        sequence (list): Séquence de tensions originale
+
+    Returns:
+        list: Séquence avec points 0V insérés aux changements de polarité
+    """
+    result = []
+
+    for i in range(len(sequence)):
+        # Ajout du point courant
+        result.append(sequence[i])
+
+        # Vérification du changement de signe au point suivant
+        if i < len(sequence) - 1:
+            current = sequence[i]
+            next_val = sequence[i+1]
+
+            # S'il y a un changement de signe et que le point actuel n'est pas déjà 0
+            if (current > 0 and next_val < 0) or (current < 0 and next_val > 0):
+                if current != 0 and next_val != 0:  # Éviter les doublons de 0
+                    # Insérer un point à 0V
+                    result.append(0.0)
+
+    return result
+
+def is_polarity_change(sequence, index):
+    """
+    Indique si le point de la séquence est un point à 0V entre deux tensions
+    de signes opposés (inversion manuelle des connexions).
+
+    Args:
+        sequence (list): Séquence de tensions
+        index (int): Indice du point
+
+    Returns:
+        bool: True pour un point de changement de polarité
+    """
+    return (sequence[index] == 0 and 0 < index < len(sequence) - 1 and
+            ((sequence[index-1] > 0 and sequence[index+1] < 0) or (sequence[index-1] < 0 and sequence[index+1] > 0)))
+
+def ramp_sequence(v1, v2, step, hysteresis=False):
+    """
+    Construit la séquence complète d'une rampe, points à 0V compris.
+
+    Args:
+        v1 (float): Tension de départ
+        v2 (float): Tension finale
+        step (float): Pas de tension
+        hysteresis (bool): Cycle complet sur les quatre quadrants
+
+    Returns:
+        list: Séquence de tensions
+    """
+    if hysteresis:
+        # Génération du cycle d'hystérésis complet (quadrants I, II, III, IV)
+        sequence = generate_sequence(v1, v2, step)  # Quadrant I: v1 → v2
+        sequence += generate_sequence(v2, v1, -step)[1:]  # Quadrant II: v2 → v1 (sans doublon)
+        sequence += generate_sequence(v1, -v2, -step)[1:]  # Quadrant III: v1 → -v2 (sans doublon)
+        sequence += generate_sequence(-v2, v1, step)[1:]  # Quadrant IV: -v2 → v1 (sans doublon)
+    else:
+        # Séquence simple de v1 à v2
+        sequence = generate_sequence(v1, v2, step)
+
+    # Insertion des points à 0V aux changements de polarité
+    return insert_zero_at_polarity_changes(sequence)
+
+class MeasurementEngine:
+    """
+    Moteur de mesure sans interface graphique.
+
+    Regroupe les instruments, le lecteur, le stockage des échantillons,
+    l'écriture continue sur disque et le profilage. Les messages destinés à
+    l'utilisateur (mesures, erreurs, demandes, fin) passent par channel :
+    GuiChannel pour l'interface Tk, ConsoleChannel en ligne de commande.
+
+    L'importation de ce module n'ouvre aucun instrument : ils sont créés par
+    from_config() (ou fournis au constructeur).
+
+    Attributes:
+        name (str): Préfixe des fichiers de flux.
+        fields (tuple): Colonnes enregistrées, dans l'ordre d'exportation.
+        columns (tuple): En-têtes des colonnes.
+        integer_fields (tuple): Colonnes entières (données et annexes), écrites
+            sans décimales dans les fichiers texte.
+        power_supply: Pilote de l'alimentation.
+        meter: Pilote du multimètre.
+        channel (GuiChannel ou ConsoleChannel): Destination des messages.
+        data (SampleStore): Échantillons de la dernière mesure (MappedSampleStore
+            si dossier_tampons est configuré).
+        annexes (dict): Tableaux enregistrés à côté des données, par suffixe de
+            fichier : (SampleStore, en-têtes des colonnes).
+        interrupt_event (threading.Event): Interrompt la mesure en cours.
+        running (bool): Une mesure est en cours (run()).
+        dossier_tampons (str): Dossier des mesures projetées en mémoire (vide : échantillons en RAM).
+        run_directory (str): Dossier de la dernière mesure projetée en mémoire (None sinon).
+        delai_requete (float): Délai maximal d'une requête en acquisition asyncio (secondes).
+        stream_writer (StreamWriter): Écriture continue de la dernière mesure (None si désactivée).
+        annex_writers (dict): Écriture continue des annexes, par suffixe.
+        identifications (dict): Réponses à *IDN? des instruments (lues par initialize()).
+        run_info (dict): Début, fin et paramètres de la dernière mesure.
+        export_path (str): Fichier binaire écrit à la fin de la dernière mesure
+            (file_format binaire et écriture continue), None sinon.
+        profiler (LatencyProfiler): Décomposition des latences.
+        reader (SequentialReader): Lecteur des deux instruments.
+    """
+
+    name = 'mesure'
+    fields = ()
+    columns = ()
+    integer_fields = ()
+
+    def __init__(self, power_supply, meter, channel, config):
+        """
+        Args:
+            power_supply: Pilote de l'alimentation.
+            meter: Pilote du multimètre.
+            channel: Destination des messages (GuiChannel ou ConsoleChannel).
+            config (configparser.ConfigParser): Configuration (section [General]).
+        """
+        self.power_supply = power_supply
+        self.meter = meter
+        self.channel = channel
+        self.config = config
+
+        # Paramètres de formatage des données
+        self.decimal_separator = config['General']['decimal_separator']
+        self.column_separator = config['General']['column_separator']
+        self.decimales = int(config['General']['decimales'])
+        self.file_format = config['General']['file_format']
+        self.dossier_flux = config.get('General', 'dossier_flux', fallback='')  # Vide = pas d'écriture continue
+        self.profilage = config.getboolean('General', 'profilage', fallback=False)
+        self.profilage_fichier = config.get('General', 'profilage_fichier', fallback='')
+        self.delai_requete = config.getfloat('General', 'delai_requete', fallback=5.0)
+        self.dossier_tampons = config.get('General', 'dossier_tampons', fallback='')  # Vide = échantillons en RAM
+
+        self.interrupt_event = threading.Event()
+        self.running = False
+        self._async_loop = self._async_task = None  # Acquisition asyncio en cours (annulée par stop())
+        self.run_directory = None
+        self.data = self.make_store(self.fields)
+        self.annexes = {}
+        self.stream_writer = None
+        self.annex_writers = {}
+        self.identifications = {}
+        self.run_info = {}
+        self.export_path = None
+        self.profiler = LatencyProfiler(enabled=self.profilage)
+        power_supply.profiler = meter.profiler = self.profiler if self.profilage else None
+        lecture_parallele = config.getboolean('General', 'lecture_parallele', fallback=False)
+        self.reader = make_reader(power_supply, meter, lecture_parallele, profiler=self.profiler)
+
+    @classmethod
+    def from_config(cls, config, channel):
+        """
+        Ouvre les instruments décrits dans config.ini et crée le moteur.
+
+        Args:
+            config (configparser.ConfigParser): Configuration chargée.
+            channel: Destination des messages.
+
+        Returns:
+            MeasurementEngine: Moteur prêt à mesurer.
+        """
+        power_supply, meter = open_instruments(config)
+        return cls(power_supply, meter, channel, config)
+
+    def make_store(self, fields):
+        """
+        Crée le stockage d'un tableau de la mesure (données ou annexe).
+
+        Args:
+            fields (tuple): Noms des colonnes.
+
+        Returns:
+            SampleStore: En mémoire, ou projeté dans un fichier du dossier de
+            mesure (MappedSampleStore) si dossier_tampons est configuré.
+        """
+        return MappedSampleStore(fields) if self.dossier_tampons else SampleStore(fields)
+
+    def stores(self):
+        """
+        Returns:
+            dict: Tableaux de la mesure par nom ('donnees' puis suffixes des
+            annexes) : (stockage, en-têtes des colonnes).
+        """
+        stores = {'donnees': (self.data, self.columns)}
+        stores.update(self.annexes)
+        return stores
+
+    def integer_columns(self, store):
+        """
+        Args:
+            store (SampleStore): Tableau de la mesure (données ou annexe).
+
+        Returns:
+            tuple: Indices des colonnes entières de store (voir integer_fields).
+        """
+        return tuple(index for index, field in enumerate(store.fields) if field in self.integer_fields)
+
+    def new_run_directory(self):
+        """
+        Returns:
+            str: Nouveau dossier horodaté dans dossier_tampons (créé ; suffixe
+            _2, _3... si plusieurs mesures démarrent dans la même seconde).
+        """
+        base = os.path.join(self.dossier_tampons, time.strftime(f'{self.name}_%Y%m%d_%H%M%S'))
+        path, index = base, 1
+        while True:
+            try:
+                os.makedirs(path)
+                return path
+            except FileExistsError:
+                index += 1
+                path = f"{base}_{index}"
+
+    @property
+    def header(self):
+        """
+        str: Ligne d'en-tête des fichiers de données.
+        """
+        return self.column_separator.join(self.columns)
+
+    def stream_path(self, directory=None, prefix=''):
+        """
+        Le flux est toujours écrit en texte : avec un file_format binaire, il
+        porte l'extension .txt et le fichier binaire est écrit en fin de mesure.
+
+        Le fichier est réservé (créé vide, ouverture exclusive) : deux mesures
+        démarrées dans la même seconde (ex: plusieurs postes) reçoivent des
+        fichiers distincts, avec le suffixe _2, _3...
+
+        Args:
+            directory (str, optional): Dossier du fichier (dossier_flux par défaut).
+            prefix (str): Préfixe du nom de fichier (ex: nom du poste de mesure).
+
+        Returns:
+            str: Chemin horodaté d'un nouveau fichier de flux.
+        """
+        directory = self.dossier_flux if directory is None else directory
+        extension = '.txt' if is_binary(self.file_format) else self.file_format
+        base = os.path.join(directory, prefix + time.strftime(f'{self.name}_%Y%m%d_%H%M%S'))
+        path, index = base + extension, 1
+        while True:
+            try:
+                with open(path, 'x'):
+                    return path
+            except FileExistsError:
+                index += 1
+                path = f"{base}_{index}{extension}"
+
+    @staticmethod
+    def annex_path(path, suffix):
+        """
+        Args:
+            path (str): Fichier de données.
+            suffix (str): Suffixe de l'annexe.
+
+        Returns:
+            str: Fichier de l'annexe, à côté du fichier de données (ex: rampe_brut.txt).
+        """
+        root, extension = os.path.splitext(path)
+        return f"{root}_{suffix}{extension}"
+
+    def initialize(self):
+        """
+        Réinitialise l'alimentation avant une nouvelle mesure et relève
+        l'identification des instruments (métadonnées des fichiers binaires).
+        """
+        self.power_supply.initialize()
+        self.identifications = {'alimentation': self.power_supply.identification(),
+                                'multimetre': self.meter.identification()}
+
+    def metadata(self):
+        """
+        Returns:
+            dict: Métadonnées de la dernière mesure (protocole, début et fin,
+            paramètres, identification des instruments, sections de mesure
+            de config.ini), enregistrées avec les exportations binaires.
+        """
+        return {
+            'protocole': self.name,
+            **self.run_info,
+            'instruments': self.identifications,
+            'configuration': {section: dict(self.config[section])
+                              for section in ('Alimentation', 'Meter', 'Mesure', 'Mesure_carre')
+                              if self.config.has_section(section)},
+        }
+
+    def show_error(self, title, message):
+        """
+        Transmet un message d'erreur à l'utilisateur.
+
+        Args:
+            title (str): Titre du message
+            message (str): Message d'erreur
+        """
+        self.channel.post('erreur', title, message)
+
+    def secure(self):
+        """
+        Remet l'alimentation électrique en état sécurisé (sortie désactivée,
+        tension à zéro, erreurs effacées, mode local).
+        """
+        try:
+            with self.power_supply.lock:  # Attente de la fin d'une éventuelle requête du thread de mesure
+                self.power_supply.securiser()
+        except Exception as e:
+            self.show_error("Erreur", f"Erreur lors de la sécurisation de l'alimentation: {e}")
+
+    def teardown(self, action, description):
+        """
+        Exécute une étape de fin de mesure ; une erreur est signalée à
+        l'utilisateur sans interrompre les étapes suivantes.
+
+        Args:
+            action (callable): Étape à exécuter.
+            description (str): Description de l'étape pour le message d'erreur.
+
+        Returns:
+            bool: True si l'étape s'est déroulée sans erreur.
+        """
+        try:
+            action()
+            return True
+        except Exception as e:
+            self.show_error("Erreur", f"Erreur lors de {description}: {e}")
+            return False
+
+    def report_latencies(self):
+        """
+        Affiche la décomposition des latences de la mesure (si profilage est activé)
+        et l'écrit dans le fichier annexe profilage_fichier s'il est configuré.
+        """
+        if not self.profilage:
+            return
+        print(self.profiler.summary())
+        if self.profilage_fichier:
+            self.profiler.save(self.profilage_fichier, self.column_separator)
+
+    def run(self, *args, output=None, **kwargs):
+        """
+        Exécute une mesure complète (bloquant, appelé depuis le thread de mesure).
+
+        Les données sont effacées, écrites en continu dans output (ou dans un
+        fichier horodaté de dossier_flux), puis l'alimentation est sécurisée et
+        le message 'fin' est transmis. Avec un file_format binaire, les données
+        sont aussi exportées à côté du fichier de flux (export_path).
+
+        Args:
+            *args, **kwargs: Paramètres du protocole (voir _run des sous-classes).
+            output (str, optional): Fichier de flux imposé.
+
+        Returns:
+            bool: True si la mesure est allée à son terme sans erreur ni interruption.
+        """
+        self.stream_writer = None
+        self.annex_writers = {}
+        self.export_path = None
+        self.run_directory = None
+        self.run_info = {'debut': time.strftime('%Y-%m-%dT%H:%M:%S')}
+        self.running = True
+        completed = False
+        try:
+            # Paramètres nommés du protocole (métadonnées des exportations binaires)
+            parameters = inspect.signature(self._run).bind(*args, **kwargs)
+            parameters.apply_defaults()
+            self.run_info['parametres'] = dict(parameters.arguments)
+
+            # Réinitialisation des données (nouveau dossier de mesure si les tableaux sont projetés)
+            if self.dossier_tampons:
+                self.run_directory = self.new_run_directory()
+                for name, (store, _) in self.stores().items():
+                    store.open(os.path.join(self.run_directory, f"{name}.dat"))
+                write_run_index(self.run_directory, self.stores(), self.metadata())
+            else:
+                for store, _ in self.stores().values():
+                    store.clear()
+            self.profiler.clear()
+
+            # Écriture continue sur disque pendant l'acquisition (annexes à côté des données)
+            if output or self.dossier_flux:
+                path = output or self.stream_path()
+                self.stream_writer = StreamWriter(self.data, path, self.header,
+                                                  self.column_separator, self.decimales, self.decimal_separator,
+                                                  integers=self.integer_columns(self.data))
+                self.stream_writer.start()
+                for suffix, (store, columns) in self.annexes.items():
+                    writer = StreamWriter(store, self.annex_path(path, suffix), self.column_separator.join(columns),
+                                          self.column_separator, self.decimales, self.decimal_separator,
+                                          integers=self.integer_columns(store))
+                    writer.start()
+                    self.annex_writers[suffix] = writer
+
+            completed = self._run(*args, **kwargs) is not False
+
+            # Fin des mesures
+            self.report_latencies()
+            self.secure()
+
+        except Exception as e:
+            completed = False
+            self.show_error("Erreur", f"Erreur lors de la mesure: {e}\n{traceback.format_exc()}")
+        finally:
+            # Nettoyage final : alimentation sécurisée d'abord, une erreur de
+            # remise en état des instruments n'empêche pas la suite
+            self.secure()
+            self.teardown(self._cleanup, "la remise en état des instruments")
+            try:
+                # Derniers échantillons écrits sur disque (chaque fichier fermé même si un autre échoue)
+                for writer in [self.stream_writer, *self.annex_writers.values()]:
+                    if writer is not None:
+                        self.teardown(writer.close, f"l'écriture de {writer.path}")
+                self.run_info['fin'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+                if self.run_directory is not None:
+                    # Nombre final d'échantillons de chaque tableau projeté
+                    for store, _ in self.stores().values():
+                        store.flush()
+                    write_run_index(self.run_directory, self.stores(), self.metadata())
+
+                # Exportation binaire (colonnes en pleine précision) à côté du fichier de flux
+                if self.stream_writer is not None and is_binary(self.file_format):
+                    path = os.path.splitext(self.stream_writer.path)[0] + self.file_format
+                    try:
+                        self.save(path)
+                        self.export_path = path
+                    except Exception as e:
+                        self.show_error("Erreur", f"Erreur lors de l'exportation binaire: {e}")
+            except Exception as e:
+                completed = False
+                self.show_error("Erreur", f"Erreur lors de l'enregistrement de la mesure: {e}")
+            finally:
+                self.running = False
+
+                # Signalement de la fin de mesure (fin sans interruption, mesure complète)
+                interrupted = self.interrupt_event.is_set()
+                self.channel.post('fin', not interrupted, completed and not interrupted)
+        return completed and not self.interrupt_event.is_set()
+
+    def _run(self, *args, **kwargs):
+        """
+        Protocole de mesure (défini par les sous-classes).
+
+        Returns:
+            False si la mesure a été abandonnée (paramètres ou mesure invalides).
+        """
+        raise NotImplementedError
+
+    def _cleanup(self):
+        """
+        Remise en état des instruments propre au protocole (fin de mesure,
+        appelée après la sécurisation de l'alimentation ; une erreur est
+        signalée sans interrompre la fin de mesure).
+        """
+
+    def _run_async(self, coroutine):
+        """
+        Exécute une coroutine d'acquisition dans une boucle asyncio propre au
+        thread de mesure. stop() l'annule : l'attente ou la requête en cours
+        est abandonnée immédiatement (asyncio.CancelledError).
+
+        Args:
+            coroutine: Coroutine d'acquisition.
+
+        Returns:
+            Résultat de la coroutine, None si elle a été annulée.
+        """
+        async def main():
+            self._async_loop = asyncio.get_running_loop()
+            self._async_task = asyncio.current_task()
+            if self.interrupt_event.is_set():  # stop() appelé avant l'enregistrement de la tâche
+                coroutine.close()
+                return None
+            try:
+                return await coroutine
+            except asyncio.CancelledError:
+                return None
+
+        try:
+            return asyncio.run(main())
+        finally:
+            self._async_loop = self._async_task = None
+
+    def stop(self):
+        """
+        Demande l'interruption de la mesure en cours.
+        """
+        self.interrupt_event.set()
+        loop, task = self._async_loop, self._async_task
+        if loop is not None and task is not None:
+            try:
+                loop.call_soon_threadsafe(task.cancel)
+            except RuntimeError:
+                pass  # Boucle déjà fermée : la mesure est terminée
+
+    def save_async(self, path):
+        """
+        Lance save() dans un thread d'arrière-plan, avec avancement et
+        annulation (voir ecriture.ExportJob). Pendant une acquisition,
+        l'exportation avance par petits blocs entrecoupés de pauses pour ne
+        pas retarder les mesures.
+
+        Args:
+            path (str): Fichier de destination.
+
+        Returns:
+            ExportJob: Exportation en cours.
+        """
+        total = len(self.data) + sum(len(store) for store, _ in self.annexes.values())
+        if self.running:
+            job = ExportJob(lambda job: self.save(path, job), total, chunk_rows=2000, pause=0.002)
+        else:
+            job = ExportJob(lambda job: self.save(path, job), total)
+        return job.start()
+
+    def save(self, path, job=None):
+        """
+        Enregistre les données de la dernière mesure.
+
+        Copie du fichier écrit pendant la mesure s'il existe, sinon écriture
+        des données formatées avec les séparateurs configurés. Les annexes
+        sont enregistrées de la même façon à côté de path.
+
+        Si l'extension de path est binaire (.npz, .h5, .hdf5), les données et
+        les annexes sont enregistrées dans un seul fichier, en pleine précision,
+        avec les métadonnées de la mesure (voir ecriture.save_binary).
+
+        Args:
+            path (str): Fichier de destination.
+            job (ExportJob, optional): Exportation d'arrière-plan (avancement, annulation).
+        """
+        if is_binary(path):
+            tables = {name: (store.records(), columns) for name, (store, columns) in self.stores().items()}
+            save_binary(path, tables, self.metadata(), job)
+            return
+        self._save_table(path, self.data, self.header, self.stream_writer, job)
+        for suffix, (store, columns) in self.annexes.items():
+            self._save_table(self.annex_path(path, suffix), store, self.column_separator.join(columns),
+                             self.annex_writers.get(suffix), job)
+
+    def _save_table(self, path, store, header, writer, job=None):
+        """
+        Enregistre un tableau d'échantillons (copie du fichier de flux writer s'il existe).
+        """
+        if writer is not None:
+            # Données déjà sur disque : simple copie (échantillons en attente écrits d'abord)
+            writer.flush()
+            if os.path.abspath(path) != os.path.abspath(writer.path):
+                copy_file(writer.path, path, writer.written, job)
+            elif job is not None:
+                job.advance(len(store))
+        else:
+            # En-tête et données formatées avec les séparateurs configurés, par blocs
+            write_table(path, store.table(), header, self.column_separator, self.decimales, self.decimal_separator, job,
+                        self.integer_columns(store))
+
+    def close(self):
+        """
+        Sécurise l'alimentation et ferme les ressources.
+        """
+        self.secure()
+        self.power_supply.close()
+        self.reader.close()
+        self.meter.close()
+
+class SquareWaveEngine(MeasurementEngine):
+    """
+    Résistance et tension en fonction du temps sous un signal carré de tension.
+
+    Les statistiques de la résistance sur chaque palier (moyenne, écart-type,
+    extrêmes, durée de stabilisation) sont calculées au fil des échantillons
+    et enregistrées, une ligne par palier, dans l'annexe 'cycles'.
+
+    Attributes:
+        scheduler (DeadlineScheduler): Ordonnanceur de la dernière mesure
+            (retards et créneaux manqués).
+        tolerance_stabilisation (float): Tolérance relative de la durée de
+            stabilisation d'un palier (section [Mesure_carre]).
+        cycles (SampleStore): Statistiques des paliers terminés.
+        plateaus (PlateauTracker): Suivi des paliers (palier en cours).
+    """
+
+    name = 'carre'
+    scheduler = None
+    fields = ('temps', 'tension', 'resistance', 'consigne', 'courant')
+    columns = ('Temps (s)', 'Tension mesurée (V)', 'Résistance (Ω)', 'Tension de consigne (V)', 'Courant Mesuré (A)')
+    cycle_fields = ('cycle', 'palier', 'consigne', 'debut', 'points', 'moyenne', 'ecart_type',
+                    'minimum', 'maximum', 'stabilisation', 'moyenne_stable')
+    cycle_columns = ('Cycle', 'Palier', 'Tension de consigne (V)', 'Début (s)', 'Points', 'Moyenne (Ω)',
+                     'Écart-type (Ω)', 'Minimum (Ω)', 'Maximum (Ω)', 'Stabilisation (s)', 'Moyenne stabilisée (Ω)')
+    integer_fields = ('cycle', 'palier', 'points')
+
+    def __init__(self, power_supply, meter, channel, config):
+        super().__init__(power_supply, meter, channel, config)
+        self.tolerance_stabilisation = config.getfloat('Mesure_carre', 'tolerance_stabilisation', fallback=0.01)
+        self.cycles = self.make_store(self.cycle_fields)
+        self.annexes['cycles'] = (self.cycles, self.cycle_columns)
+        self.plateaus = PlateauTracker(self.cycles, self.tolerance_stabilisation)
+
+    def _run(self, v1, v2, delay_V1, delay_V2, N, measure_delay, acquisition='point', cadencement='hote'):
+        """
+        Applique le signal carré et mesure tension, courant et résistance.
+
+        Avec cadencement='liste', les N cycles V1/V2 sont chargés dans la liste
+        de l'alimentation et déclenchés une fois : les paliers sont cadencés par
+        l'instrument et l'ordinateur ne fait plus que mesurer.
+
+        Args:
+            v1 (float): Tension du premier palier
+            v2 (float): Tension du second palier
+            delay_V1 (float): Durée du palier V1 (secondes)
+            delay_V2 (float): Durée du palier V2 (secondes)
+            N (int): Nombre de cycles (0 = jusqu'à l'interruption)
+            measure_delay (float): Délai entre deux mesures (secondes)
+            acquisition (str): 'point' (une interrogation par mesure), 'rafale'
+                (buffer interne du multimètre) ou 'asynchrone' (point par point
+                en coroutines asyncio)
+            cadencement (str): 'hote' (consignes envoyées par l'ordinateur) ou
+                'liste' (séquence déroulée par l'alimentation)
+        """
+        self._acquisition = acquisition
+        self._cadencement = cadencement
+        if cadencement == 'liste' and N == 0:
+            self.show_error("Erreur", "Le cadencement par liste nécessite un nombre de cycles N non nul.")
+            return False
+        if measure_delay < 0:
+            self.show_error("Erreur", f"Délai entre deux mesures négatif : {measure_delay} s")
+            return False
+
+        # Initialisation: tension V1 et activation de la sortie
+        with self.power_supply.batch():  # Un seul message
+            self.power_supply.appliquer_tension(v1)
+            self.power_supply.activer_sortie()
+        if cadencement == 'liste':
+            # Signal complet chargé dans l'alimentation pendant la stabilisation
+            self.power_supply.charger_liste([v1, v2], [delay_V1, delay_V2], repetitions=N)
+        time.sleep(2)
+
+        # Origine des temps : toutes les échéances sont planifiées à partir d'ici
+        if cadencement == 'liste':
+            self.power_supply.declencher_liste()
+        scheduler = self.scheduler = DeadlineScheduler(self.interrupt_event)
+        # Paliers datés sur la grille des changements de consigne (le premier part de l'origine)
+        self.plateaus.start(lambda index: setpoint_change_time(index - 1, delay_V1, delay_V2) if index else 0.0,
+                            self.channel)
+
+        # Acquisition selon le mode configuré
+        if acquisition == 'rafale':
+            result = self._burst_loop(v1, v2, delay_V1, delay_V2, N, measure_delay, scheduler)
+        elif acquisition == 'asynchrone':
+            result = self._run_async(self._async_acquisition(v1, v2, delay_V1, delay_V2, N, measure_delay, scheduler))
+        else:
+            result = self._point_loop(v1, v2, delay_V1, delay_V2, N, measure_delay, scheduler)
+        self.plateaus.finish()  # Dernier palier (complet, ou partiel si la mesure est interrompue)
+        print(scheduler.summary())
+        return result
+
+    def _cleanup(self):
+        # Étapes indépendantes : l'échec de l'une n'empêche pas l'autre
+        if getattr(self, '_acquisition', 'point') == 'rafale':
+            self.teardown(self.meter.arreter_rafale, "l'arrêt de la rafale")  # Retour à la mesure unique par READ?
+        if getattr(self, '_cadencement', 'hote') == 'liste':
+            self.teardown(self.power_supply.arreter_liste, "l'arrêt de la liste")  # Retour à la consigne fixe
+
+    def _point_loop(self, v1, v2, delay_V1, delay_V2, N, measure_delay, scheduler):
+        """
+        Acquisition point par point : une interrogation de chaque instrument par mesure.
+
+        Les changements de consigne et les mesures sont planifiés à des échéances
+        absolues (grille k * measure_delay) : le thread dort jusqu'à l'échéance
+        suivante au lieu de scruter l'horloge. Une mesure plus longue que
+        measure_delay fait sauter les créneaux dépassés (comptés comme manqués).
+
+        Args: voir _run ; scheduler (DeadlineScheduler) porte l'origine des temps.
+        """
+        power_supply, reader, profiler, data, plateaus = (self.power_supply, self.reader, self.profiler,
+                                                          self.data, self.plateaus)
+        hardware_timed = self._cadencement == 'liste'  # Consignes appliquées par la liste de l'alimentation
+
+        # Variables pour suivre les échéances et le nombre de cycles
+        current_voltage = v1
+        change_index = 0  # Indice du prochain changement de consigne
+        next_voltage_change = setpoint_change_time(change_index, delay_V1, delay_V2)
+        sample_index = 1  # Première mesure après measure_delay
+        cycle_count = 0
+
+        # Boucle pour appliquer le signal carré
+        while not self.interrupt_event.is_set() and (N == 0 or cycle_count < N):
+            next_sample = scheduler.slot_time(sample_index, measure_delay)
+
+            # Changement de tension à l'échéance planifiée
+            if next_voltage_change <= next_sample:
+                if not scheduler.sleep_until(next_voltage_change):
+                    break
+                if change_index % 2 == 0:  # Parité du changement (les paliers restent distincts si v1 = v2)
+                    current_voltage = v2
+                else:
+                    current_voltage = v1
+                    cycle_count += 1  # Incrémenter le compteur de cycles
+
+                # Application de la tension (déjà faite par l'alimentation en mode liste)
+                if not hardware_timed:
+                    with profiler.measure('consigne'):
+                        power_supply.appliquer_tension(current_voltage)
+                change_index += 1
+                next_voltage_change = setpoint_change_time(change_index, delay_V1, delay_V2)
+                continue
+
+            # Mesure de la tension, du courant et de la résistance à l'échéance planifiée
+            if not scheduler.sleep_until(next_sample):
+                break
+
+            # Mesures (en parallèle si lecture_parallele, valeurs décodées par les pilotes)
+            try:
+                sample = reader.read()
+            except ValueError as e:
+                self.show_error("Erreur de mesure", f"Erreur lors de la conversion des valeurs mesurées: {e}")
+                self.interrupt_event.set()
+                return False
+            measured_voltage, measured_current, resistance_value = sample.voltage, sample.current, sample.resistance
+            sample_time = sample.t_meter - scheduler.origin  # Instant de la lecture du multimètre
+
+            # Stockage des données
+            with profiler.measure('stockage'):
+                data.append(sample_time, measured_voltage, resistance_value, current_voltage, measured_current)
+                plateaus.add(sample_time, change_index, current_voltage, resistance_value)
+
+            # Transmission à l'interface (labels et graphique mis à jour par l'interface)
+            with profiler.measure('interface'):
+                self.channel.post_sample(current_voltage, measured_voltage, measured_current, resistance_value, sample_time)
+            profiler.commit()
+
+            # Créneau suivant de la grille de mesure
+            sample_index = scheduler.next_slot(sample_index, measure_delay)
+
+    async def _async_acquisition(self, v1, v2, delay_V1, delay_V2, N, measure_delay, scheduler):
+        """
+        Acquisition point par point en asyncio : les changements de consigne et
+        les mesures sont deux tâches concurrentes, et les deux instruments sont
+        interrogés simultanément à chaque créneau. Chaque requête est limitée à
+        delai_requete ; stop() annule les tâches, même au milieu d'une requête.
+
+        Args: voir _run ; scheduler (DeadlineScheduler) porte l'origine des temps.
+
+        Returns:
+            bool: False si une mesure est invalide ou une requête a expiré.
+        """
+        supply = AsyncItech6517D(self.power_supply, timeout=self.delai_requete)
+        meter = AsyncKeithley2000(self.meter, timeout=self.delai_requete)
+        state = {'consigne': v1, 'palier': 0}  # Consigne et indice du palier courants, partagés entre les deux tâches
+        setpoints = asyncio.ensure_future(self._async_setpoints(supply, v1, v2, delay_V1, delay_V2, N, scheduler, state))
+        sampling = asyncio.ensure_future(self._async_sampling(supply, meter, measure_delay, scheduler, state))
+        try:
+            # Fin du signal (N cycles) ou erreur de mesure : l'autre tâche est annulée
+            await asyncio.wait((setpoints, sampling), return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in (setpoints, sampling):
+                task.cancel()
+            results = await asyncio.gather(setpoints, sampling, return_exceptions=True)
+            supply.close()
+            meter.close()
+        for result in results:
+            if isinstance(result, asyncio.TimeoutError):
+                self.show_error("Erreur de mesure", f"Instrument sans réponse après {self.delai_requete} s")
+                return False
+            if isinstance(result, Exception):
+                raise result
+        return results[1] is not False
+
+    async def _async_setpoints(self, supply, v1, v2, delay_V1, delay_V2, N, scheduler, state):
+        """
+        Tâche des changements de consigne aux échéances planifiées (N cycles,
+        indéfiniment si N = 0). En mode liste, les consignes sont appliquées par
+        l'alimentation et seule la consigne courante est suivie.
+        """
+        hardware_timed = self._cadencement == 'liste'
+        current_voltage = v1
+        change_index = 0
+        cycle_count = 0
+        while N == 0 or cycle_count < N:
+            await scheduler.sleep_until_async(setpoint_change_time(change_index, delay_V1, delay_V2))
+            if change_index % 2 == 0:
+                current_voltage = v2
+            else:
+                current_voltage = v1
+                cycle_count += 1
+            if not hardware_timed:
+                await supply.appliquer_tension(current_voltage)
+            change_index += 1
+            state['consigne'], state['palier'] = current_voltage, change_index
+
+    async def _async_sampling(self, supply, meter, measure_delay, scheduler, state):
+        """
+        Tâche des mesures sur la grille k * measure_delay (créneaux dépassés sautés).
+
+        Returns:
+            bool: False si les valeurs mesurées sont invalides.
+        """
+        profiler, data, plateaus = self.profiler, self.data, self.plateaus
+        sample_index = 1
+        while True:
+            await scheduler.sleep_until_async(scheduler.slot_time(sample_index, measure_delay))
+            setpoint, plateau = state['consigne'], state['palier']
+
+            # Interrogation simultanée des deux instruments
+            try:
+                (measured_voltage, measured_current, _), (resistance_value, t_meter) = await asyncio.gather(
+                    supply.measure_all(), meter.mesurer())
+            except ValueError as e:
+                self.show_error("Erreur de mesure", f"Erreur lors de la conversion des valeurs mesurées: {e}")
+                self.interrupt_event.set()
+                return False
+            sample_time = t_meter - scheduler.origin  # Instant de la lecture du multimètre
+
+            # Stockage des données et transmission à l'interface
+            with profiler.measure('stockage'):
+                data.append(sample_time, measured_voltage, resistance_value, setpoint, measured_current)
+                plateaus.add(sample_time, plateau, setpoint, resistance_value)
+            with profiler.measure('interface'):
+                self.channel.post_sample(setpoint, measured_voltage, measured_current, resistance_value, sample_time)
+            profiler.commit()
+
+            # Créneau suivant de la grille de mesure
+            sample_index = scheduler.next_slot(sample_index, measure_delay)
+
+    def _burst_loop(self, v1, v2, delay_V1, delay_V2, N, measure_delay, scheduler):
+        """
+        Acquisition en rafale : chaque palier est échantillonné par le timer
+        interne du multimètre (mesures stockées dans son buffer), puis lu en un
+        seul transfert au changement de palier.
+
+        La tension et le courant de l'alimentation sont mesurés une fois par palier,
+        pendant la rafale, et reportés sur tous les points du palier.
+
+        Le buffer n'est lu (puis la rafale suivante armée) qu'après le
+        changement de consigne : chaque rafale est donc dimensionnée sur le
+        temps restant jusqu'à la fin planifiée de son palier, pour que toutes
+        ses lectures portent la bonne consigne. Les lectures sont datées à
+        partir de l'armement effectif (INIT), au milieu de leur intégration ;
+        une lecture qui dépasserait malgré tout la fin du palier est écartée.
+
+        Args: voir _run (measure_delay est le délai minimal entre deux mesures
+        du multimètre) ; scheduler (DeadlineScheduler) porte l'origine des temps.
+        """
+        meter, data = self.meter, self.data
+        current_voltage = v1
+        change_index = 0  # Indice du prochain changement de consigne
+        cycle_count = 0
+        overhead = 0.0  # Durée de la configuration et de l'armement de la rafale précédente
+        configured = None  # (nombre, intervalle) de la rafale configurée dans le multimètre
+
+        while not self.interrupt_event.is_set() and (N == 0 or cycle_count < N):
+            # Armement de la rafale pour le temps restant du palier courant
+            # (intervalle élargi si le palier dépasse la capacité du buffer ou la cadence du multimètre)
+            deadline = setpoint_change_time(change_index, delay_V1, delay_V2)
+            integration = meter.periode_minimale()
+            start = scheduler.now()
+            available = deadline - start - overhead - integration  # Dernière lecture terminée avant la fin du palier
+            interval = max(measure_delay, available / meter.BUFFER_SIZE, integration)
+            count = min(meter.BUFFER_SIZE, int(available / interval) + 1) if available > 0 else 0
+            if count >= 2:
+                if configured != (count, interval):  # Reconfiguration seulement si la rafale change
+                    meter.configurer_rafale(count, interval)
+                    configured = (count, interval)
+                meter.armer_rafale()
+                armed = scheduler.now()  # Premier déclenchement du timer à l'INIT
+                overhead = armed - start
+
+            # Mesure de l'alimentation pendant la rafale (bus indépendant)
+            try:
+                measured_voltage, measured_current, _ = self.reader.read_supply()
+            except ValueError as e:
+                self.show_error("Erreur de mesure", f"Erreur lors de la conversion des valeurs mesurées: {e}")
+                self.interrupt_event.set()
+                return False
+
+            # Attente de la fin planifiée du palier puis changement de tension
+            if not scheduler.sleep_until(deadline):
+                break
+            change_index += 1
+            setpoint = current_voltage
+            if change_index % 2:
+                current_voltage = v2
+            else:
+                current_voltage = v1
+                cycle_count += 1  # Incrémenter le compteur de cycles
+            if (N == 0 or cycle_count < N) and self._cadencement != 'liste':
+                self.power_supply.appliquer_tension(current_voltage)
+            if count < 2:
+                continue  # Palier trop court pour une rafale (retard de l'armement)
+
+            # Lecture du buffer en un seul transfert
+            resistances = meter.lire_rafale(timeout=deadline - start, interrupt_event=self.interrupt_event)
+            if resistances is None:
+                break
+
+            # Stockage du palier (lectures effectuées avant le changement de consigne)
+            times = armed + integration / 2 + interval * np.arange(len(resistances))
+            kept = times <= deadline
+            times, resistances = times[kept], resistances[kept]
+            if not len(resistances):
+                continue
+            block = np.empty((len(resistances), len(data.fields)))
+            block[:, 0] = times
+            block[:, 1] = measured_voltage
+            block[:, 2] = resistances
+            block[:, 3] = setpoint
+            block[:, 4] = measured_current
+            data.extend(block)
+            self.plateaus.extend(times, change_index - 1, setpoint, resistances)  # Palier qui vient de se terminer
+
+            # Transmission à l'interface (dernier point du palier)
+            self.channel.post_sample(setpoint, measured_voltage, measured_current, resistances[-1], times[-1])
+
+class RampEngine(MeasurementEngine):
+    """
+    Résistance en fonction de la tension le long d'une rampe (avec ou sans hystérésis).
+
+    Avec echantillons = K > 1 (section [Mesure]), chaque palier est mesuré par
+    une rafale de K lectures cadencées par le timer du multimètre et lues en un
+    seul transfert : la résistance enregistrée est la moyenne, complétée par
+    l'écart-type ; les lectures brutes sont enregistrées dans l'annexe 'brut'.
+
+    Attributes:
+        echantillons (int): Nombre de lectures du multimètre par palier.
+        intervalle_echantillons (float): Intervalle entre deux lectures d'un palier
+            (secondes, 0 = cadence maximale du multimètre).
+        raw (SampleStore): Lectures brutes (point, rang, résistance) si echantillons > 1.
+    """
+
+    name = 'rampe'
+    fields = ('tension', 'resistance', 'consigne', 'delai')
+    columns = ('Tension mesurée (V)', 'Résistance (Ω)', 'Tension de consigne (V)', 'Délai (s)')
+    raw_columns = ('Point', 'Rang', 'Résistance (Ω)')
+    integer_fields = ('point', 'rang')
+
+    def __init__(self, power_supply, meter, channel, config):
+        self.echantillons = config.getint('Mesure', 'echantillons', fallback=1)
+        self.intervalle_echantillons = config.getfloat('Mesure', 'intervalle_echantillons', fallback=0.0)
+        if not 1 <= self.echantillons <= meter.BUFFER_SIZE:
+            raise ValueError(f"Nombre de lectures par palier hors limites (1 à {meter.BUFFER_SIZE}) : {self.echantillons}")
+        if self.echantillons > 1:
+            # Moyenne et écart-type par palier, lectures brutes en annexe
+            self.fields = self.fields + ('ecart_type',)
+            self.columns = self.columns + ('Écart-type (Ω)',)
+        super().__init__(power_supply, meter, channel, config)
+        self.raw = None
+        if self.echantillons > 1:
+            self.raw = self.make_store(('point', 'rang', 'resistance'))
+            self.annexes['brut'] = (self.raw, self.raw_columns)
+
+    def _cleanup(self):
+        if self.echantillons > 1:
+            self.teardown(self.meter.arreter_rafale, "l'arrêt de la rafale")  # Retour à la mesure unique par READ?
+
+    def _read_point(self):
+        """
+        Interroge les instruments pour un point de la rampe : une lecture de
+        chaque instrument, ou une rafale de K lectures du multimètre pendant
+        laquelle l'alimentation est mesurée (bus indépendants).
+
+        Returns:
+            tuple: (tension, courant, résistance moyenne, écart-type, lectures brutes),
+                lectures brutes valant None pour une lecture unique ; None si la
+                mesure a été interrompue pendant la rafale.
+        """
+        if self.echantillons == 1:
+            # Mesures (en parallèle si lecture_parallele, valeurs décodées par les pilotes)
+            sample = self.reader.read()
+            return sample.voltage, sample.current, sample.resistance, 0.0, None
+
+        meter = self.meter
+        with self.profiler.measure('multimetre'):
+            meter.armer_rafale()
+        voltage, current, _ = self.reader.read_supply()
+        with self.profiler.measure('multimetre'):
+            # Attente maximale large : 2 s par lecture au-delà de l'intervalle
+            readings = meter.lire_rafale(timeout=self.echantillons * (self.intervalle_echantillons + 2.0),
+                                         interrupt_event=self.interrupt_event)
+        if readings is None:
+            return None
+        return voltage, current, float(np.mean(readings)), float(np.std(readings, ddof=1)), readings
+
+    def _measure_point(self, current_voltage, current_delay):
+        """
+        Mesure un point de la rampe, le stocke et le transmet à l'utilisateur.
+
+        Returns:
+            bool: False si les valeurs mesurées sont invalides (mesure interrompue).
+        """
+        try:
+            point = self._read_point()
+        except ValueError as e:
+            self.show_error("Erreur de mesure", f"Erreur lors de la conversion des valeurs mesurées: {e}")
+            self.interrupt_event.set()
+            return False
+        if point is None:
+            return True  # Rafale interrompue : rien à enregistrer
+        measured_voltage, measured_current, resistance_value, deviation, readings = point
+
+        # Ajustement du signe de la tension mesurée
+        if (current_voltage < 0 and measured_voltage > 0):
+            measured_voltage = -measured_voltage
+
+        # Stockage des données (lectures brutes du palier en un seul bloc)
+        with self.profiler.measure('stockage'):
+            if readings is None:
+                self.data.append(measured_voltage, resistance_value, current_voltage, current_delay)
+            else:
+                block = np.empty((len(readings), 3))
+                block[:, 0] = len(self.data)
+                block[:, 1] = np.arange(len(readings))
+                block[:, 2] = readings
+                self.raw.extend(block)
+                self.data.append(measured_voltage, resistance_value, current_voltage, current_delay, deviation)
+
+        # Transmission à l'interface (labels et graphique mis à jour par l'interface)
+        with self.profiler.measure('interface'):
+            self.channel.post_sample(measured_voltage, measured_current, resistance_value, current_voltage)
+        self.profiler.commit()
+        return True
+
+    def _run_list(self, voltages, delays, window):
+        """
+        Déroule un segment de la rampe (sans changement de polarité) par la liste
+        de l'alimentation : chaque pas dure son délai de stabilisation plus la
+        fenêtre de mesure, et chaque point est mesuré à la fin de son délai.
+
+        Args:
+            voltages (list): Tensions du segment
+            delays (list): Délais de stabilisation des points (secondes)
+            window (float): Durée réservée à la mesure de chaque point (secondes)
+
+        Returns:
+            bool: False si les valeurs mesurées sont invalides, None si la mesure
+                a été interrompue, True sinon.
+        """
+        power_supply = self.power_supply
+        power_supply.charger_liste([abs(voltage) for voltage in voltages], [delay + window for delay in delays])
+        power_supply.declencher_liste()
+        scheduler = DeadlineScheduler(self.interrupt_event)  # Origine : déclenchement de la liste
+
+        step_start = 0.0
+        for voltage, delay in zip(voltages, delays):
+            if not scheduler.sleep_until(step_start + delay):
+                return None
+            if not self._measure_point(voltage, delay):
+                return False
+            step_start += delay + window
+
+        # Fin du dernier pas avant de rendre la main à la consigne fixe
+        if not scheduler.sleep_until(step_start):
+            return None
+        power_supply.arreter_liste()
+        print(scheduler.summary())
+        return True
+
+    def _run(self, v1, v2, step, delay, final_delay, hysteresis=False, cadencement='hote'):
+        """
+        Parcourt la séquence de tensions et mesure la résistance à chaque point.
+
+        Pour chaque point : application de la tension, attente du délai de
+        stabilisation (final_delay aux points extrêmes), mesure. Aux changements
+        de polarité, la sortie est coupée et l'utilisateur est invité à inverser
+        les connexions.
+
+        Avec cadencement='liste', chaque portion de la séquence entre deux
+        changements de polarité est chargée dans la liste de l'alimentation et
+        déroulée par l'instrument (voir _run_list) ; les points de changement
+        de polarité restent pilotés par l'ordinateur.
+
+        Args:
+            v1 (float): Tension de départ
+            v2 (float): Tension finale
+            step (float): Pas de tension
+            delay (float): Délai de stabilisation standard (secondes)
+            final_delay (float): Délai aux points extrêmes (secondes)
+            hysteresis (bool): Cycle complet sur les quatre quadrants
+            cadencement (str): 'hote' (consignes envoyées par l'ordinateur) ou
+                'liste' (séquence déroulée par l'alimentation)
+        """
+        power_supply = self.power_supply
+        if hysteresis and v1 >= v2:
+            self.show_error("Erreur", "Pour l'hystérésis, v1 doit être inférieur à v2.")
+            return False
+
+        sequence = ramp_sequence(v1, v2, step, hysteresis)
+        print("Séquence avec points 0V aux changements de polarité:", sequence)
+
+        # Initialisation: tension à 0V et activation de la sortie
+        with power_supply.batch():  # Un seul message
+            power_supply.appliquer_tension(0)
+            power_supply.activer_sortie()
+        if self.echantillons > 1:
+            # Rafale de K lectures par palier, armée à chaque point
+            self.meter.configurer_rafale(self.echantillons, self.intervalle_echantillons)
+        window = 0.0
+        if cadencement == 'liste':
+            # Fenêtre de mesure des pas de la liste : lecture d'essai pendant la stabilisation
+            start = time.perf_counter()
+            self._read_point()
+            window = 2 * (time.perf_counter() - start) + 0.01
+            time.sleep(max(0.0, delay - (time.perf_counter() - start)))  # Stabilisation initiale
+        else:
+            time.sleep(delay)  # Stabilisation initiale
+
+        # Détermination des délais (délai spécial pour les points extrêmes)
+        delays = [final_delay if voltage in {v1, v2, -v2} else delay for voltage in sequence]
+
+        # Parcours de la séquence
+        list_end = 0  # Fin du dernier segment déroulé par la liste de l'alimentation
+        for i in range(len(sequence)):
+            # Vérification d'interruption demandée
+            if self.interrupt_event.is_set():
+                break
+            if i < list_end:
+                continue  # Point déjà mesuré pendant la liste
+
+            current_voltage = sequence[i]
+            current_delay = delays[i]
+
+            # Traitement spécial des points à 0V lors des changements de polarité
+            if is_polarity_change(sequence, i):
+                # Désactivation de la sortie par sécurité
+                power_supply.activer_sortie(False)
+
+                # Demande à l'utilisateur d'inverser les connexions (attente de la réponse)
+                confirmed = self.channel.request("info", "Changement de signe",
+                                                 f"Changement de signe détecté: {sequence[i-1]}V → {sequence[i+1]}V.\n"
+                                                 f"Veuillez inverser manuellement les connexions puis cliquer sur OK.",
+                                                 interrupt_event=self.interrupt_event)
+                if confirmed is None:
+                    break
+
+                # Réactivation sécurisée
+                with self.profiler.measure('consigne'), power_supply.batch():  # Un seul message
+                    power_supply.appliquer_tension(0)
+                    power_supply.activer_sortie()
+            elif cadencement == 'liste':
+                # Segment jusqu'au prochain changement de polarité (longueur limitée par l'alimentation)
+                list_end = i + 1
+                while (list_end < len(sequence) and list_end - i < power_supply.LIST_MAX_STEPS
+                       and not is_polarity_change(sequence, list_end)):
+                    list_end += 1
+                if self._run_list(sequence[i:list_end], delays[i:list_end], window) is False:
+                    return False
+                continue
+            else:
+                # Application de la tension (toujours en valeur absolue)
+                with self.profiler.measure('consigne'):
+                    power_supply.appliquer_tension(abs(current_voltage))
+            time.sleep(current_delay)  # Délai de stabilisation
+
+            if not self._measure_point(current_voltage, current_delay):
+                return False
@@ -0,0 +1,148 @@
+# planification.py
+
+import asyncio
+import math
+import time
+
+class DeadlineScheduler:
+    """
+    Ordonnanceur à échéances absolues, sans dérive.
+
+    Toutes les échéances sont exprimées en secondes depuis l'origine fixée
+    par start() (horloge monotone time.perf_counter). Le thread dort jusqu'à
+    l'échéance (attente sur interrupt_event, interruptible), puis termine par
+    une courte attente active pour la précision. Les retards et les créneaux
+    de mesure manqués sont comptabilisés.
+
+    Attributes:
+        interrupt_event (threading.Event): Événement interrompant l'attente.
+        tolerance (float): Retard au-delà duquel une échéance est comptée en retard.
+        spin (float): Durée finale d'attente active avant l'échéance (secondes).
+        late (int): Nombre d'échéances servies en retard.
+        missed (int): Nombre de créneaux de mesure sautés.
+        max_lateness (float): Retard maximal observé (secondes).
+    """
+
+    def __init__(self, interrupt_event=None, tolerance=0.005, spin=0.002, clock=time.perf_counter):
+        """
+        Args:
+            interrupt_event (threading.Event, optional): Interrompt les attentes s'il est levé.
+            tolerance (float): Retard toléré avant de compter une échéance en retard.
+            spin (float): Durée d'attente active en fin d'attente.
+            clock (callable): Horloge monotone.
+        """
+        self.interrupt_event = interrupt_event
+        self.tolerance = tolerance
+        self.spin = spin
+        self.clock = clock
+        self.start()
+
+    def start(self):
+        """
+        Fixe l'origine des temps et remet les statistiques à zéro.
+
+        Returns:
+            float: Origine (valeur de l'horloge).
+        """
+        self.origin = self.clock()
+        self.late = 0
+        self.missed = 0
+        self.max_lateness = 0.0
+        return self.origin
+
+    def now(self):
+        """
+        Returns:
+            float: Temps écoulé depuis l'origine (secondes).
+        """
+        return self.clock() - self.origin
+
+    def sleep_until(self, deadline):
+        """
+        Attend l'échéance donnée (relative à l'origine).
+
+        Args:
+            deadline (float): Échéance en secondes depuis l'origine.
+
+        Returns:
+            bool: False si l'attente a été interrompue, True sinon.
+        """
+        remaining = deadline - self.now()
+        if remaining > self.spin:
+            if self.interrupt_event is not None:
+                if self.interrupt_event.wait(remaining - self.spin):
+                    return False
+            else:
+                time.sleep(remaining - self.spin)
+        while self.now() < deadline:
+            time.sleep(0)  # Cède le processeur sans dormir un quantum complet
+        self._record(deadline)
+        return self.interrupt_event is None or not self.interrupt_event.is_set()
+
+    async def sleep_until_async(self, deadline):
+        """
+        Attend l'échéance donnée dans une coroutine (sans attente active : les
+        autres tâches de la boucle continuent). L'interruption passe par
+        l'annulation de la tâche (asyncio.CancelledError).
+
+        Args:
+            deadline (float): Échéance en secondes depuis l'origine.
+        """
+        remaining = deadline - self.now()
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+        self._record(deadline)
+
+    def _record(self, deadline):
+        """
+        Comptabilise le retard de l'échéance qui vient d'être servie.
+        """
+        lateness = self.now() - deadline
+        if lateness > self.max_lateness:
+            self.max_lateness = lateness
+        if lateness > self.tolerance:
+            self.late += 1
+
+    def slot_time(self, index, period):
+        """
+        Échéance d'un créneau de la grille régulière.
+
+        Args:
+            index (int): Indice du créneau.
+            period (float): Période de la grille (secondes, 0 = mesures enchaînées sans attente).
+
+        Returns:
+            float: index * period, ou l'instant présent si la période est nulle.
+        """
+        return index * period if period > 0 else self.now()
+
+    def next_slot(self, index, period):
+        """
+        Renvoie l'indice du prochain créneau d'une grille régulière encore à venir.
+
+        Les créneaux déjà dépassés (mesure plus longue que la période) sont
+        sautés et comptés comme manqués : la grille reste en phase avec
+        l'origine au lieu de dériver. Avec une période nulle (mesures
+        enchaînées), le créneau suivant est servi immédiatement et aucun
+        créneau n'est manqué.
+
+        Args:
+            index (int): Indice du créneau qui vient d'être servi.
+            period (float): Période de la grille (secondes).
+
+        Returns:
+            int: Indice du prochain créneau (échéance slot_time(index, period)).
+        """
+        if period <= 0:
+            return index + 1
+        following = max(index + 1, math.floor(self.now() / period) + 1)
+        self.missed += following - index - 1
+        return following
+
+    def summary(self):
+        """
+        Returns:
+            str: Résumé des retards et créneaux manqués.
+        """
+        return (f"Ordonnancement: {self.late} échéances en retard (> {self.tolerance * 1000:.1f} ms), "
+                f"{self.missed} mesures manquées, retard max {self.max_lateness * 1000:.2f} ms")
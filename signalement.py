@@ -0,0 +1,45 @@
+# signalement.py
+
+import sys
+
+def _print_message(level, title, message):
+    """
+    Gestionnaire par défaut : affichage sur la sortie d'erreur (mode sans interface).
+    """
+    print(f"[{level}] {title}: {message}", file=sys.stderr)
+
+_handler = _print_message
+
+def set_handler(handler):
+    """
+    Remplace le gestionnaire des messages des pilotes.
+
+    L'interface graphique y installe l'affichage par boîte de dialogue ; sans
+    interface, les messages sont écrits sur la sortie d'erreur.
+
+    Args:
+        handler (callable): Fonction (niveau, titre, message), niveau valant
+            'erreur' ou 'avertissement'. None rétablit le gestionnaire par défaut.
+    """
+    global _handler
+    _handler = handler if handler is not None else _print_message
+
+def error(title, message):
+    """
+    Signale une erreur.
+
+    Args:
+        title (str): Titre du message.
+        message (str): Texte du message.
+    """
+    _handler('erreur', title, message)
+
+def warning(title, message):
+    """
+    Signale un avertissement.
+
+    Args:
+        title (str): Titre du message.
+        message (str): Texte du message.
+    """
+    _handler('avertissement', title, message)
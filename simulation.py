@@ -0,0 +1,459 @@
+# simulation.py
+
+import bisect
+import random
+import threading
+import time
+from collections import deque
+import numpy as np
+from pyvisa import constants
+from pyvisa.errors import VisaIOError
+from pyvisa.util import to_ieee_block, from_ieee_block
+
+class Bench:
+    """
+    Banc simulé : dispositif sous test (DUT) résistif partagé par les instruments
+    simulés, et paramètres de la simulation.
+
+    La résistance dépend de la tension appliquée (coefficient en tension) et
+    rejoint sa nouvelle valeur de façon exponentielle après chaque changement
+    de tension (constante de temps), ce qui donne des paliers avec un
+    transitoire de stabilisation. Des changements de tension peuvent être
+    planifiés à l'avance (liste déroulée par l'alimentation).
+
+    Attributes:
+        resistance (float): Résistance du DUT à 0V (Ω).
+        coef_tension (float): Variation relative de la résistance par volt (1/V).
+        constante_temps (float): Constante de temps du transitoire (s, 0 = immédiat).
+        bruit (float): Bruit gaussien relatif ajouté à chaque mesure.
+        latence (float): Durée d'un échange de message (s).
+        gigue (float): Variation aléatoire maximale ajoutée à la latence (s).
+        integration (float): Durée d'intégration du multimètre à 1 NPLC, sans autozéro (s).
+        mesure_alimentation (float): Durée d'une mesure de l'alimentation (s).
+        taux_erreur (float): Probabilité qu'un échange échoue (erreur VISA de dépassement de délai).
+        taux_corruption (float): Probabilité qu'une réponse soit illisible.
+    """
+
+    def __init__(self):
+        self.resistance = 1000.0
+        self.coef_tension = 0.0
+        self.constante_temps = 0.0
+        self.bruit = 0.0
+        self.latence = 0.0
+        self.gigue = 0.0
+        self.integration = 0.02
+        self.mesure_alimentation = 0.002
+        self.taux_erreur = 0.0
+        self.taux_corruption = 0.0
+        self.clock = time.perf_counter
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """
+        Remet le DUT hors tension.
+        """
+        with self._lock:
+            # (instant, résistance de départ, résistance visée, tension)
+            self._history = [(float('-inf'), self.resistance, self.resistance, 0.0)]
+            self._times = [float('-inf')]
+
+    def target(self, voltage):
+        """
+        Returns:
+            float: Résistance stabilisée sous la tension donnée (Ω).
+        """
+        return self.resistance * (1 + self.coef_tension * abs(voltage))
+
+    def _resistance(self, t, index):
+        start_time, start, target, _ = self._history[index]
+        if self.constante_temps <= 0 or t <= start_time:
+            return target if t > start_time else start
+        return target + (start - target) * np.exp(-(t - start_time) / self.constante_temps)
+
+    def apply(self, voltage, at=None):
+        """
+        Applique une tension au DUT, à l'instant courant ou à un instant planifié.
+        Les changements planifiés après cet instant sont annulés.
+
+        Args:
+            voltage (float): Tension aux bornes du DUT (V).
+            at (float, optional): Instant du changement (horloge du banc, défaut: maintenant).
+        """
+        with self._lock:
+            if at is None:
+                at = self.clock()
+            index = bisect.bisect_right(self._times, at)
+            del self._history[index:], self._times[index:]
+            current = self._resistance(at, index - 1)
+            self._history.append((at, current, self.target(voltage), voltage))
+            self._times.append(at)
+            if len(self._times) > 20000:  # Historique limité aux changements récents
+                del self._history[:10000], self._times[:10000]
+
+    def resistance_at(self, t):
+        """
+        Args:
+            t (float): Instant (horloge du banc).
+
+        Returns:
+            float: Résistance vraie du DUT à cet instant (sans bruit).
+        """
+        with self._lock:
+            index = bisect.bisect_right(self._times, t) - 1
+            return self._resistance(t, max(index, 0))
+
+    def voltage_at(self, t):
+        """
+        Args:
+            t (float): Instant (horloge du banc).
+
+        Returns:
+            float: Tension appliquée au DUT à cet instant (V).
+        """
+        with self._lock:
+            return self._history[max(bisect.bisect_right(self._times, t) - 1, 0)][3]
+
+    def noisy(self, value):
+        """
+        Ajoute le bruit de mesure relatif à une valeur.
+        """
+        if self.bruit:
+            return value * (1 + random.gauss(0.0, self.bruit))
+        return value
+
+    def configure(self, section):
+        """
+        Lit les paramètres de la section [Simulation] de config.ini
+        (clés absentes : valeurs courantes conservées).
+
+        Args:
+            section (configparser.SectionProxy): Section [Simulation].
+        """
+        for name in ('resistance', 'coef_tension', 'constante_temps', 'bruit', 'latence', 'gigue',
+                     'integration', 'mesure_alimentation', 'taux_erreur', 'taux_corruption'):
+            if name in section:
+                setattr(self, name, float(section[name]))
+        self.reset()
+
+bench = Bench()  # Banc partagé par l'alimentation et le multimètre simulés
+
+def configure(section):
+    """
+    Configure le banc simulé depuis la section [Simulation] de config.ini.
+
+    Args:
+        section (configparser.SectionProxy): Section [Simulation].
+    """
+    bench.configure(section)
+
+class SimulatedResource:
+    """
+    Ressource VISA simulée : reçoit des messages SCPI (commandes séparées par
+    ';', requêtes composées comprises) et renvoie les réponses comme un
+    instrument réel, en ASCII ou en bloc binaire IEEE 488.2 selon FORM:DATA.
+
+    Chaque message écrit coûte bench.latence (plus une gigue aléatoire) ;
+    les mesures ajoutent leur durée à la lecture de la réponse. Des erreurs
+    VISA et des réponses illisibles peuvent être injectées.
+
+    Les sous-classes définissent handle(header, argument), qui renvoie la
+    réponse d'une requête (liste de valeurs) ou None pour une commande.
+    """
+
+    def __init__(self, address, bench=bench):
+        """
+        Args:
+            address (str): Adresse (conservée pour information).
+            bench (Bench): Banc simulé partagé.
+        """
+        self.address = address
+        self.bench = bench
+        self.timeout = 2000
+        self.big_endian = True
+        self._lock = threading.Lock()
+        self._responses = []
+        self._busy = 0.0  # Durée de mesure à attendre avant la réponse
+        self.errors = deque()
+        self.reset()
+
+    def reset(self):
+        """
+        État après *RST.
+        """
+        self.binary = False
+
+    def _transfer(self):
+        bench = self.bench
+        if bench.latence or bench.gigue:
+            time.sleep(bench.latence + random.uniform(0.0, bench.gigue))
+        if bench.taux_erreur and random.random() < bench.taux_erreur:
+            raise VisaIOError(constants.StatusCode.error_timeout)
+
+    def write(self, message):
+        """
+        Envoie un message (une ou plusieurs commandes séparées par ';').
+        """
+        with self._lock:
+            self._transfer()
+            for command in message.strip().split(';'):
+                command = command.strip().lstrip(':')
+                if not command:
+                    continue
+                header, _, argument = command.partition(' ')
+                try:
+                    response = self.handle(header.upper(), argument.strip())
+                except (ValueError, KeyError):
+                    self.errors.append('-224,"Illegal parameter value"')
+                    continue
+                if response is not None:
+                    self._responses.append(response)
+
+    def _format(self, values):
+        # FORM:DATA ne concerne que les mesures (états et erreurs toujours en ASCII)
+        if self.binary and all(isinstance(value, float) for value in values):
+            return bytes(to_ieee_block(values, 'f', self.big_endian))
+        return ','.join(f'{value:.7E}' if isinstance(value, float) else str(value) for value in values).encode()
+
+    def read_raw(self):
+        """
+        Lit la réponse aux requêtes du dernier message.
+
+        Returns:
+            bytes: Réponses séparées par ';', terminées par un saut de ligne.
+        """
+        with self._lock:
+            if self._busy:
+                time.sleep(self._busy)
+                self._busy = 0.0
+            if not self._responses:
+                raise VisaIOError(constants.StatusCode.error_timeout)
+            responses, self._responses = self._responses, []
+            if self.bench.taux_corruption and random.random() < self.bench.taux_corruption:
+                return b'\x00#?\n'
+            return b';'.join(self._format(values) for values in responses) + b'\n'
+
+    def read(self):
+        return self.read_raw().decode('ascii', errors='replace')
+
+    def query(self, message):
+        self.write(message)
+        return self.read()
+
+    def query_binary_values(self, message, datatype='f', is_big_endian=False, container=list):
+        self.write(message)
+        return from_ieee_block(self.read_raw(), datatype, is_big_endian, container)
+
+    def close(self):
+        pass
+
+    def handle_common(self, header, argument):
+        """
+        Commandes communes aux deux instruments.
+
+        Returns:
+            tuple: (reconnue, réponse)
+        """
+        if header == '*RST':
+            self.reset()
+        elif header == '*CLS':
+            self.errors.clear()
+        elif header == '*IDN?':
+            return True, [type(self).__name__]
+        elif header in ('SYST:ERR?', 'SYST:ERR:NEXT?'):
+            return True, [self.errors.popleft() if self.errors else '0,"No error"']
+        elif header in ('SYST:REM', 'SYST:LOC', 'SYST:RWL'):
+            pass
+        else:
+            return False, None
+        return True, None
+
+    def handle(self, header, argument):
+        raise NotImplementedError
+
+class SimulatedSupply(SimulatedResource):
+    """
+    Alimentation ITECH 6517D simulée : consigne, sortie, limites, mesure
+    de la tension et du courant dans le DUT du banc, et mode LIST (séquence
+    de pas déroulée sur *TRG, planifiée dans le banc).
+    """
+
+    def reset(self):
+        super().reset()
+        self.setpoint = 0.0
+        self.output = False
+        self.volt_max = float('inf')
+        self.curr_max = float('inf')
+        self.mode = 'FIX'
+        self.list_voltages = {}
+        self.list_widths = {}
+        self.list_steps = 0
+        self.list_count = 1
+        self.bench.apply(0.0)
+
+    def _trigger_list(self):
+        """
+        Planifie dans le banc tous les pas de la liste à partir de l'instant courant.
+        """
+        if self.mode != 'LIST' or not self.output:
+            return
+        t = self.bench.clock()
+        for _ in range(self.list_count):
+            for step in range(1, self.list_steps + 1):
+                self.bench.apply(min(self.list_voltages[step], self.volt_max), at=t)
+                t += self.list_widths[step]
+
+    def _apply(self):
+        self.bench.apply(min(self.setpoint, self.volt_max) if self.output else 0.0)
+
+    def handle(self, header, argument):
+        known, response = self.handle_common(header, argument)
+        if known:
+            return response
+        if header in ('VOLT', 'SOUR:VOLT', 'VOLT:LEV'):
+            self.setpoint = float(argument)
+            self._apply()
+        elif header in ('OUTP', 'OUTP:STAT'):
+            self.output = argument.upper() in ('ON', '1')
+            self._apply()
+        elif header == 'VOLT:MAX':
+            self.volt_max = float(argument)
+        elif header == 'CURR:MAX':
+            self.curr_max = float(argument)
+        elif header in ('VOLT:MIN', 'CURR:MIN', 'VOLT:PROT:STAT', 'CURR:PROT:STAT', 'CURR:PROT:LEV'):
+            float(argument)
+        elif header == 'FORM:DATA' or header == 'FORM':
+            self.binary = argument.upper().startswith('REAL')
+        elif header == 'LIST:STEP':
+            self.list_steps = int(float(argument))
+        elif header in ('LIST:VOLT', 'LIST:CURR', 'LIST:WIDT'):
+            step, value = argument.split(',')
+            if header == 'LIST:VOLT':
+                self.list_voltages[int(step)] = float(value)
+            elif header == 'LIST:WIDT':
+                self.list_widths[int(step)] = float(value)
+        elif header == 'LIST:COUN':
+            self.list_count = int(float(argument))
+        elif header == 'TRIG:SOUR':
+            pass
+        elif header == 'FUNC:MODE':
+            self.mode = argument.upper()[:4]
+            if self.mode == 'FIX':  # Arrêt de la liste : la tension courante est conservée
+                self.bench.apply(self.bench.voltage_at(self.bench.clock()))
+        elif header == '*TRG':
+            self._trigger_list()
+        elif header == 'MEAS:VOLT?':
+            self._busy += self.bench.mesure_alimentation
+            return [self.bench.noisy(self.bench.voltage_at(self.bench.clock()))]
+        elif header == 'MEAS:CURR?':
+            self._busy += self.bench.mesure_alimentation
+            now = self.bench.clock()
+            return [self.bench.noisy(min(self.bench.voltage_at(now) / self.bench.resistance_at(now), self.curr_max))]
+        else:
+            self.errors.append(f'-113,"Undefined header {header}"')
+        return None
+
+class SimulatedMeter(SimulatedResource):
+    """
+    Multimètre Keithley 2000 simulé : mesure de résistance (READ?) et
+    acquisition en rafale cadencée par le timer (TRAC). La durée d'une mesure
+    dépend des réglages de vitesse : NPLC, autozéro (double l'intégration),
+    filtre (lectures moyennées), changement automatique de gamme et afficheur.
+    """
+
+    AUTORANGE = 0.003  # Surcoût du changement automatique de gamme (s)
+    DISPLAY = 0.001  # Surcoût de la mise à jour de l'afficheur (s)
+
+    def reset(self):
+        super().reset()
+        self.big_endian = True
+        self.nplc = 1.0
+        self.autozero = True
+        self.autorange = True
+        self.filter_count = 10
+        self.filter = False
+        self.display = True
+        self.trigger_source = 'IMM'
+        self.trigger_count = 1
+        self.trigger_interval = 0.1
+        self.buffer_size = 0
+        self.feeding = False
+        self._armed_at = None
+        self._event = 0
+
+    def _integration(self):
+        duration = self.bench.integration * self.nplc * (2 if self.autozero else 1)
+        if self.filter:
+            duration *= self.filter_count
+        return duration + (self.AUTORANGE if self.autorange else 0.0) + (self.DISPLAY if self.display else 0.0)
+
+    def _burst_times(self):
+        """
+        Instants des mesures de la rafale en cours déjà effectuées.
+        """
+        if self._armed_at is None:
+            return np.empty(0)
+        count = min(self.trigger_count, self.buffer_size)
+        interval = max(self.trigger_interval, self._integration())  # Timer plus rapide que la mesure : cadence de la mesure
+        times = self._armed_at + interval * np.arange(count) + self._integration()
+        return times[times <= self.bench.clock()]
+
+    def handle(self, header, argument):
+        known, response = self.handle_common(header, argument)
+        if known:
+            if header == '*CLS':
+                self._event = 0
+            return response
+        if header == 'READ?':
+            self._busy += self._integration()
+            return [self.bench.noisy(self.bench.resistance_at(self.bench.clock() + self._integration()))]
+        elif header in ('CONF:RES', 'FORM:ELEM', 'TRAC:FEED', 'INIT:CONT', 'ABOR', 'RES:AVER:TCON'):
+            if header == 'ABOR':
+                self._armed_at = None
+        elif header == 'RES:RANG:AUTO':
+            self.autorange = argument.upper() in ('ON', '1')  # ONCE : gamme choisie puis conservée
+        elif header == 'RES:RANG':
+            float(argument)
+            self.autorange = False
+        elif header in ('SYST:AZER:STAT', 'SYST:AZER'):
+            self.autozero = argument.upper() in ('ON', '1')
+        elif header == 'RES:AVER:STAT':
+            self.filter = argument.upper() in ('ON', '1')
+        elif header == 'RES:AVER:COUN':
+            self.filter_count = int(float(argument))
+        elif header in ('DISP:ENAB', 'DISP:ENABLE'):
+            self.display = argument.upper() in ('ON', '1')
+        elif header in ('RES:NPLC', 'SENS:RES:NPLC'):
+            self.nplc = float(argument)
+        elif header == 'FORM:DATA' or header == 'FORM':
+            self.binary = argument.upper().startswith('SRE') or argument.upper().startswith('REAL')
+        elif header == 'FORM:BORD':
+            self.big_endian = argument.upper().startswith('NORM')
+        elif header == 'TRIG:SOUR':
+            self.trigger_source = argument.upper()[:3]
+        elif header in ('TRIG:COUN', 'TRIG:COUNT'):
+            self.trigger_count = int(float(argument))
+        elif header == 'TRIG:TIM':
+            self.trigger_interval = float(argument)
+        elif header == 'SAMP:COUN':
+            int(float(argument))
+        elif header == 'TRAC:POIN':
+            self.buffer_size = int(float(argument))
+        elif header == 'TRAC:FEED:CONT':
+            self.feeding = argument.upper().startswith('NEXT')
+        elif header == 'TRAC:CLE':
+            self._armed_at = None
+        elif header == 'INIT':
+            if self.feeding and self.trigger_source == 'TIM':
+                self._armed_at = self.bench.clock()
+        elif header == 'STAT:MEAS:EVEN?':
+            count = min(self.trigger_count, self.buffer_size)
+            if self._armed_at is not None and len(self._burst_times()) >= count:
+                self._event |= 512  # Buffer plein
+            event, self._event = self._event, 0
+            return [event]
+        elif header == 'TRAC:DATA?':
+            return [self.bench.noisy(self.bench.resistance_at(t)) for t in self._burst_times()]
+        else:
+            self.errors.append(f'-113,"Undefined header {header}"')
+        return None
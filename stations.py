@@ -0,0 +1,203 @@
+# stations.py
+
+import configparser
+import multiprocessing
+import queue
+import re
+import sys
+import threading
+from canal import ConsoleChannel
+from moteur import SquareWaveEngine, RampEngine
+
+STATION_SECTION = re.compile(r'^Station:(.+)$')
+ENGINES = {engine.name: engine for engine in (SquareWaveEngine, RampEngine)}
+
+def station_names(config):
+    """
+    Args:
+        config (configparser.ConfigParser): Configuration chargée.
+
+    Returns:
+        list: Noms des postes ([Station:1] → '1'), dans l'ordre du fichier.
+    """
+    return [match.group(1) for match in map(STATION_SECTION.match, config.sections()) if match]
+
+def station_config(config, name):
+    """
+    Construit la configuration complète d'un poste de mesure.
+
+    Les sections communes de config.ini sont recopiées, puis les clés
+    'section.clé' de [Station:nom] remplacent les valeurs correspondantes
+    (ex: 'alimentation.address', 'meter.gpib_address', 'general.dossier_flux').
+
+    Args:
+        config (configparser.ConfigParser): Configuration chargée.
+        name (str): Nom du poste.
+
+    Returns:
+        configparser.ConfigParser: Configuration du poste (sans sections [Station:*]).
+
+    Raises:
+        ValueError: Clé de poste sans section ou vers une section inconnue.
+    """
+    derived = configparser.ConfigParser()
+    derived.read_dict({section: dict(config[section]) for section in config.sections()
+                       if not STATION_SECTION.match(section)})
+    sections = {section.lower(): section for section in derived.sections()}
+    for key, value in config[f'Station:{name}'].items():
+        if key == 'execution':
+            continue
+        target, _, option = key.partition('.')
+        if not option or target.lower() not in sections:
+            raise ValueError(f"Clé invalide dans [Station:{name}] : {key} (format attendu : section.clé)")
+        derived.set(sections[target.lower()], option, value)
+    return derived
+
+def _station_main(name, config, protocol, parameters, options, confirm, stop_event, results):
+    """
+    Exécute la mesure d'un poste (corps du thread ou du processus du poste).
+
+    Les instruments sont ouverts ici, dans le thread ou le processus qui les
+    utilise. La mesure est interrompue quand stop_event est levé (ou par
+    Ctrl+C dans un processus) ; le résultat est déposé dans results.
+
+    Args:
+        name (str): Nom du poste.
+        config (dict): Configuration du poste (sections → clés).
+        protocol (str): 'carre' ou 'rampe'.
+        parameters (tuple): Paramètres du protocole.
+        options (dict): Options du protocole.
+        confirm (bool): Attend la touche Entrée aux demandes à l'utilisateur.
+        stop_event: Événement (threading ou multiprocessing) d'interruption.
+        results: File recevant (nom, mesure terminée, fichier de données).
+    """
+    parser = configparser.ConfigParser()
+    parser.read_dict(config)
+    try:
+        engine = ENGINES[protocol].from_config(parser, ConsoleChannel(confirm=confirm, prefix=name))
+    except Exception as e:
+        print(f"[{name}] Ouverture des instruments impossible : {e}", file=sys.stderr)
+        results.put((name, False, None))
+        return
+
+    # Fichier de données du poste : nom du poste en préfixe
+    output = engine.stream_path(engine.dossier_flux or '.', prefix=f"{name}_")
+    result = []
+    try:
+        engine.initialize()
+        worker = threading.Thread(target=lambda: result.append(engine.run(*parameters, output=output, **options)),
+                                  name=f'mesure-{name}')
+        worker.start()
+        while worker.is_alive():
+            try:
+                if stop_event.wait(0.2):
+                    engine.stop()
+                    worker.join()
+            except KeyboardInterrupt:
+                engine.stop()
+    finally:
+        engine.close()
+        results.put((name, bool(result and result[0]), engine.export_path or output))
+
+class Station:
+    """
+    Poste de mesure (couple alimentation/multimètre) exécuté dans son propre
+    thread ou processus, avec ses instruments, son stockage et ses fichiers.
+
+    Les postes d'un même bus GPIB peuvent partager un processus (threads : les
+    accès se succèdent sur le bus) ; les postes sur des bus distincts peuvent
+    être placés dans des processus séparés pour ne pas partager l'interpréteur.
+
+    Attributes:
+        name (str): Nom du poste.
+        config (configparser.ConfigParser): Configuration du poste.
+        protocol (str): 'carre' ou 'rampe'.
+        parameters (tuple): Paramètres du protocole.
+        options (dict): Options du protocole.
+        execution (str): 'thread' ou 'processus'.
+        confirm (bool): Attend la touche Entrée aux demandes à l'utilisateur.
+    """
+
+    def __init__(self, name, config, protocol, parameters, options, execution='thread', confirm=True):
+        if execution not in ('thread', 'processus'):
+            raise ValueError(f"Exécution du poste {name} inconnue : {execution} (thread ou processus)")
+        self.name = name
+        self.config = config
+        self.protocol = protocol
+        self.parameters = parameters
+        self.options = options
+        self.execution = execution
+        self.confirm = confirm
+        self._worker = None
+        self._stop_event = None
+
+    def start(self, context, results):
+        """
+        Lance le poste.
+
+        Args:
+            context: Contexte multiprocessing (processus et événements).
+            results: File partagée des résultats.
+        """
+        config = {section: dict(self.config[section]) for section in self.config.sections()}
+        if self.execution == 'processus':
+            self._stop_event = context.Event()
+            worker_class = context.Process
+        else:
+            self._stop_event = threading.Event()
+            worker_class = threading.Thread
+        self._worker = worker_class(target=_station_main, name=f'poste-{self.name}',
+                                    args=(self.name, config, self.protocol, self.parameters, self.options,
+                                          self.confirm, self._stop_event, results))
+        self._worker.start()
+
+    def stop(self):
+        """
+        Demande l'interruption de la mesure du poste.
+        """
+        if self._stop_event is not None:
+            self._stop_event.set()
+
+    def join(self, timeout=None):
+        self._worker.join(timeout)
+
+    def is_alive(self):
+        return self._worker is not None and self._worker.is_alive()
+
+def run_stations(stations):
+    """
+    Exécute plusieurs postes en parallèle et attend leur fin ; Ctrl+C les
+    interrompt tous (alimentations sécurisées par chaque poste).
+
+    Args:
+        stations (list): Postes (Station) à exécuter.
+
+    Returns:
+        dict: Par nom de poste, (mesure terminée, fichier de données).
+    """
+    context = multiprocessing.get_context('spawn')  # Même comportement sous Windows et Linux
+    results = context.Queue()
+    for station in stations:
+        station.start(context, results)
+    try:
+        while any(station.is_alive() for station in stations):
+            try:
+                for station in stations:
+                    station.join(0.2)
+            except KeyboardInterrupt:
+                print("Interruption demandée", file=sys.stderr)
+                for station in stations:
+                    station.stop()
+    finally:
+        for station in stations:
+            station.stop()
+            station.join()
+
+    outcomes = {station.name: (False, None) for station in stations}  # Poste arrêté sans résultat : échec
+    for _ in stations:
+        try:
+            name, completed, output = results.get(timeout=1.0)
+        except queue.Empty:
+            break
+        outcomes[name] = (completed, output)
+    return outcomes
@@ -0,0 +1,260 @@
+# statistiques.py
+
+import math
+import numpy as np
+
+class RunningStatistics:
+    """
+    Statistiques d'une série mises à jour à chaque échantillon, en mémoire
+    constante (algorithme de Welford : moyenne et somme des carrés des écarts,
+    sans perte de précision sur de longues séries).
+
+    Attributes:
+        count (int): Nombre d'échantillons.
+        mean (float): Moyenne.
+        minimum (float): Plus petite valeur.
+        maximum (float): Plus grande valeur.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """
+        Oublie les échantillons déjà reçus.
+        """
+        self.count = 0
+        self.mean = 0.0
+        self._m2 = 0.0  # Somme des carrés des écarts à la moyenne
+        self.minimum = math.inf
+        self.maximum = -math.inf
+
+    def add(self, value):
+        """
+        Args:
+            value (float): Nouvel échantillon.
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+        if value < self.minimum:
+            self.minimum = value
+        if value > self.maximum:
+            self.maximum = value
+
+    def extend(self, values):
+        """
+        Ajoute un bloc d'échantillons (ex: rafale lue en un seul transfert) :
+        les statistiques du bloc sont calculées par NumPy puis fusionnées
+        (formule de Chan et al.).
+
+        Args:
+            values (numpy.ndarray): Échantillons.
+        """
+        count = len(values)
+        if not count:
+            return
+        mean = float(np.mean(values))
+        m2 = float(np.sum(np.square(values - mean)))
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self._m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        self.minimum = min(self.minimum, float(np.min(values)))
+        self.maximum = max(self.maximum, float(np.max(values)))
+
+    @property
+    def variance(self):
+        """
+        Returns:
+            float: Variance de l'échantillon (nan avec moins de deux échantillons).
+        """
+        return self._m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self):
+        """
+        Returns:
+            float: Écart-type de l'échantillon.
+        """
+        return math.sqrt(self.variance)
+
+class PlateauStatistics:
+    """
+    Statistiques de la résistance sur un palier du signal carré.
+
+    La durée de stabilisation est estimée au fil de l'eau : une seconde série
+    (la « fin stable ») repart de l'échantillon courant dès que l'étendue
+    (max - min) de ses valeurs dépasserait 2 × tolerance × |moyenne|. La
+    stabilisation est l'instant de début de la dernière fin stable, compté
+    depuis le début du palier ; la moyenne de cette fin stable exclut donc le
+    transitoire.
+
+    Attributes:
+        cycle (int): Numéro du cycle (à partir de 1).
+        plateau (int): 1 pour le palier V1, 2 pour le palier V2.
+        setpoint (float): Tension de consigne.
+        start (float): Début du palier (s, origine des temps de la mesure).
+        tolerance (float): Tolérance relative de la stabilisation.
+        resistance (RunningStatistics): Tout le palier.
+        settled (RunningStatistics): Fin stable du palier.
+        settling_time (float): Durée de stabilisation estimée (s).
+    """
+
+    def __init__(self, cycle, plateau, setpoint, start, tolerance):
+        """
+        Args:
+            cycle (int): Numéro du cycle.
+            plateau (int): 1 (V1) ou 2 (V2).
+            setpoint (float): Tension de consigne.
+            start (float): Début du palier (s).
+            tolerance (float): Tolérance relative de la stabilisation (ex: 0.01).
+        """
+        self.cycle = cycle
+        self.plateau = plateau
+        self.setpoint = setpoint
+        self.start = start
+        self.tolerance = tolerance
+        self.resistance = RunningStatistics()
+        self.settled = RunningStatistics()
+        self.settling_time = 0.0
+
+    def add(self, time, resistance):
+        """
+        Args:
+            time (float): Instant de la mesure (s).
+            resistance (float): Résistance mesurée (Ω).
+        """
+        self.resistance.add(resistance)
+        self._settle(time, resistance)
+
+    def _settle(self, time, resistance):
+        """
+        Met à jour la fin stable du palier et la durée de stabilisation.
+        """
+        settled = self.settled
+        if settled.count and (max(settled.maximum, resistance) - min(settled.minimum, resistance)
+                              > 2 * self.tolerance * abs(settled.mean)):
+            settled.reset()  # Hors de la bande : la fin stable repart de cet échantillon
+        if not settled.count:
+            self.settling_time = max(time - self.start, 0.0)
+        settled.add(resistance)
+
+    def extend(self, times, resistances):
+        """
+        Ajoute un bloc de mesures du palier (acquisition en rafale).
+
+        Args:
+            times (numpy.ndarray): Instants des mesures (s).
+            resistances (numpy.ndarray): Résistances mesurées (Ω).
+        """
+        self.resistance.extend(resistances)
+        # Fin stable : parcours séquentiel (une rafale par palier, bornée par le buffer du multimètre)
+        for time, value in zip(times.tolist(), resistances.tolist()):
+            self._settle(time, value)
+
+    def row(self):
+        """
+        Returns:
+            tuple: Ligne du tableau des cycles (voir SquareWaveEngine.cycle_columns).
+        """
+        resistance = self.resistance
+        return (self.cycle, self.plateau, self.setpoint, self.start, resistance.count, resistance.mean,
+                resistance.std, resistance.minimum, resistance.maximum, self.settling_time, self.settled.mean)
+
+class PlateauTracker:
+    """
+    Suivi des paliers d'un signal carré au fil des échantillons.
+
+    Chaque échantillon porte l'indice de son palier sur la grille des
+    changements de consigne (0: premier palier V1, 1: premier palier V2...),
+    si bien que les paliers restent distincts même avec v1 = v2. Le passage à
+    un nouvel indice termine le palier courant : sa ligne de statistiques est
+    ajoutée au tableau des cycles (annexe 'cycles' du moteur) et transmise à
+    l'interface. La mémoire utilisée ne dépend pas de la durée des paliers.
+
+    Attributes:
+        store (SampleStore): Tableau des cycles (une ligne par palier terminé).
+        tolerance (float): Tolérance relative de la stabilisation.
+        current (PlateauStatistics): Palier en cours (None avant le premier échantillon).
+    """
+
+    def __init__(self, store, tolerance=0.01):
+        """
+        Args:
+            store (SampleStore): Tableau des cycles.
+            tolerance (float): Tolérance relative de la stabilisation.
+        """
+        self.store = store
+        self.tolerance = tolerance
+        self.start(None)
+
+    def start(self, plateau_start, channel=None):
+        """
+        Prépare le suivi d'une nouvelle mesure.
+
+        Args:
+            plateau_start (callable): Début planifié du palier d'indice k (s) ;
+                None : instant du premier échantillon, sans limite de fin.
+            channel (GuiChannel ou ConsoleChannel, optional): Destination des paliers terminés ('palier').
+        """
+        self.plateau_start = plateau_start
+        self.channel = channel
+        self.current = None
+        self._index = None  # Indice du palier courant
+
+    def _select(self, index, time, setpoint):
+        """
+        Termine le palier courant si l'échantillon appartient à un autre palier.
+        """
+        if self.current is not None and index == self._index:
+            return
+        self.finish()
+        self._index = index
+        cycle, plateau = divmod(index, 2)
+        start = self.plateau_start(index) if self.plateau_start else time
+        self.current = PlateauStatistics(cycle + 1, plateau + 1, setpoint, start, self.tolerance)
+
+    def add(self, time, index, setpoint, resistance):
+        """
+        Args:
+            time (float): Instant de la mesure (s).
+            index (int): Indice du palier sur la grille des changements de consigne.
+            setpoint (float): Tension de consigne.
+            resistance (float): Résistance mesurée (Ω).
+        """
+        self._select(index, time, setpoint)
+        self.current.add(time, resistance)
+
+    def extend(self, times, index, setpoint, resistances):
+        """
+        Ajoute un palier mesuré en un bloc (acquisition en rafale). Les
+        mesures datées hors de la fenêtre planifiée du palier sont ignorées.
+
+        Args:
+            times (numpy.ndarray): Instants des mesures (s).
+            index (int): Indice du palier sur la grille des changements de consigne.
+            setpoint (float): Tension de consigne.
+            resistances (numpy.ndarray): Résistances mesurées (Ω).
+        """
+        if self.plateau_start:
+            inside = (times >= self.plateau_start(index)) & (times <= self.plateau_start(index + 1))
+            times, resistances = times[inside], resistances[inside]
+        if not len(times):
+            return
+        self._select(index, times[0], setpoint)
+        self.current.extend(times, resistances)
+
+    def finish(self):
+        """
+        Enregistre le palier en cours (fin de palier ou de mesure).
+        """
+        if self.current is None or not self.current.resistance.count:
+            return
+        row = self.current.row()
+        self.store.append(*row)
+        if self.channel is not None:
+            self.channel.post('palier', *row)
+        self.current = None
@@ -0,0 +1,235 @@
+# stockage.py
+
+import json
+import os
+import threading
+import numpy as np
+
+RUN_INDEX = 'mesure.json'  # Index d'un dossier de mesure (tableaux projetés en mémoire)
+
+class SampleStore:
+    """
+    Stockage des échantillons de mesure dans un tableau NumPy structuré.
+
+    Le tableau est préalloué et agrandi par blocs (croissance géométrique),
+    ce qui rend l'ajout d'un échantillon O(1) amorti, contrairement à
+    np.append qui recopie tous les tableaux à chaque point.
+
+    Attributes:
+        fields (tuple): Noms des colonnes, dans l'ordre d'exportation.
+        dtype (numpy.dtype): Type structuré (une colonne float64 par champ).
+        chunk_size (int): Taille minimale d'un bloc d'allocation.
+    """
+
+    def __init__(self, fields, chunk_size=4096):
+        """
+        Initialise un stockage vide.
+
+        Args:
+            fields (iterable): Noms des colonnes (ex: ('temps', 'tension')).
+            chunk_size (int): Nombre d'échantillons alloués par bloc.
+        """
+        self.fields = tuple(fields)
+        self.dtype = np.dtype([(name, np.float64) for name in self.fields])
+        self.chunk_size = int(chunk_size)
+        self._lock = threading.Lock()
+        self._buffer = np.empty(self.chunk_size, dtype=self.dtype)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, name):
+        """
+        Renvoie une vue (sans copie) sur une colonne remplie.
+
+        Args:
+            name (str): Nom de la colonne.
+
+        Returns:
+            numpy.ndarray: Vue sur les échantillons enregistrés de la colonne.
+        """
+        with self._lock:
+            return self._buffer[name][:self._size]
+
+    def _reserve(self, count):
+        """
+        Garantit la place pour `count` échantillons supplémentaires.
+        Doit être appelée avec le verrou acquis.
+        """
+        needed = self._size + count
+        capacity = len(self._buffer)
+        if needed <= capacity:
+            return
+        # Doublement de la capacité, arrondi au bloc supérieur
+        new_capacity = max(2 * capacity, needed)
+        new_capacity = -(-new_capacity // self.chunk_size) * self.chunk_size
+        new_buffer = np.empty(new_capacity, dtype=self.dtype)
+        new_buffer[:self._size] = self._buffer[:self._size]
+        self._buffer = new_buffer
+
+    def append(self, *values):
+        """
+        Ajoute un échantillon.
+
+        Args:
+            *values (float): Une valeur par colonne, dans l'ordre de `fields`.
+        """
+        with self._lock:
+            self._reserve(1)
+            self._buffer[self._size] = values
+            self._size += 1
+
+    def extend(self, block):
+        """
+        Ajoute un bloc d'échantillons en une seule copie.
+
+        Args:
+            block (numpy.ndarray): Tableau structuré de même dtype, ou tableau
+                2D de forme (n, len(fields)).
+        """
+        block = np.asarray(block)
+        if block.dtype != self.dtype:
+            block = np.ascontiguousarray(block, dtype=np.float64).reshape(-1, len(self.fields))
+            block = block.view(self.dtype).reshape(-1)
+        with self._lock:
+            self._reserve(len(block))
+            self._buffer[self._size:self._size + len(block)] = block
+            self._size += len(block)
+
+    def clear(self):
+        """
+        Vide le stockage en conservant la mémoire déjà allouée.
+        """
+        with self._lock:
+            self._size = 0
+
+    def records(self):
+        """
+        Renvoie une vue (sans copie) sur les échantillons structurés.
+
+        Returns:
+            numpy.ndarray: Tableau structuré des échantillons enregistrés.
+        """
+        with self._lock:
+            return self._buffer[:self._size]
+
+    def table(self):
+        """
+        Renvoie une vue 2D (sans copie) des échantillons, une colonne par champ.
+        Utilisée pour l'exportation (np.savetxt).
+
+        Returns:
+            numpy.ndarray: Tableau float64 de forme (n, len(fields)).
+        """
+        with self._lock:
+            return self._buffer[:self._size].view(np.float64).reshape(self._size, len(self.fields))
+
+class MappedSampleStore(SampleStore):
+    """
+    Variante de SampleStore dont les échantillons sont conservés dans un
+    fichier projeté en mémoire (np.memmap), pour les mesures de durée non
+    bornée (ex: signal carré avec N = 0).
+
+    Le fichier contient les enregistrements structurés bruts (float64, une
+    ligne par échantillon) ; il est agrandi par segments de
+    taille fixe et projeté de nouveau, sans recopie des données déjà
+    enregistrées. Les vues renvoyées (colonnes, records(), table()) pointent
+    directement dans la projection : la mémoire résidente reste bornée par le
+    système (pages du fichier), quelle que soit la durée de la mesure.
+
+    Tant que open() n'a pas été appelée, le stockage se comporte comme un
+    SampleStore en mémoire.
+
+    Attributes:
+        path (str): Fichier des échantillons (None avant open()).
+    """
+
+    def __init__(self, fields, segment_size=1 << 16):
+        """
+        Args:
+            fields (iterable): Noms des colonnes.
+            segment_size (int): Nombre d'échantillons ajoutés au fichier à chaque agrandissement.
+        """
+        super().__init__(fields, chunk_size=segment_size)
+        self.path = None
+
+    def open(self, path):
+        """
+        Associe le stockage à un nouveau fichier vide (premier segment alloué).
+        Les vues obtenues auparavant restent valides (ancienne projection).
+
+        Args:
+            path (str): Fichier des échantillons (dossiers créés si nécessaire).
+        """
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._lock:
+            self.path = path
+            self._size = 0
+            self._buffer = np.memmap(path, dtype=self.dtype, mode='w+', shape=(self.chunk_size,))
+
+    def _reserve(self, count):
+        if self.path is None:
+            super()._reserve(count)
+            return
+        needed = self._size + count
+        if needed <= len(self._buffer):
+            return
+        # Agrandissement du fichier au segment supérieur, puis nouvelle projection
+        capacity = -(-needed // self.chunk_size) * self.chunk_size
+        self._buffer.flush()
+        self._buffer = np.memmap(self.path, dtype=self.dtype, mode='r+', shape=(capacity,))
+
+    def flush(self):
+        """
+        Force l'écriture sur disque des échantillons enregistrés.
+        """
+        with self._lock:
+            if isinstance(self._buffer, np.memmap):
+                self._buffer.flush()
+
+def write_run_index(directory, tables, metadata):
+    """
+    Écrit l'index d'un dossier de mesure (mesure.json) : fichier, champs,
+    en-têtes et nombre d'échantillons de chaque tableau projeté, et
+    métadonnées de la mesure. Les fichiers .dat peuvent être plus longs que
+    le nombre d'échantillons (segment en cours).
+
+    Args:
+        directory (str): Dossier de la mesure.
+        tables (dict): Par nom de tableau : (MappedSampleStore, en-têtes des colonnes).
+        metadata (dict): Métadonnées sérialisables en JSON.
+    """
+    index = {
+        'metadonnees': metadata,
+        'tables': {name: {'fichier': os.path.basename(store.path), 'type': store.dtype[0].str,
+                          'champs': list(store.fields), 'colonnes': list(columns), 'nombre': len(store)}
+                   for name, (store, columns) in tables.items()},
+    }
+    with open(os.path.join(directory, RUN_INDEX), 'w', encoding='utf-8') as file:
+        json.dump(index, file, ensure_ascii=False, indent=1)
+
+def open_run(directory):
+    """
+    Ouvre en lecture seule les tableaux d'un dossier de mesure, sans copie
+    (ex: outils externes, relecture d'une mesure).
+
+    Args:
+        directory (str): Dossier de la mesure (contenant mesure.json).
+
+    Returns:
+        tuple: (tableaux structurés numpy.memmap par nom, métadonnées)
+    """
+    with open(os.path.join(directory, RUN_INDEX), encoding='utf-8') as file:
+        index = json.load(file)
+    tables = {}
+    for name, table in index['tables'].items():
+        dtype = np.dtype([(field, table['type']) for field in table['champs']])
+        if table['nombre']:
+            tables[name] = np.memmap(os.path.join(directory, table['fichier']), dtype=dtype, mode='r',
+                                     shape=(table['nombre'],))
+        else:
+            tables[name] = np.empty(0, dtype=dtype)
+    return tables, index['metadonnees']
@@ -0,0 +1,158 @@
+# visualisation.py
+
+import os
+import tkinter as tk
+from tkinter import ttk
+from tkinter import messagebox
+import numpy as np
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+from decimation import MinMaxDecimator
+from ecriture import ExportJob
+from graphique import LivePlot
+from lecture import SavedRun
+
+def plot_layout(fields):
+    """
+    Choisit les courbes d'une mesure relue, comme les interfaces de mesure :
+    résistance et tension en fonction du temps (signal carré), résistance en
+    fonction de la tension (rampe), sinon toutes les colonnes en fonction de
+    la première.
+
+    Args:
+        fields (tuple): Noms des colonnes.
+
+    Returns:
+        tuple: (champ des abscisses, liste de (champ, indice de l'axe, options de tracé))
+    """
+    if 'temps' in fields and 'resistance' in fields:
+        series = [('resistance', 0, dict(color='blue', label='Résistance (Ω)'))]
+        if 'tension' in fields:
+            series.append(('tension', 1, dict(color='red', label='Tension (V)')))
+        return 'temps', series
+    if 'tension' in fields and 'resistance' in fields:
+        return 'tension', [('resistance', 0, dict(color='blue', label='Résistance (Ω)'))]
+    return fields[0], [(field, 0, dict(label=field)) for field in fields[1:]]
+
+class RunViewer:
+    """
+    Fenêtre de visualisation d'une mesure enregistrée.
+
+    Le fichier est lu dans un thread d'arrière-plan (fichier texte par blocs)
+    et tracé au fur et à mesure par le même chemin que les mesures en cours
+    (LivePlot, réduction min/max). Une fois la lecture terminée, un zoom ou un
+    déplacement (barre d'outils Matplotlib) réduit de nouveau la seule partie
+    visible quand les abscisses sont croissantes (ex: temps), pour conserver
+    le détail sans tracer tous les points.
+
+    Attributes:
+        master (tk.Tk ou tk.Toplevel): Fenêtre.
+        run (SavedRun): Mesure relue.
+        job (ExportJob): Lecture en cours.
+        live_plot (LivePlot): Courbes réduites.
+    """
+
+    def __init__(self, master, run, period=50):
+        """
+        Args:
+            master (tk.Tk ou tk.Toplevel): Fenêtre (détruite à la fermeture).
+            run (SavedRun): Mesure à afficher.
+            period (int): Période de mise à jour pendant la lecture (ms).
+        """
+        self.master = master
+        self.run = run
+        self.period = period
+        self._zoom = False  # Réduction de la partie visible (après lecture, abscisses croissantes)
+        master.title(f"Mesure enregistrée : {os.path.basename(os.path.normpath(run.path))}")
+
+        # Graphique : mêmes courbes et axes que l'interface de mesure correspondante
+        self.x_field, series = plot_layout(run.fields)
+        labels = dict(zip(run.fields, run.columns))
+        self.figure = Figure(figsize=(10, 6))
+        axis = self.figure.add_subplot()
+        axes = [axis]
+        if any(index == 1 for _, index, _ in series):
+            axes.append(axis.twinx())
+        axis.set_xlabel(labels[self.x_field])
+        for field, index, options in series:
+            axes[index].set_ylabel(labels[field], color=options.get('color'))
+        self.canvas = FigureCanvasTkAgg(self.figure, master=master)
+        # Rafraîchissement espacé pendant la lecture : les axes s'agrandissent à chaque bloc (dessin complet)
+        self.live_plot = LivePlot(self.canvas, [(axes[index], options) for _, index, options in series], max_fps=2.0)
+        self.y_fields = [field for field, _, _ in series]
+        axis.legend(self.live_plot.lines, [line.get_label() for line in self.live_plot.lines], loc='upper left')
+        axis.callbacks.connect('xlim_changed', self._on_xlim)
+
+        # Barre d'outils (zoom, déplacement), état de la lecture
+        toolbar = NavigationToolbar2Tk(self.canvas, master, pack_toolbar=False)
+        self.status = ttk.Label(master, text="Lecture...", anchor='w')
+        self.status.pack(side='bottom', fill='x', padx=5, pady=2)
+        toolbar.pack(side='bottom', fill='x')
+        self.canvas.get_tk_widget().pack(side='top', fill='both', expand=True)
+        self.canvas.draw()
+
+        self.job = ExportJob(run.load, run.size).start()
+        master.protocol("WM_DELETE_WINDOW", self.close)
+        self._after = master.after(period, self._follow)
+
+    def _follow(self):
+        """
+        Trace les données déjà lues (appelée périodiquement par la boucle Tk
+        pendant la lecture).
+        """
+        finished = not self.job.is_alive()
+        self.live_plot.update(self.run[self.x_field], *[self.run[field] for field in self.y_fields], force=finished)
+        if not finished:
+            self.status.config(text=f"Lecture... {100 * self.job.fraction:.0f} % ({len(self.run)} points)")
+            self._after = self.master.after(self.period, self._follow)
+            return
+
+        if self.job.error is not None:
+            self.status.config(text=f"Lecture interrompue : {self.job.error}")
+            messagebox.showerror("Erreur", f"Erreur lors de la lecture de la mesure: {self.job.error}", parent=self.master)
+            return
+        x = self.run[self.x_field]
+        self._zoom = len(x) > 1 and bool(np.all(x[1:] >= x[:-1]))
+        self.status.config(text=f"{len(x)} points")
+
+    def _on_xlim(self, axis):
+        """
+        Réduit la partie visible des courbes après un zoom ou un déplacement.
+        """
+        if not self._zoom:
+            return
+        x = self.run[self.x_field]
+        n = len(x)
+        lo, hi = axis.get_xlim()
+        start = max(int(np.searchsorted(x, lo, side='left')) - 1, 0)
+        stop = min(int(np.searchsorted(x, hi, side='right')) + 1, n)
+        for line, decimator, field in zip(self.live_plot.lines, self.live_plot.decimators, self.y_fields):
+            y = self.run[field]
+            if stop - start > n // 2:
+                index = decimator.indices(y)  # Vue large : réduction de toute la mesure, déjà calculée
+            else:
+                index = start + MinMaxDecimator(decimator.bins).update(y[start:stop])
+            line.set_data(x[index], y[index])
+
+    def close(self):
+        """
+        Annule la lecture en cours et ferme la fenêtre.
+        """
+        self.job.cancel()
+        self.master.after_cancel(self._after)
+        self.master.destroy()
+
+def show(path, column_separator=';', decimal_separator='.'):
+    """
+    Ouvre une mesure enregistrée dans une fenêtre et attend sa fermeture
+    (mode visualisation de mesure.py).
+
+    Args:
+        path (str): Fichier (.txt, .csv, .npz, .h5) ou dossier de mesure.
+        column_separator (str): Séparateur de colonnes d'un fichier texte.
+        decimal_separator (str): Séparateur décimal d'un fichier texte.
+    """
+    run = SavedRun(path, column_separator, decimal_separator)
+    root = tk.Tk()
+    RunViewer(root, run)
+    root.mainloop()